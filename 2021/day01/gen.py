@@ -0,0 +1,30 @@
+"""Synthetic inputs for Day 1: Sonar Sweep"""
+
+import io
+
+import numpy as np
+
+DEPTHS = 2000  # size of input.txt
+BLOCK = 1 << 20  # depths generated and written at a time
+
+
+def write(file, scale, seed=0):
+    """Write DEPTHS * scale depths to a binary file, a block at a time"""
+    rng = np.random.default_rng(seed)
+    depth = 200
+    left = DEPTHS * scale
+    while left:
+        n = min(left, BLOCK)
+        # depth = max(depth + step, 0) for a whole block: the running sum,
+        # raised by the lowest it has dipped below zero so far
+        sums = depth + np.cumsum(rng.integers(-10, 21, n))
+        depths = sums - np.minimum(np.minimum.accumulate(sums), 0)
+        file.write(("\n".join(map(str, depths.tolist())) + "\n").encode())
+        depth = int(depths[-1])
+        left -= n
+
+
+def generate(scale, seed=0):
+    out = io.BytesIO()
+    write(out, scale, seed=seed)
+    return out.getvalue().decode()
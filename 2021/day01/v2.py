@@ -0,0 +1,42 @@
+"""Day 1: Sonar Sweep
+
+NumPy version: the depths are parsed into one array and every comparison is
+done at once. Two three-depth windows in a row share two depths, so the
+second sum is larger exactly when the depth entering it is deeper than the one
+leaving: part 2 compares depths three apart, without summing any windows.
+"""
+
+import argparse
+
+import numpy as np
+
+from aoc import parse
+
+
+def increases(depths, lag=1):
+    """Number of depths deeper than the one `lag` before them"""
+    return int(np.count_nonzero(depths[lag:] > depths[:-lag]))
+
+
+def part1(depths):
+    return increases(depths, 1)
+
+
+def part2(depths):
+    return increases(depths, 3)
+
+
+def main():
+    # noinspection DuplicatedCode
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    depths = parse.ints(parse.read(args.f))
+
+    print("part 1:", part1(depths))
+    print("part 2:", part2(depths))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Day 1: Sonar Sweep
+
+Streaming version: the depths are read from the file (or stdin, with -f -) a
+block at a time and both parts are counted in one pass, carrying only the last
+three depths from one block to the next, so memory stays the same however long
+the sonar log is. As in v2, part 2 compares depths three apart.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from aoc import parse
+
+LAGS = (1, 3)  # part 1 compares consecutive depths, part 2 depths three apart
+
+
+def sweep(blocks):
+    """The number of increases at each lag in LAGS, over blocks of depths"""
+    counts = [0] * len(LAGS)
+    tail = np.zeros(0, dtype=np.int64)
+    for block in blocks:
+        depths = np.concatenate([tail, block])
+        for i, lag in enumerate(LAGS):
+            # Only the comparisons ending in this block: the others were counted before
+            start = max(len(tail), lag)
+            counts[i] += int(np.count_nonzero(depths[start:] > depths[start - lag : -lag]))
+        tail = depths[-max(LAGS) :]
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input, - for stdin (default: input.txt)")
+    args = parser.parse_args()
+
+    if args.f == "-":
+        increases1, increases3 = sweep(parse.int_chunks(sys.stdin.buffer))
+    else:
+        with open(args.f, "rb") as f:
+            increases1, increases3 = sweep(parse.int_chunks(f))
+
+    print("part 1:", increases1)
+    print("part 2:", increases3)
+
+
+if __name__ == "__main__":
+    main()
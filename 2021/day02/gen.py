@@ -0,0 +1,13 @@
+"""Synthetic inputs for Day 2: Dive!"""
+
+import random
+
+COMMANDS = 1000  # size of input.txt
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    directions = ["forward", "forward", "down", "down", "up"]
+    return "".join(
+        f"{rng.choice(directions)} {rng.randint(1, 9)}\n" for _ in range(COMMANDS * scale)
+    )
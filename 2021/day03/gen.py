@@ -0,0 +1,38 @@
+"""Synthetic inputs for Day 3: Binary Diagnostic
+
+The rows must be distinct for the ratings to narrow down to a single row, so
+the rows get wider as the report gets longer. There is one row more than
+ROWS * scale: with an odd number of rows no column has as many 1s as 0s, and
+part 1 (which does not say how to break a tie) has a single answer.
+
+Part 2 does not say what the least common bit is when the rows left all have
+the same one, so a sample where that happens is drawn again.
+"""
+
+import random
+
+ROWS = 1000  # size of input.txt
+BITS = 12
+
+
+def narrows(numbers, bits):
+    """Whether the CO2 scrubber rating keeps rows with both bits at every step"""
+    for bit in range(bits - 1, -1, -1):
+        if len(numbers) <= 1:
+            break
+        ones = [n for n in numbers if n >> bit & 1]
+        zeros = [n for n in numbers if not n >> bit & 1]
+        if not ones or not zeros:
+            return False
+        numbers = ones if len(ones) < len(zeros) else zeros
+    return True
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    rows = ROWS * scale + 1
+    bits = max(BITS, rows.bit_length() + 2)
+    numbers = rng.sample(range(2**bits), rows)
+    while not narrows(numbers, bits):
+        numbers = rng.sample(range(2**bits), rows)
+    return "".join(f"{n:0{bits}b}\n" for n in numbers)
@@ -0,0 +1,83 @@
+"""Day 3: Binary Diagnostic
+
+NumPy version: the report is packed into one int64 per row, and the 1 bits in
+each column are counted with a shift and a mask over the whole array.
+
+For the ratings the rows are sorted once. The rows that match the bits chosen
+so far share a prefix, so they are a contiguous range of the sorted array, and
+the first of them with a 1 in the next bit is found by binary search for the
+prefix with that bit set: each bit costs O(log n), instead of a pass over the
+remaining rows.
+"""
+
+import argparse
+
+import numpy as np
+
+from aoc import parse
+
+
+def read_report(data):
+    """The rows as an int64 array, and the number of bits in a row"""
+    bits = parse.char_grid(data) == ord("1")
+    width = bits.shape[1]
+    weights = np.int64(1) << np.arange(width - 1, -1, -1, dtype=np.int64)
+    return bits @ weights, width
+
+
+def part1(report):
+    values, width = report
+    shifts = np.arange(width - 1, -1, -1, dtype=np.int64)
+    ones = ((values[:, None] >> shifts) & 1).sum(axis=0)
+    gamma_rate = int(np.sum((ones * 2 > len(values)) << shifts))
+    epsilon_rate = gamma_rate ^ ((1 << width) - 1)
+
+    power_consumption = gamma_rate * epsilon_rate
+    return power_consumption
+
+
+def part2(report):
+    values, width = report
+    values = np.sort(values)
+
+    o2_generator_rating = rating(values, width, keep_common=True)
+    co2_scrubber_rating = rating(values, width, keep_common=False)
+
+    life_support_rating = o2_generator_rating * co2_scrubber_rating
+    return life_support_rating
+
+
+def rating(values, width, keep_common):
+    """The row left after keeping, bit by bit, the rows with the most (or least)
+    common bit, ties going to 1 (or 0), and the bit they all have if they agree
+    """
+    lo, hi = 0, len(values)
+    prefix = 0
+    for bit in range(width - 1, -1, -1):
+        if hi - lo <= 1:
+            break
+        # values[lo:hi] all start with prefix; those with this bit set come last
+        mid = lo + int(np.searchsorted(values[lo:hi], prefix | 1 << bit))
+        zeros, ones = mid - lo, hi - mid
+        if zeros == 0 or ones and (ones >= zeros) == keep_common:
+            lo, prefix = mid, prefix | 1 << bit
+        else:
+            hi = mid
+    assert hi - lo == 1, values[lo:hi]
+    return int(values[lo])
+
+
+def main():
+    # noinspection DuplicatedCode
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    report = read_report(parse.read(args.f))
+
+    print("part 1:", part1(report))
+    print("part 2:", part2(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Synthetic inputs for Day 4: Giant Squid"""
+
+import random
+
+BOARDS = 100  # size of input.txt
+NUMBERS = 100
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    draws = rng.sample(range(NUMBERS), NUMBERS)
+    chunks = [",".join(map(str, draws))]
+    for _ in range(BOARDS * scale):
+        numbers = rng.sample(range(NUMBERS), 25)
+        rows = [numbers[i:i + 5] for i in range(0, 25, 5)]
+        chunks.append("\n".join(" ".join(f"{n:2d}" for n in row) for row in rows))
+    return "\n\n".join(chunks) + "\n"
@@ -0,0 +1,92 @@
+"""Day 4: Giant Squid
+
+NumPy version: instead of marking the boards draw by draw, every cell is
+replaced by the turn its number is drawn on (never drawn: after the last
+turn). A row or column is complete on the last turn of its cells, the max
+along it, and a board wins on the first of those, the min per board, so all
+the boards' winning turns come out of a few reductions over one array. The
+unmarked cells of a board that wins on turn t are those drawn after t.
+"""
+
+import argparse
+
+import numpy as np
+
+from aoc import parse
+
+SIZE = 5  # rows and columns of a board
+
+
+class Board:
+    """A board with the numbers drawn up to some turn marked, for display"""
+
+    def __init__(self, grid, marks):
+        self.grid = grid
+        self.marks = marks
+        self.num_rows, self.num_cols = grid.shape
+
+    def render(self):
+        board = []
+        for r in range(self.num_rows):
+            row = []
+            for c in range(self.num_cols):
+                num_mark = f"{self.grid[r, c]:2d}"
+                if self.marks[r, c]:
+                    num_mark += "[*]"
+                else:
+                    num_mark += "[ ]"
+                row.append(num_mark)
+            board.append("  ".join(row))
+        return "\n".join(board)
+
+
+def winning_turns(draws, boards):
+    """The turn each board wins on, and the turn each of its cells is drawn on"""
+    numbers, first = np.unique(draws, return_index=True)
+    turns = np.full(max(draws.max(), boards.max()) + 1, len(draws))
+    turns[numbers] = first
+    cell_turns = turns[boards]
+    row_turns = cell_turns.max(axis=2).min(axis=1)
+    col_turns = cell_turns.max(axis=1).min(axis=1)
+    return np.minimum(row_turns, col_turns), cell_turns
+
+
+def play(draws, boards, display=False):
+    wins, cell_turns = winning_turns(draws, boards)
+    winners = np.flatnonzero(wins < len(draws))
+    # Ties go to the first board for the first win, and the last for the last
+    first = winners[np.argmin(wins[winners])]
+    last = winners[::-1][np.argmax(wins[winners][::-1])]
+
+    scores = []
+    for name, b in ("First", first), ("Last", last):
+        turn = wins[b]
+        marks = cell_turns[b] <= turn
+        if display:
+            print(f"{name} win:", draws[turn])
+            print(Board(boards[b], marks).render(), "\n")
+        scores.append(int(draws[turn]) * int(boards[b][~marks].sum()))
+
+    return scores
+
+
+def main():
+    # noinspection DuplicatedCode
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument("-d", action="store_true", help="display")
+    args = parser.parse_args()
+
+    data = parse.read(args.f)
+    split = data.find(b"\n\n")
+    draws = parse.ints(data[:split])
+    boards = parse.ints(data[split:]).reshape(-1, SIZE, SIZE)
+
+    scores = play(draws, boards, display=args.d)
+
+    print("part 1:", scores[0])
+    print("part 2:", scores[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Synthetic inputs for Day 5: Hydrothermal Venture"""
+
+import random
+
+LINES = 500  # size of input.txt
+EXTENT = 1000
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(LINES * scale):
+        x0, y0 = rng.randrange(EXTENT), rng.randrange(EXTENT)
+        kind = rng.choice("hvd")
+        if kind == "h":
+            x1, y1 = rng.randrange(EXTENT), y0
+        elif kind == "v":
+            x1, y1 = x0, rng.randrange(EXTENT)
+        else:
+            n = rng.randint(-min(x0, y0), EXTENT - 1 - max(x0, y0))
+            m = rng.choice([1, -1])
+            if m == -1:
+                n = rng.randint(-min(x0, EXTENT - 1 - y0), min(EXTENT - 1 - x0, y0))
+            x1, y1 = x0 + n, y0 + m * n
+        lines.append(f"{x0},{y0} -> {x1},{y1}\n")
+    return "".join(lines)
@@ -1,11 +1,11 @@
 """Day 5: Hydrothermal Venture"""
 
 import argparse
-import pathlib
-import re
 from collections import Counter
 from typing import NamedTuple
 
+from aoc import parse
+
 
 class Point(NamedTuple):
     x: int
@@ -85,10 +85,9 @@ def main():
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
     args = parser.parse_args()
 
-    text_lines = pathlib.Path(args.f).read_text().splitlines()
+    rows = parse.int_rows(parse.read(args.f), 4).tolist()
     lines = []
-    for text_line in text_lines:
-        x0, y0, x1, y1 = [int(n) for n in re.findall(r"\d+", text_line)]
+    for x0, y0, x1, y1 in rows:
         lines.append(Line(Point(x0, y0), Point(x1, y1)))
 
     print("part 1:", part1(lines))
@@ -0,0 +1,261 @@
+"""Day 5: Hydrothermal Venture
+
+NumPy version, with no object per covered cell. Every line is kept as its
+family (horizontal, vertical, diagonal or antidiagonal), its key (the
+coordinate, or combination of coordinates, that is the same all along it) and
+the range of its position along it, and the overlaps are counted by one of two
+backends, picked from the bounding box:
+
+- raster: a dense array of the box. Each line adds +1 at its first cell and -1
+  just past its last, and a prefix sum along the family's direction turns
+  those marks into the number of lines over every cell, for all the lines of a
+  family at once.
+
+- sweep: for coordinates too large for a raster. Each family's lines, sorted
+  by key and position, are swept into runs of cells covered at least once and
+  at least twice (overlaps within the family). A cell covered by two families
+  is where their runs cross, and those crossings are found by binary search
+  for the runs of one family whose keys the other's runs pass through. The
+  cost is in the number of lines and crossings, not the area.
+"""
+
+import argparse
+
+import numpy as np
+
+from aoc import parse
+
+RASTER_CELLS = 1 << 24  # largest bounding box counted with a raster
+BLOCK = 1 << 22  # candidate crossings checked at once by the sweep
+
+# For each family, the linear functions of (x, y) that stay the same along its
+# lines (the key) and that step by one along them (the position)
+FAMILIES = {
+    "horizontal": ((0, 1), (1, 0)),  # y, x
+    "vertical": ((1, 0), (0, 1)),  # x, y
+    "diagonal": ((-1, 1), (1, 0)),  # y - x, x
+    "antidiagonal": ((1, 1), (1, 0)),  # y + x, x
+}
+
+
+def dot(row, x, y):
+    return row[0] * x + row[1] * y
+
+
+def solve(row_a, a, row_b, b):
+    """The cells (x, y) with dot(row_a, x, y) == a and dot(row_b, x, y) == b,
+    and whether each is a whole cell
+    """
+    det = row_a[0] * row_b[1] - row_a[1] * row_b[0]
+    x, x_rem = np.divmod(a * row_b[1] - row_a[1] * b, det)
+    y, y_rem = np.divmod(row_a[0] * b - row_b[0] * a, det)
+    return x, y, (x_rem == 0) & (y_rem == 0)
+
+
+def cells(family, key, pos):
+    key_row, pos_row = FAMILIES[family]
+    x, y, _ = solve(key_row, key, pos_row, pos)
+    return x, y
+
+
+def families(segments, diagonals=True):
+    """The lines as {family: (key, first position, last position)}
+
+    Lines that are not horizontal, vertical or (with diagonals) at 45 degrees
+    are left out, and a single cell counts as horizontal.
+    """
+    x0, y0, x1, y1 = segments.T
+    dx, dy = x1 - x0, y1 - y0
+    horizontal = dy == 0
+    vertical = (dx == 0) & ~horizontal
+    diagonal = (np.abs(dx) == np.abs(dy)) & ~horizontal & diagonals
+    masks = {
+        "horizontal": horizontal,
+        "vertical": vertical,
+        "diagonal": diagonal & (dx * dy > 0),
+        "antidiagonal": diagonal & (dx * dy < 0),
+    }
+
+    lines = {}
+    for family, mask in masks.items():
+        if not mask.any():
+            continue
+        key_row, pos_row = FAMILIES[family]
+        key = dot(key_row, x0[mask], y0[mask])
+        start, end = dot(pos_row, x0[mask], y0[mask]), dot(pos_row, x1[mask], y1[mask])
+        lines[family] = key, np.minimum(start, end), np.maximum(start, end)
+    return lines
+
+
+def bounding_box(lines):
+    """(x_min, y_min, x_max, y_max) of the lines' cells"""
+    xs, ys = [], []
+    for family, (key, first, last) in lines.items():
+        for pos in first, last:
+            x, y = cells(family, key, pos)
+            xs.append(x)
+            ys.append(y)
+    xs, ys = np.concatenate(xs), np.concatenate(ys)
+    return xs.min(), ys.min(), xs.max(), ys.max()
+
+
+def count_overlaps(lines, backend="auto"):
+    """Number of cells covered by at least two lines"""
+    if not lines:
+        return 0
+    x_min, y_min, x_max, y_max = bounding_box(lines)
+    if backend == "auto":
+        area = (int(x_max) - x_min + 1) * (int(y_max) - y_min + 1)
+        backend = "raster" if area <= RASTER_CELLS else "sweep"
+    if backend == "raster":
+        return raster_overlaps(lines, (x_min, y_min, x_max, y_max))
+    return sweep_overlaps(lines)
+
+
+def raster_overlaps(lines, box):
+    x_min, y_min, x_max, y_max = box
+    # A border of one cell all around for the marks just past the lines' ends
+    height, width = y_max - y_min + 3, x_max - x_min + 3
+    counts = np.zeros((height, width), dtype=np.int64)
+    for family, (key, first, last) in lines.items():
+        x0, y0 = cells(family, key, first)
+        x1, y1 = cells(family, key, last + 1)
+        starts = (y0 - y_min + 1) * width + (x0 - x_min + 1)
+        stops = (y1 - y_min + 1) * width + (x1 - x_min + 1)
+        marks = np.bincount(starts, minlength=height * width)
+        marks -= np.bincount(stops, minlength=height * width)
+        counts += prefix_sum(marks.reshape(height, width), *cells(family, 0, 1))
+    return int(np.count_nonzero(counts >= 2))
+
+
+def prefix_sum(marks, dx, dy):
+    """Running totals of marks along the direction (dx, dy), in place"""
+    if dy == 0:
+        return np.cumsum(marks, axis=1, out=marks)
+    if dx == 0:
+        return np.cumsum(marks, axis=0, out=marks)
+    # Diagonals: a row at a time, each cell adding the one before it
+    rows = range(1, len(marks)) if dy > 0 else range(len(marks) - 2, -1, -1)
+    for r in rows:
+        marks[r, 1:] += marks[r - dy, :-1]
+    return marks
+
+
+def sweep_overlaps(lines):
+    # Runs are kept as key * span + position, which sorts by key, then position
+    first_pos = min(int(first.min()) for _, first, _ in lines.values())
+    last_pos = max(int(last.max()) for _, _, last in lines.values())
+    span = last_pos - first_pos + 2
+
+    covered, overlaps = {}, {}
+    for family, (key, first, last) in lines.items():
+        starts = key * span + (first - first_pos)
+        stops = key * span + (last + 1 - first_pos)
+        covered[family] = runs(starts, stops, 1)
+        overlaps[family] = runs(starts, stops, 2)
+    overlapping = sum(int(np.sum(stops - starts)) for starts, stops in overlaps.values())
+
+    # Add the cells covered by two or more families, less those already counted
+    # as overlaps within one of them
+    x, y = crossings(covered, span, first_pos)
+    overlapping += len(x)
+    for family, (starts, stops) in overlaps.items():
+        if not len(starts):
+            continue
+        key_row, pos_row = FAMILIES[family]
+        pos = dot(pos_row, x, y)
+        encoded = dot(key_row, x, y) * span + (pos - first_pos)
+        i = np.maximum(np.searchsorted(starts, encoded, side="right") - 1, 0)
+        inside = (first_pos <= pos) & (pos <= last_pos)
+        inside &= (starts[i] <= encoded) & (encoded < stops[i])
+        overlapping -= int(np.count_nonzero(inside))
+    return overlapping
+
+
+def crossings(covered, span, first_pos):
+    """The cells (x, y) covered by the runs of two or more families, each once"""
+    xs, ys = [np.zeros(0, np.int64)], [np.zeros(0, np.int64)]
+    names = list(covered)
+    for n, f in enumerate(names):
+        f_key_row, _ = FAMILIES[f]
+        f_key, f_first = np.divmod(covered[f][0], span)
+        f_last = (covered[f][1] - 1) % span
+        for g in names[n + 1 :]:
+            g_key_row, g_pos_row = FAMILIES[g]
+            g_key, g_first = np.divmod(covered[g][0], span)
+            g_last = (covered[g][1] - 1) % span
+            # The runs of g with the keys each run of f passes through, from
+            # its first cell to its last
+            k0 = dot(g_key_row, *cells(f, f_key, f_first + first_pos))
+            k1 = dot(g_key_row, *cells(f, f_key, f_last + first_pos))
+            lo = np.searchsorted(g_key, np.minimum(k0, k1), side="left")
+            hi = np.searchsorted(g_key, np.maximum(k0, k1), side="right")
+            for i, j in pairs(lo, hi):
+                x, y, whole = solve(f_key_row, f_key[i], g_key_row, g_key[j])
+                pos = dot(g_pos_row, x, y) - first_pos
+                hit = whole & (g_first[j] <= pos) & (pos <= g_last[j])
+                xs.append(x[hit])
+                ys.append(y[hit])
+    # Where three families cross, each pair of them finds the cell
+    unique = np.unique(np.stack([np.concatenate(xs), np.concatenate(ys)]), axis=1)
+    return unique[0], unique[1]
+
+
+def pairs(lo, hi, block=BLOCK):
+    """Yield (i, j) arrays of the pairs with lo[i] <= j < hi[i], about block at a time"""
+    counts = hi - lo
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(counts):
+        done = ends[start - 1] if start else 0
+        stop = max(int(np.searchsorted(ends, done + block, side="right")), start + 1)
+        n = counts[start:stop]
+        i = np.repeat(np.arange(start, stop), n)
+        j = lo[i] + np.arange(len(i)) - np.repeat(ends[start:stop] - n - done, n)
+        yield i, j
+        start = stop
+
+
+def runs(starts, stops, at_least):
+    """The (starts, stops) of the runs covered by at least `at_least` of the
+    ranges [starts, stops)
+    """
+    events = np.concatenate([starts, stops])
+    deltas = np.concatenate([np.ones(len(starts), np.int64), -np.ones(len(stops), np.int64)])
+    order = np.argsort(events, kind="stable")
+    events = events[order]
+    depth = np.cumsum(deltas[order])
+    keep = (depth[:-1] >= at_least) & (events[1:] > events[:-1])
+    starts, stops = events[:-1][keep], events[1:][keep]
+    # Join the runs that carry straight on, where only the depth changed
+    first = np.ones(len(starts), dtype=bool)
+    first[1:] = starts[1:] != stops[:-1]
+    last = np.roll(first, -1)
+    return starts[first], stops[last]
+
+
+def part1(segments, backend="auto"):
+    return count_overlaps(families(segments, diagonals=False), backend)
+
+
+def part2(segments, backend="auto"):
+    return count_overlaps(families(segments, diagonals=True), backend)
+
+
+def main():
+    # noinspection DuplicatedCode
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument(
+        "-b", default="auto", choices=["auto", "raster", "sweep"], help="backend (default: auto)"
+    )
+    args = parser.parse_args()
+
+    segments = parse.int_rows(parse.read(args.f), 4)
+
+    print("part 1:", part1(segments, args.b))
+    print("part 2:", part2(segments, args.b))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Synthetic inputs for Day 1: Calorie Counting"""
+
+import io
+
+import numpy as np
+
+ELVES = 250  # size of input.txt
+BLOCK = 1 << 17  # elves generated and written at a time
+
+
+def write(file, scale, seed=0):
+    """Write the inventories of ELVES * scale elves to a binary file, a block at a time"""
+    rng = np.random.default_rng(seed)
+    left = ELVES * scale
+    while left:
+        n = min(left, BLOCK)
+        counts = rng.integers(1, 16, n)
+        lines = list(map(str, rng.integers(1000, 60001, counts.sum()).tolist()))
+        # A blank line after each elf's last item, but the very last
+        for end in (np.cumsum(counts)[:-1] - 1).tolist():
+            lines[end] += "\n"
+        if left < ELVES * scale:
+            file.write(b"\n")
+        file.write(("\n".join(lines) + "\n").encode())
+        left -= n
+
+
+def generate(scale, seed=0):
+    out = io.BytesIO()
+    write(out, scale, seed=seed)
+    return out.getvalue().decode()
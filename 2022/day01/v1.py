@@ -1,21 +1,43 @@
 """Day 1: Calorie Counting"""
+import argparse
+import pathlib
 
-with open("input.txt", "r") as f:
-    lines = f.readlines()
 
-calories = [0]
+def elf_calories(lines):
+    calories = [0]
 
-for line in lines:
-    line = line.strip()
-    if line:
-        calories[-1] += int(line)
-    else:
-        calories.append(0)
+    for line in lines:
+        line = line.strip()
+        if line:
+            calories[-1] += int(line)
+        else:
+            calories.append(0)
 
-# print(calories)
-# print(len(calories))
-print("part 1:", max(calories))
+    return calories
 
-top_3 = sorted(calories)[-3:]
-# print(top_3)
-print("part 2:", sum(top_3))
+
+def part1(calories):
+    return max(calories)
+
+
+def part2(calories):
+    top_3 = sorted(calories)[-3:]
+    return sum(top_3)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    lines = pathlib.Path(args.f).read_text().splitlines()
+    calories = elf_calories(lines)
+    # print(calories)
+    # print(len(calories))
+
+    print("part 1:", part1(calories))
+    print("part 2:", part2(calories))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Day 1: Calorie Counting
+
+Streaming version: the inventory is read from the file (or stdin, with -f -) a
+block at a time, the elves' totals in each block are summed with NumPy
+(parse.group_sums), and only the k largest totals seen so far are kept, in a
+min-heap of size k. Memory stays bounded however many elves there are, and
+no list of every total is ever sorted.
+"""
+
+import argparse
+import heapq
+import sys
+
+import numpy as np
+
+from aoc import parse
+
+
+def top_totals(blocks, k):
+    """The k largest totals (or all, if fewer) in blocks of totals, largest first"""
+    heap = []  # the k largest so far, smallest first
+    for totals in blocks:
+        if len(totals) > k:
+            totals = np.partition(totals, -k)[-k:]
+        for total in totals.tolist():
+            if len(heap) < k:
+                heapq.heappush(heap, total)
+            elif total > heap[0]:
+                heapq.heapreplace(heap, total)
+    return sorted(heap, reverse=True)
+
+
+def top_calories(path, k=3):
+    """The k largest elf totals in the inventory at path (- for stdin)"""
+    if path == "-":
+        return top_totals(parse.group_sums(sys.stdin.buffer), k)
+    with open(path, "rb") as f:
+        return top_totals(parse.group_sums(f), k)
+
+
+def part1(top):
+    return top[0]
+
+
+def part2(top, k=3):
+    return sum(top[:k])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input, - for stdin (default: input.txt)")
+    parser.add_argument(
+        "-k", type=int, default=3, help="elves carrying the most in part 2 (default: 3)"
+    )
+    args = parser.parse_args()
+
+    top = top_calories(args.f, max(args.k, 1))
+
+    print("part 1:", part1(top))
+    print("part 2:", part2(top, args.k))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Synthetic inputs for Day 2: Rock Paper Scissors"""
+import random
+
+LINES = 2500  # size of input.txt
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    return "".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(LINES * scale)
+    )
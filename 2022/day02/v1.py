@@ -1,4 +1,6 @@
 """Day 2: Rock Paper Scissors"""
+import argparse
+import pathlib
 
 # Scoring
 # rock (0) < paper (1)
@@ -13,13 +15,6 @@ outcome = [
 shape_score = [1, 2, 3]
 outcome_score = [0, 3, 6]
 
-# Strategy
-# C X
-# A Y
-# ...
-with open("input.txt", "r") as f:
-    lines = f.readlines()
-
 indices = dict(A=0, B=1, C=2, X=0, Y=1, Z=2)
 
 
@@ -29,21 +24,38 @@ def str_to_indices(s):
     return ai, xi
 
 
-strategy = [str_to_indices(line) for line in lines]
+def part1(strategy):
+    return sum(shape_score[xi] + outcome_score[outcome[ai][xi]] for ai, xi in strategy)
+
+
+def part2(strategy):
+    # Reverse the play0 x play1 -> outcome matrix to play0 x outcome -> play1
+    play = [-1, -1, -1]
+    for p0 in range(3):
+        play[p0] = [-1, -1, -1]
+        for p1 in range(3):
+            o = outcome[p0][p1]
+            play[p0][o] = p1
+    # print(play)
+
+    return sum(shape_score[play[ai][xi]] + outcome_score[xi] for ai, xi, in strategy)
+
 
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
 
-score = sum(shape_score[xi] + outcome_score[outcome[ai][xi]] for ai, xi in strategy)
-print("part 1:", score)
+    # Strategy
+    # C X
+    # A Y
+    # ...
+    lines = pathlib.Path(args.f).read_text().splitlines()
+    strategy = [str_to_indices(line) for line in lines]
 
+    print("part 1:", part1(strategy))
+    print("part 2:", part2(strategy))
 
-# Reverse the play0 x play1 -> outcome matrix to play0 x outcome -> play1
-play = [-1, -1, -1]
-for p0 in range(3):
-    play[p0] = [-1, -1, -1]
-    for p1 in range(3):
-        o = outcome[p0][p1]
-        play[p0][o] = p1
-# print(play)
 
-score = sum(shape_score[play[ai][xi]] + outcome_score[xi] for ai, xi, in strategy)
-print("part 2:", score)
+if __name__ == "__main__":
+    main()
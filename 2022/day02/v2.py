@@ -1,14 +1,8 @@
 """Day 2: Rock Paper Scissors"""
+import argparse
 import pathlib
 
-# Strategy
-# C X
-# A Y
-# ...
-lines = pathlib.Path("input.txt").read_text().splitlines()
-
 index = dict(A=0, B=1, C=2, X=0, Y=1, Z=2)
-strategy = [[index[s] for s in line.split()] for line in lines]
 
 
 # plays: rock=0, paper=1, scissors=2
@@ -25,8 +19,30 @@ def outcome2play1(play0, outcome):
 shape_score = [1, 2, 3]
 outcome_score = [0, 3, 6]
 
-score1 = sum(shape_score[p1] + outcome_score[plays2outcome(p0, p1)] for p0, p1 in strategy)
-score2 = sum(shape_score[outcome2play1(p0, oc)] + outcome_score[oc] for p0, oc in strategy)
 
-print("part 1:", score1)
-print("part 2:", score2)
+def part1(strategy):
+    return sum(shape_score[p1] + outcome_score[plays2outcome(p0, p1)] for p0, p1 in strategy)
+
+
+def part2(strategy):
+    return sum(shape_score[outcome2play1(p0, oc)] + outcome_score[oc] for p0, oc in strategy)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    # Strategy
+    # C X
+    # A Y
+    # ...
+    lines = pathlib.Path(args.f).read_text().splitlines()
+    strategy = [[index[s] for s in line.split()] for line in lines]
+
+    print("part 1:", part1(strategy))
+    print("part 2:", part2(strategy))
+
+
+if __name__ == "__main__":
+    main()
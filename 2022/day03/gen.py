@@ -0,0 +1,33 @@
+"""Synthetic inputs for Day 3: Rucksack Reorganization
+
+Each group of three rucksacks draws its items from three disjoint pools of
+letters, so the badge (added to the first compartment of all three) is the
+only item the group shares, and each rucksack's shared item is the only
+letter its two compartments have in common.
+"""
+import random
+import string
+
+RUCKSACKS = 300  # size of input.txt
+
+
+def rucksack(rng, pool, badge):
+    shared, *pool = pool
+    half = len(pool) // 2
+    size = rng.randint(4, 20)
+    first = rng.choices(pool[:half], k=size - 2) + [shared, badge]
+    second = rng.choices(pool[half:], k=size - 1) + [shared]
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(RUCKSACKS * scale // 3):
+        letters = rng.sample(string.ascii_letters, 52)
+        badge, letters = letters[0], letters[1:]
+        for i in range(3):
+            lines.append(rucksack(rng, letters[17 * i:17 * (i + 1)], badge))
+    return "\n".join(lines) + "\n"
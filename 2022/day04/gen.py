@@ -0,0 +1,16 @@
+"""Synthetic inputs for Day 4: Camp Cleanup"""
+import random
+
+PAIRS = 1000  # size of input.txt
+
+
+def section_range(rng):
+    lo = rng.randint(1, 99)
+    return f"{lo}-{rng.randint(lo, 99)}"
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    return "".join(
+        f"{section_range(rng)},{section_range(rng)}\n" for _ in range(PAIRS * scale)
+    )
@@ -1,19 +1,42 @@
 """Day 4: Camp Cleanup"""
+import argparse
 import pathlib
 
-input_lines = pathlib.Path("input.txt").read_text().splitlines()
-range_pairs = [line.split(",") for line in input_lines]
 
-contained = 0
-overlaps = 0
+def parse_pair(line):
+    range0, range1 = line.split(",")
+    l0, r0 = [int(x) for x in range0.split("-")]
+    l1, r1 = [int(x) for x in range1.split("-")]
+    return (l0, r0), (l1, r1)
 
-for pair in range_pairs:
-    l0, r0 = [int(x) for x in pair[0].split("-")]
-    l1, r1 = [int(x) for x in pair[1].split("-")]
-    if (l0 <= l1 and r0 >= r1) or (l1 <= l0 and r1 >= r0):
-        contained += 1
-    if (l1 <= r0) and (l0 <= r1):
-        overlaps += 1
 
-print("part 1:", contained)
-print("part 2:", overlaps)
+def part1(range_pairs):
+    contained = 0
+    for (l0, r0), (l1, r1) in range_pairs:
+        if (l0 <= l1 and r0 >= r1) or (l1 <= l0 and r1 >= r0):
+            contained += 1
+    return contained
+
+
+def part2(range_pairs):
+    overlaps = 0
+    for (l0, r0), (l1, r1) in range_pairs:
+        if (l1 <= r0) and (l0 <= r1):
+            overlaps += 1
+    return overlaps
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    input_lines = pathlib.Path(args.f).read_text().splitlines()
+    range_pairs = [parse_pair(line) for line in input_lines]
+
+    print("part 1:", part1(range_pairs))
+    print("part 2:", part2(range_pairs))
+
+
+if __name__ == "__main__":
+    main()
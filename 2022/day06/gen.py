@@ -0,0 +1,17 @@
+"""Synthetic inputs for Day 6: Tuning Trouble
+
+The signal only uses three letters up to the very end, where the markers are,
+so both parts have to scan all of it.
+"""
+import random
+import string
+
+SIGNAL = 4096  # size of input.txt
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    noise = rng.sample(string.ascii_lowercase, 3)
+    marker = rng.sample([c for c in string.ascii_lowercase if c not in noise], 14)
+    signal = rng.choices(noise, k=SIGNAL * scale - len(marker))
+    return "".join(signal + marker) + "\n"
@@ -1,8 +1,7 @@
 """Day 6: Tuning Trouble"""
+import argparse
 import pathlib
 
-input = pathlib.Path("input.txt").read_text()
-
 
 def get_marker_pos(signal, marker_size):
     for pos in range(len(signal)):
@@ -12,8 +11,26 @@ def get_marker_pos(signal, marker_size):
     raise IndexError("marker not found")
 
 
-start_of_packet = get_marker_pos(input, 4) + 4
-start_of_message = get_marker_pos(input, 14) + 14
+def part1(signal):
+    start_of_packet = get_marker_pos(signal, 4) + 4
+    return start_of_packet
+
+
+def part2(signal):
+    start_of_message = get_marker_pos(signal, 14) + 14
+    return start_of_message
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    signal = pathlib.Path(args.f).read_text()
+
+    print("part 1:", part1(signal))
+    print("part 2:", part2(signal))
+
 
-print("part 1:", start_of_packet)
-print("part 2:", start_of_message)
+if __name__ == "__main__":
+    main()
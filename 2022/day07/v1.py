@@ -1,65 +1,86 @@
 """Day 7: No Space Left On Device"""
+import argparse
 import pathlib
 
-lines = pathlib.Path("input.txt").read_text().splitlines()
-
-cwd = None
-dir_stack = []
-dir_size = {}
-
-for line in lines:
-    parts = line.split()
-    if parts[0] == "$":
-        if parts[1] == "cd":
-            dirname = parts[2]
-            if dirname == "..":
-                cwd_size = dir_size[cwd]
-                dir_stack.pop()
-                cwd = "/".join(dir_stack)
-                dir_size[cwd] += cwd_size
-            else:
-                dir_stack.append(dirname)
-                cwd = "/".join(dir_stack)
-                dir_size[cwd] = 0
-    elif parts[0] != "dir":
-        dir_size[cwd] += int(parts[0])
-
-# print(cwd)
-# print(dir_stack)
-# print(dir_size)
-
-while dir_stack[-1] != "/":
-    cwd_size = dir_size[cwd]
-    dir_stack.pop()
-    cwd = "/".join(dir_stack)
-    dir_size[cwd] += cwd_size
-
-# print(cwd)
-# print(dir_stack)
-# print(dir_size)
-
-dirs_at_most_100k = {d: dir_size[d] for d in dir_size if dir_size[d] <= 100000}
-# print(dirs_at_most_100k)
-
-print("part 1:", sum(dirs_at_most_100k.values()))
-
 DISK_SIZE = 70000000
 NEED_SIZE = 30000000
 
-used_size = dir_size["/"]
-free_size = DISK_SIZE - used_size
-min_delete_size = NEED_SIZE - free_size
 
-# print("used_size:", used_size)
-# print("free_size:", free_size)
-# print("min_delete_size:", min_delete_size)
+def dir_sizes(lines):
+    cwd = None
+    dir_stack = []
+    dir_size = {}
+
+    for line in lines:
+        parts = line.split()
+        if parts[0] == "$":
+            if parts[1] == "cd":
+                dirname = parts[2]
+                if dirname == "..":
+                    cwd_size = dir_size[cwd]
+                    dir_stack.pop()
+                    cwd = "/".join(dir_stack)
+                    dir_size[cwd] += cwd_size
+                else:
+                    dir_stack.append(dirname)
+                    cwd = "/".join(dir_stack)
+                    dir_size[cwd] = 0
+        elif parts[0] != "dir":
+            dir_size[cwd] += int(parts[0])
+
+    # print(cwd)
+    # print(dir_stack)
+    # print(dir_size)
+
+    while dir_stack[-1] != "/":
+        cwd_size = dir_size[cwd]
+        dir_stack.pop()
+        cwd = "/".join(dir_stack)
+        dir_size[cwd] += cwd_size
+
+    # print(cwd)
+    # print(dir_stack)
+    # print(dir_size)
+
+    return dir_size
+
+
+def part1(dir_size):
+    dirs_at_most_100k = {d: dir_size[d] for d in dir_size if dir_size[d] <= 100000}
+    # print(dirs_at_most_100k)
+    return sum(dirs_at_most_100k.values())
+
+
+def part2(dir_size):
+    used_size = dir_size["/"]
+    free_size = DISK_SIZE - used_size
+    min_delete_size = NEED_SIZE - free_size
+
+    # print("used_size:", used_size)
+    # print("free_size:", free_size)
+    # print("min_delete_size:", min_delete_size)
+
+    delete_candidates = {d: dir_size[d] for d in dir_size if dir_size[d] >= min_delete_size}
+    # print(delete_candidates)
+
+    sorted_delete_candidates = [(d, dir_size[d]) for d in sorted(delete_candidates, key=lambda d: dir_size[d])]
+    # print(sorted_delete_candidates)
+
+    delete_dir = sorted_delete_candidates[0][0]
+    return dir_size[delete_dir]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
 
-delete_candidates = {d: dir_size[d] for d in dir_size if dir_size[d] >= min_delete_size}
-# print(delete_candidates)
+    lines = pathlib.Path(args.f).read_text().splitlines()
+    dir_size = dir_sizes(lines)
 
-sorted_delete_candidates = [(d, dir_size[d]) for d in sorted(delete_candidates, key=lambda d: dir_size[d])]
-# print(sorted_delete_candidates)
+    print("part 1:", part1(dir_size))
+    print("part 2:", part2(dir_size))
 
-delete_dir = sorted_delete_candidates[0][0]
-print("part 2:", dir_size[delete_dir])
 
+if __name__ == "__main__":
+    main()
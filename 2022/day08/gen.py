@@ -0,0 +1,16 @@
+"""Synthetic inputs for Day 8: Treetop Tree House
+
+The forest is square, with `scale` times the trees of input.txt.
+"""
+import math
+import random
+
+SIZE = 99  # input.txt is SIZE x SIZE
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    size = round(SIZE * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices("0123456789", k=size)) + "\n" for _ in range(size)
+    )
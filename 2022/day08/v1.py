@@ -1,4 +1,5 @@
 """Day 8: Treetop Tree House"""
+import argparse
 import pathlib
 
 
@@ -108,19 +109,34 @@ def scenic_score(h):
     return score
 
 
-inp = pathlib.Path("input.txt").read_text().splitlines()
+def part1(height_grid):
+    visibility_grid = visibility(height_grid)
 
-height_grid = [[int(e) for e in list(row)] for row in inp]
-visibility_grid = visibility(height_grid)
+    num_visible = 0
+    for row in visibility_grid:
+        num_visible += sum(row)
+        # print("".join([str(v) for v in row]))
 
-num_visible = 0
-for row in visibility_grid:
-    num_visible += sum(row)
-    # print("".join([str(v) for v in row]))
+    return num_visible
 
-print("part 1:", num_visible)
 
-score_grid = scenic_score(height_grid)
-max_score = max(max(row) for row in score_grid)
+def part2(height_grid):
+    score_grid = scenic_score(height_grid)
+    max_score = max(max(row) for row in score_grid)
+    return max_score
 
-print("part 2:", max_score)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    inp = pathlib.Path(args.f).read_text().splitlines()
+    height_grid = [[int(e) for e in list(row)] for row in inp]
+
+    print("part 1:", part1(height_grid))
+    print("part 2:", part2(height_grid))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""Synthetic inputs for Day 9: Rope Bridge"""
+import random
+
+MOTIONS = 2000  # size of input.txt
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    return "".join(
+        f"{rng.choice('LRUD')} {rng.randint(1, 20)}\n" for _ in range(MOTIONS * scale)
+    )
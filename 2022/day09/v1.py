@@ -1,4 +1,5 @@
 """Day 9: Rope Bridge"""
+import argparse
 import pathlib
 
 
@@ -55,36 +56,52 @@ def move_rope(ks, delta):
     return ks
 
 
-cmds = pathlib.Path("input.txt").read_text().splitlines()
+DELTA = dict(L=(-1, 0), R=(1, 0), U=(0, 1), D=(0, -1))
 
-head = (0, 0)
-tail = (0, 0)
-seen = {tail}
 
-DELTA = dict(L=(-1, 0), R=(1, 0), U=(0, 1), D=(0, -1))
+def part1(cmds):
+    head = (0, 0)
+    tail = (0, 0)
+    seen = {tail}
+
+    # print(" ", " ", head, tail)
+    for cmd in cmds:
+        step_dir, step_cnt = cmd.split()
+        for i in range(int(step_cnt)):
+            head, tail = move(head, tail, DELTA[step_dir])
+            seen.add(tail)
+            # print(step_dir, i, head, tail)
+
+    # print(seen)
+    return len(seen)
+
+
+def part2(cmds):
+    knots = [(0, 0) for _ in range(10)]
+    seen2 = {(0, 0)}
+
+    # print(" ", " ", knots)
+    for cmd in cmds:
+        step_dir, step_cnt = cmd.split()
+        for i in range(int(step_cnt)):
+            knots = move_rope(knots, DELTA[step_dir])
+            seen2.add(knots[9])
+            # print(step_dir, i, knots)
+
+    # print(seen2)
+    return len(seen2)
 
-# print(" ", " ", head, tail)
-for cmd in cmds:
-    step_dir, step_cnt = cmd.split()
-    for i in range(int(step_cnt)):
-        head, tail = move(head, tail, DELTA[step_dir])
-        seen.add(tail)
-        # print(step_dir, i, head, tail)
 
-# print(seen)
-print("part 1:", len(seen))
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
 
+    cmds = pathlib.Path(args.f).read_text().splitlines()
 
-knots = [(0, 0) for _ in range(10)]
-seen2 = {(0, 0)}
+    print("part 1:", part1(cmds))
+    print("part 2:", part2(cmds))
 
-# print(" ", " ", knots)
-for cmd in cmds:
-    step_dir, step_cnt = cmd.split()
-    for i in range(int(step_cnt)):
-        knots = move_rope(knots, DELTA[step_dir])
-        seen2.add(knots[9])
-        # print(step_dir, i, knots)
 
-# print(seen2)
-print("part 2:", len(seen2))
+if __name__ == "__main__":
+    main()
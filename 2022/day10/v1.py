@@ -1,52 +1,55 @@
 """Day 10: Cathode-Ray Tube"""
+import argparse
 import pathlib
 
-lines = pathlib.Path("input.txt").read_text().splitlines()
 
-imem = []
-for line in lines:
-    inst = line.split()
-    if inst[0] == "noop":
-        imem.append((inst[0], 0))
-    else:
-        imem.append((inst[0], int(inst[1])))
+def parse_program(lines):
+    imem = []
+    for line in lines:
+        inst = line.split()
+        if inst[0] == "noop":
+            imem.append((inst[0], 0))
+        else:
+            imem.append((inst[0], int(inst[1])))
+    return imem
 
-cycle = 1
-FEX, EX1 = 0, 1
-state = FEX
-x = 1
-pc = 0
 
-cycle_x = []
+def execute(imem):
+    cycle = 1
+    FEX, EX1 = 0, 1
+    state = FEX
+    x = 1
+    pc = 0
 
-while True:
-    op, arg = imem[pc]
+    cycle_x = []
 
-    cycle_x.append([cycle, x])
-    # print(f"{cycle:3d} {x:>4} {cycle * x}", pc, op, arg)
+    while True:
+        op, arg = imem[pc]
 
-    if state == FEX:
-        next_state = FEX if op == "noop" else EX1
-    else:
-        next_state = FEX
+        cycle_x.append([cycle, x])
+        # print(f"{cycle:3d} {x:>4} {cycle * x}", pc, op, arg)
 
-    if next_state == FEX:
-        pc += 1
+        if state == FEX:
+            next_state = FEX if op == "noop" else EX1
+        else:
+            next_state = FEX
 
-    if state == EX1 and next_state == FEX:
-        x += arg
+        if next_state == FEX:
+            pc += 1
 
-    if pc == len(imem):
-        break
+        if state == EX1 and next_state == FEX:
+            x += arg
 
-    state = next_state
-    cycle += 1
+        if pc == len(imem):
+            break
 
-cycle_x.append([cycle, x])
-# print(f"{cycle:3d} {x:>4} {cycle * x}", pc, op, arg)
+        state = next_state
+        cycle += 1
 
-signal_strength = sum(c * x for c, x in cycle_x if (c - 20) % 40 == 0)
-print("part 1:", signal_strength)
+    cycle_x.append([cycle, x])
+    # print(f"{cycle:3d} {x:>4} {cycle * x}", pc, op, arg)
+
+    return cycle_x
 
 
 class CRT:
@@ -57,13 +60,37 @@ class CRT:
         return "\n".join(["".join(row) for row in self.buf])
 
 
-crt = CRT(width=40, height=6)
+def part1(imem):
+    cycle_x = execute(imem)
+    signal_strength = sum(c * x for c, x in cycle_x if (c - 20) % 40 == 0)
+    return signal_strength
+
+
+def part2(imem):
+    cycle_x = execute(imem)
+
+    crt = CRT(width=40, height=6)
+
+    for cycle, x in cycle_x:
+        r = (cycle - 1) // 40
+        c = (cycle - 1) % 40
+        # print(cycle, r, c, x)
+        crt.buf[r][c] = "#" if c in [x - 1, x, x + 1] else "."
+
+    return crt.render()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+
+    lines = pathlib.Path(args.f).read_text().splitlines()
+    imem = parse_program(lines)
+
+    print("part 1:", part1(imem))
+    print("part 2:", part2(imem), sep="\n")
 
-for cycle, x in cycle_x:
-    r = (cycle - 1) // 40
-    c = (cycle - 1) % 40
-    # print(cycle, r, c, x)
-    crt.buf[r][c] = "#" if c in [x - 1, x, x + 1] else "."
 
-print("part 2:")
-print(crt.render())
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """Day 11: Monkey in the Middle"""
+import argparse
 import math
 import pathlib
-import sys
 from copy import deepcopy
 
 
@@ -104,8 +104,10 @@ def part2(monkeys):
 
 
 def main():
-    input_file = "input.txt" if len(sys.argv) == 1 else sys.argv[1]
-    lines = pathlib.Path(input_file).read_text().splitlines()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+    lines = pathlib.Path(args.f).read_text().splitlines()
 
     monkeys = parse_input(lines)
     # for monkey in monkeys:
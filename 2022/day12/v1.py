@@ -1,106 +1,86 @@
 """Day 12: Hill Climbing Algorithm"""
+import argparse
 import pathlib
-import sys
-from copy import deepcopy
-from time import sleep
+from functools import reduce
+from operator import or_
 
+import numpy as np
 
-def bfs_wavefronts(graph, node):
-    wavefront = {node}
-    wavefronts = [wavefront]
-    visited = {node}
-    # print(wavefront)
-    while wavefront := advance_wavefront(graph, wavefront, visited):
-        wavefronts.append(wavefront)
-        visited.update(wavefront)
-        # print(wavefront)
-    return wavefronts
+from aoc.bitgrid import BitGrid, bfs_layers
+from aoc.screen import BG_GREEN, BG_RED, RESET, Screen
 
-
-def advance_wavefront(graph, wavefront, visited):
-    new_wavefront = set()
-    for node in wavefront:
-        for new_node in graph[node]:
-            if new_node not in visited:
-                new_wavefront.add(new_node)
-    return new_wavefront
+SCREEN = Screen(fps=20)
 
 
 def display_wavefronts(grid, wavefronts, start, end):
-    BG_RED = "\033[41m"
-    BG_GREEN = "\033[42m"
-    RESET = "\033[0m"
-
     sr, sc = start
     er, ec = end
 
-    print("Wavefronts:")
-    for wfn in range(len(wavefronts)):
-        img = deepcopy(grid)
-        img[sr][sc] = img[sr][sc].upper()
-        img[er][ec] = img[er][ec].upper()
+    chars = [list(row) for row in grid]
+    chars[sr][sc] = chars[sr][sc].upper()
+    chars[er][ec] = chars[er][ec].upper()
+    img = [list(row) for row in chars]
+
+    # Only the last two wavefronts change colour from one frame to the next
+    for wfn, wf in enumerate(wavefronts):
+        if wfn > 0:
+            for r, c in wavefronts[wfn - 1]:
+                img[r][c] = BG_RED + chars[r][c] + RESET
+        for r, c in wf:
+            img[r][c] = BG_GREEN + chars[r][c] + RESET
+        SCREEN.draw(img, header=f"Wavefronts:\nwavefront {wfn}")
+    SCREEN.close()
 
-        for i, wf in enumerate(wavefronts):
-            for r, c in wf:
-                if i < wfn:
-                    img[r][c] = BG_RED + img[r][c] + RESET
-                elif i == wfn:
-                    img[r][c] = BG_GREEN + img[r][c] + RESET
-        img = "\n".join("".join(row) for row in img)
 
-        print("wavefront", wfn)
-        print(img)
-        sleep(0.05)
+def climbing_step(grid, allowed):
+    """The squares as a BitGrid, their bits by height, and a BFS step to the
+    neighbouring squares that allowed(from height, to height)"""
+    heights = np.array([[ord(h) for h in row] for row in grid])
+    squares = BitGrid(heights.shape)
+    levels = {h: squares.from_array(heights == h) for h in np.unique(heights).tolist()}
+    reachable = {
+        h: reduce(or_, (levels[k] for k in levels if allowed(h, k)), 0) for h in levels
+    }
 
+    def step(frontier):
+        next_frontier = 0
+        for h, at_h in levels.items():
+            if frontier & at_h:
+                next_frontier |= squares.spread(frontier & at_h, reachable[h])
+        return next_frontier
 
-def neighbors(r, c, num_rows, num_cols):
-    return [
-        (r + dr, c + dc)
-        for (dr, dc) in [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        if 0 <= r + dr < num_rows and 0 <= c + dc < num_cols
-    ]
+    return squares, levels, step
 
 
-def part1(grid, start, end):
-    num_rows, num_cols = len(grid), len(grid[0])
+def wavefronts_display(grid, squares, wavefronts, start, end):
+    display_wavefronts(grid, [set(squares.cells(wf)) for wf in wavefronts], start, end)
 
-    graph = {}
-    for r in range(num_rows):
-        for c in range(num_cols):
-            graph[(r, c)] = [
-                (nr, nc)
-                for nr, nc in neighbors(r, c, num_rows, num_cols)
-                if ord(grid[nr][nc]) - ord(grid[r][c]) <= 1
-            ]
 
-    wavefronts = bfs_wavefronts(graph, start)
+def part1(grid, start, end, display=False):
+    squares, _, step = climbing_step(grid, lambda h, k: k <= h + 1)
 
-    display_wavefronts(grid, wavefronts, start, end)
+    wavefronts = list(bfs_layers(squares.bit(start), step))
 
-    distances = [d for d, wf in enumerate(wavefronts) if end in wf]
+    if display:
+        wavefronts_display(grid, squares, wavefronts, start, end)
+
+    goal = squares.bit(end)
+    distances = [d for d, wf in enumerate(wavefronts) if wf & goal]
     # print(distances)
     return distances[0]
 
 
-def part2(grid, start, end):
-    num_rows, num_cols = len(grid), len(grid[0])
-
-    graph = {}
-    for r in range(num_rows):
-        for c in range(num_cols):
-            graph[(r, c)] = [
-                (nr, nc)
-                for nr, nc in neighbors(r, c, num_rows, num_cols)
-                if ord(grid[nr][nc]) - ord(grid[r][c]) >= -1
-            ]
+def part2(grid, start, end, display=False):
+    # Climbing down from the end, which is climbing up in reverse
+    squares, levels, step = climbing_step(grid, lambda h, k: k >= h - 1)
 
-    wavefronts = bfs_wavefronts(graph, end)
+    wavefronts = list(bfs_layers(squares.bit(end), step))
 
-    display_wavefronts(grid, wavefronts, start, end)
+    if display:
+        wavefronts_display(grid, squares, wavefronts, start, end)
 
-    distances = [
-        d for d, wf in enumerate(wavefronts) if "a" in {grid[r][c] for r, c in wf}
-    ]
+    lowest = levels[ord("a")]
+    distances = [d for d, wf in enumerate(wavefronts) if wf & lowest]
     # print(distances)
     return distances[0]
 
@@ -125,13 +105,16 @@ def parse_input(lines):
 
 
 def main():
-    input_file = "input.txt" if len(sys.argv) == 1 else sys.argv[1]
-    lines = pathlib.Path(input_file).read_text().splitlines()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument("-d", action="store_true", help="display")
+    args = parser.parse_args()
+    lines = pathlib.Path(args.f).read_text().splitlines()
 
     grid, start, end = parse_input(lines)
 
-    print("part 1:", part1(grid, start, end))
-    print("part 2:", part2(grid, start, end))
+    print("part 1:", part1(grid, start, end, display=args.d))
+    print("part 2:", part2(grid, start, end, display=args.d))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+"""Synthetic inputs for Day 13: Distress Signal"""
+import random
+
+PAIRS = 150  # size of input.txt
+
+
+def packet(rng, depth=0):
+    items = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return "[" + ",".join(items) + "]"
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    pairs = [f"{packet(rng)}\n{packet(rng)}\n" for _ in range(PAIRS * scale)]
+    return "\n".join(pairs)
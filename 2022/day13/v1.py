@@ -1,8 +1,8 @@
 """Day 13: Distress Signal"""
+import argparse
 import functools
 import math
 import pathlib
-import sys
 
 
 def compare(left, right):
@@ -42,8 +42,10 @@ def part2(packets, divider_packets):
 
 
 def main():
-    input_file = "input.txt" if len(sys.argv) == 1 else sys.argv[1]
-    input_text = pathlib.Path(input_file).read_text().strip()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
+    input_text = pathlib.Path(args.f).read_text().strip()
 
     paras = input_text.split("\n\n")
     pairs = [para.split("\n") for para in paras]
@@ -1,125 +1,142 @@
 """Day 14: Regolith Reservoir"""
+import argparse
 import pathlib
-import sys
-from copy import deepcopy
-from time import sleep
 from typing import NamedTuple, Optional
 
+import numpy as np
+
+from aoc.grid import Grid
+from aoc.screen import Screen, capture
+
 
 class Point(NamedTuple):
     x: int
     y: int
 
 
+# Cell contents. Sand falling into the abyss never comes to rest.
+EMPTY, ROCK, SAND, FLOOR, ABYSS = b".#o=~"
+
+# Down, down-left, down-right, as (dr, dc) in grid coordinates (r = y, c = x)
+FALL = [(1, 0), (1, -1), (1, 1)]
+
+# Thousands of grains: drop the frames the terminal can't keep up with
+SCREEN = Screen(fps=50, skip=True)
+
+
 class Cave:
-    def __init__(self, hole: Point):
-        self.rock = set()
-        self.sand = set()
+    def __init__(self, hole: Point, rock: set[Point], floor_dy: Optional[int] = None):
         self.hole = hole
-        self.floor_y: Optional[int] = None
-        self.bounds = (hole, hole)
-
-    def add_rock(self, point: Point):
-        self.rock.add(point)
-
-    def add_sand(self, point: Point):
-        self.sand.add(point)
-
-    def add_floor(self, dy: int):
-        self.floor_y = self.bounds[1].y + dy
-
-    def update_bounds(self):
-        min_x = min(self.rock, key=lambda p: p.x).x
-        max_x = max(self.rock, key=lambda p: p.x).x
-        min_y = min(self.rock, key=lambda p: p.y).y
-        max_y = max(self.rock, key=lambda p: p.y).y
-        assert min_x <= self.hole.x <= max_x
-        assert self.hole.y <= min_y <= max_y
-        min_y = self.hole.y
+        self.sand = 0
+
+        min_x = min(p.x for p in rock)
+        max_x = max(p.x for p in rock)
+        min_y = min(p.y for p in rock)
+        max_y = max(p.y for p in rock)
+        assert min_x <= hole.x <= max_x
+        assert hole.y <= min_y <= max_y
+        min_y = hole.y
         self.bounds = Point(min_x, min_y), Point(max_x, max_y)
 
-    def inside(self, pos: Point) -> bool:
-        min_x, min_y = self.bounds[0]
-        max_x, max_y = self.bounds[1]
-        if self.floor_y is not None:
-            return min_y <= pos.y <= self.floor_y
-        return min_x <= pos.x <= max_x and min_y <= pos.y <= max_y
-
-    def blocked(self, pos: Point) -> bool:
-        return (
-            pos in self.rock
-            or pos in self.sand
-            or (self.floor_y is not None and pos.y == self.floor_y)
-        )
-
-    def next_pos(self, pos: Point) -> Point | None:
-        for dx, dy in [(0, 1), (-1, 1), (1, 1)]:
-            p = Point(pos.x + dx, pos.y + dy)
-            if not self.blocked(p):
-                return p
+        # Without a floor, sand leaving the bounds of the rock falls into the
+        # abyss. With one, it piles up at most floor_y to either side of the hole.
+        self.floor_y = None if floor_dy is None else max_y + floor_dy
+        depth = max_y if self.floor_y is None else self.floor_y
+        self.x0 = min(min_x, hole.x - depth)
+        x1 = max(max_x, hole.x + depth)
+
+        cells = np.full((depth + 1, x1 - self.x0 + 1), ABYSS, dtype=np.uint8)
+        if self.floor_y is None:
+            cells[min_y : max_y + 1, min_x - self.x0 : max_x - self.x0 + 1] = EMPTY
+        else:
+            cells[:] = EMPTY
+            cells[self.floor_y] = FLOOR
+        for p in rock:
+            cells[p.y, p.x - self.x0] = ROCK
+        self.grid = Grid(cells, fill=ABYSS)
+        self.cells = self.grid.cells
+        self.fall = self.grid.offsets(FALL)
+
+    def index(self, pos: Point) -> int:
+        return self.grid.index(pos.y, pos.x - self.x0)
+
+    def next_pos(self, i: int) -> int | None:
+        cells = self.cells
+        for offset in self.fall:
+            if cells[i + offset] in (EMPTY, ABYSS):
+                return i + offset
         return None
 
-    def resting_pos(self, pos: Point) -> Point | None:
+    def resting_pos(self, pos: Point) -> int | None:
+        i = self.index(pos)
         while True:
-            next_pos = self.next_pos(pos)
-            if next_pos is None:
-                return pos
-            if not self.inside(next_pos):
+            next_i = self.next_pos(i)
+            if next_i is None:
+                return i
+            if self.cells[next_i] == ABYSS:
                 return None
-            pos = next_pos
+            i = next_i
+
+    def add_sand(self, i: int):
+        self.cells[i] = SAND
+        self.sand += 1
 
     def render(self) -> str:
-        self.update_bounds()
         min_x, min_y = self.bounds[0]
         max_x, max_y = self.bounds[1]
-        img = []
-        for y in range(min_y, max_y + 1):
-            row = []
-            for x in range(min_x, max_x + 1):
-                if (x, y) in self.rock:
-                    row.append("#")
-                elif (x, y) in self.sand:
-                    row.append("o")
-                elif (x, y) == self.hole:
-                    row.append("+")
-                elif self.floor_y is not None and y == self.floor_y:
-                    row.append("=")
-                else:
-                    row.append(".")
-            img.append("".join(row))
-        return "\n".join(img)
+        cells = self.grid.inner
+        if self.floor_y is not None:
+            xs = np.flatnonzero((cells == SAND).any(axis=0)) + self.x0
+            min_x, max_x = min([min_x, *xs.tolist()]), max([max_x, *xs.tolist()])
+            max_y = self.floor_y
+        img = cells[min_y : max_y + 1, min_x - self.x0 : max_x - self.x0 + 1].copy()
+        img[img == ABYSS] = ord(".")
+        hole = self.hole.y - min_y, self.hole.x - min_x
+        if img[hole] != SAND:
+            img[hole] = ord("+")
+        return "\n".join(row.tobytes().decode() for row in img)
 
 
 def part1(cave: Cave, render=False):
-    while resting_pos := cave.resting_pos(cave.hole):
+    while (resting_pos := cave.resting_pos(cave.hole)) is not None:
         cave.add_sand(resting_pos)
         if render:
-            print(len(cave.sand))
-            print(cave.render())
-            sleep(0.02)
+            SCREEN.draw(lambda: cave.render().splitlines(), header=f"{cave.sand}")
+    if render:
+        SCREEN.close()
 
-    return len(cave.sand)
+    return cave.sand
 
 
 def part2(cave: Cave, render=False):
-    while resting_pos := cave.resting_pos(cave.hole):
+    hole = cave.index(cave.hole)
+    while (resting_pos := cave.resting_pos(cave.hole)) is not None:
         cave.add_sand(resting_pos)
         if render:
-            print(len(cave.sand), resting_pos)
-            print(cave.render())
-            sleep(0.02)
-        if resting_pos == cave.hole:
+            SCREEN.draw(
+                lambda: cave.render().splitlines(),
+                header=f"{cave.sand} {cave.grid.position(resting_pos)}",
+            )
+        if resting_pos == hole:
             break
+    if render:
+        SCREEN.close()
 
-    return len(cave.sand)
+    return cave.sand
 
 
 def main():
-    input_file = "input.txt" if len(sys.argv) == 1 else sys.argv[1]
-    lines = pathlib.Path(input_file).read_text().splitlines()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument("-d", action="store_true", help="display")
+    parser.add_argument("-c", metavar="FILE", help="capture the display to FILE (see bin/play.py)")
+    args = parser.parse_args()
+    if args.c:
+        capture(args.c)
+    lines = pathlib.Path(args.f).read_text().splitlines()
     paths = [line.split(" -> ") for line in lines]
 
-    cave = Cave(hole=Point(500, 0))
+    rock = set()
     for path in paths:
         points = []
         for x_y in path:
@@ -134,22 +151,20 @@ def main():
                 if dst_y < src_y:
                     src_y, dst_y = dst_y, src_y
                 for y in range(src_y, dst_y + 1):
-                    cave.add_rock(Point(x, y))
+                    rock.add(Point(x, y))
             else:
                 y = src_y
                 if dst_x < src_x:
                     src_x, dst_x = dst_x, src_x
                 for x in range(src_x, dst_x + 1):
-                    cave.add_rock(Point(x, y))
-    cave.update_bounds()
-    # print(cave.render())
+                    rock.add(Point(x, y))
 
-    cave1 = deepcopy(cave)
-    cave2 = cave
-    cave2.add_floor(dy=2)
+    cave1 = Cave(hole=Point(500, 0), rock=rock)
+    cave2 = Cave(hole=Point(500, 0), rock=rock, floor_dy=2)
+    # print(cave1.render())
 
-    print("part 1:", part1(cave1, render=False))
-    print("part 2:", part2(cave2, render=False))
+    print("part 1:", part1(cave1, render=args.d or bool(args.c)))
+    print("part 2:", part2(cave2, render=args.d or bool(args.c)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+"""Synthetic inputs for Day 15: Beacon Exclusion Zone
+
+The sensors sit on a square lattice over the search area, with radii of twice
+the lattice spacing so that they cover it several times over. The sensors that
+would cover the distress beacon have their radii cut to just miss it, which
+leaves it the only uncovered position.
+"""
+import math
+import random
+
+SENSORS = 28  # size of input.txt
+BOUND = 4000000
+ROW = 2000000
+
+# Generated inputs are not named input.txt, so pass the real row and bound
+ARGS = ("-y", str(ROW), "-b", str(BOUND))
+
+
+def generate(scale, seed=0, bound=BOUND):
+    rng = random.Random(seed)
+    k = math.ceil(math.sqrt(SENSORS * scale))
+    spacing = bound / (k - 1)
+    radius = round(2 * spacing)
+
+    # Keep the distress beacon off the lattice lines, late in the row scan
+    cell_x, cell_y = rng.randrange(k - 1), (k - 1) * 3 // 4
+    beacon_x = round((cell_x + rng.uniform(0.2, 0.8)) * spacing)
+    beacon_y = round((cell_y + rng.uniform(0.2, 0.8)) * spacing)
+
+    lines = []
+    for i in range(k):
+        for j in range(k):
+            x, y = round(i * spacing), round(j * spacing)
+            r = min(radius, abs(x - beacon_x) + abs(y - beacon_y) - 1)
+            dx = rng.randint(0, r)
+            bx = x + rng.choice([-1, 1]) * dx
+            by = y + rng.choice([-1, 1]) * (r - dx)
+            lines.append(
+                f"Sensor at x={x}, y={y}: closest beacon is at x={bx}, y={by}\n"
+            )
+    return "".join(lines)
@@ -1,69 +1,47 @@
 """Day 15: Beacon Exclusion Zone"""
-import pathlib
-import re
-import sys
+import argparse
 from typing import NamedTuple
 
+from aoc import parse
+from aoc.intervals import IntervalSet
+
 
 class Point(NamedTuple):
     x: int
     y: int
 
 
-class Interval(NamedTuple):
-    # [left, right)
-    left: int
-    right: int
-
-    def __str__(self):
-        return f"[{self.left}, {self.right})"
-
-
 def manhattan_distance(p0: Point, p1: Point):
     return abs(p0.x - p1.x) + abs(p0.y - p1.y)
 
 
-def part1(sb_pairs, row_y):
-    points = set()
-    for s, b in sb_pairs:
-        d = manhattan_distance(s, b)
-        dy = abs(row_y - s.y)
-        dx = d - dy
+def row_coverage(sensor_radius, y):
+    """The x-intervals of row y that are within the radius of some sensor"""
+    x_intervals = []
+    for s, r in sensor_radius:
+        dx = r - abs(y - s.y)
         if dx >= 0:
-            points.update(range(s.x - dx, s.x + dx + 1))
-        if b.y == row_y:
-            points.remove(b.x)
+            x_intervals.append((s.x - dx, s.x + dx + 1))
+    return IntervalSet(x_intervals)
+
 
-    return len(points)
+def part1(sb_pairs, row_y):
+    sensor_radius = [(s, manhattan_distance(s, b)) for s, b in sb_pairs]
+    beacons = IntervalSet((b.x, b.x + 1) for _, b in sb_pairs if b.y == row_y)
+    return (row_coverage(sensor_radius, row_y) - beacons).length
 
 
 def part2(sb_pairs, bound):
     # for each y:
-    # - find the x-interval that is within the radius of each sensor
-    # - find the union of the intervals by attempting to merge the intervals
-    # - if the merge fails because of non-overlap, that is out beacon
+    # - find the union of the x-intervals that are within the radius of each sensor
+    # - if it does not cover [0, bound], the gap is our beacon
     sensor_radius = [(s, manhattan_distance(s, b)) for s, b in sb_pairs]
     beacon = None
     for y in range(bound + 1):
-        x_intervals = []
-        for s, r in sensor_radius:
-            dy = abs(y - s.y)
-            dx = r - dy
-            if dx >= 0:
-                x_intervals.append(Interval(s.x - dx, s.x + dx + 1))
-
-        x_intervals.sort(key=lambda i: i.left)
-
-        merged_interval = x_intervals[0]
-        for interval in x_intervals[1:]:
-            if merged_interval.right < interval.left:
-                beacon = Point(merged_interval.right, y)
-                break
-            merged_interval = Interval(
-                merged_interval.left, max(merged_interval.right, interval.right)
-            )
-
-        if beacon is not None:
+        covered = row_coverage(sensor_radius, y)
+        if not covered.covers(0, bound + 1):
+            gap = IntervalSet([(0, bound + 1)]) - covered
+            beacon = Point(gap.start, y)
             break
 
     assert beacon is not None
@@ -71,32 +49,26 @@ def part2(sb_pairs, bound):
     return beacon.x * 4000000 + beacon.y
 
 
-RE_INT = re.compile(r"[+-]?\d+")
-
-
-def findall_ints(string: str) -> list:
-    return [int(n) for n in RE_INT.findall(string)]
-
-
 def main():
-    if len(sys.argv) == 1:
-        input_file = "input.txt"
-        row_number = 2000000
-        bound = 4000000
-    elif len(sys.argv) == 2:
-        input_file = sys.argv[1]
-        row_number = 10
-        bound = 20
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument("-y", type=int, help="row for part 1 (default: 2000000, or 10 for other inputs)")
+    parser.add_argument("-b", type=int, help="bound for part 2 (default: 4000000, or 20 for other inputs)")
+    args = parser.parse_args()
+
+    if args.f == "input.txt":
+        row_number, bound = 2000000, 4000000
     else:
-        input_file = sys.argv[1]
-        row_number = int(sys.argv[2])
-        bound = int(sys.argv[3])
+        row_number, bound = 10, 20
+    if args.y is not None:
+        row_number = args.y
+    if args.b is not None:
+        bound = args.b
 
-    lines = pathlib.Path(input_file).read_text().splitlines()
+    rows = parse.int_rows(parse.read(args.f), 4).tolist()
 
     sb_pairs = []
-    for line in lines:
-        sx, sy, bx, by = findall_ints(line)
+    for sx, sy, bx, by in rows:
         s = Point(sx, sy)
         b = Point(bx, by)
         sb_pairs.append((s, b))
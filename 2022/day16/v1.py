@@ -1,49 +1,31 @@
 """Day 16: Proboscidea Volcanium"""
+import argparse
 import pathlib
 import re
-import sys
 from functools import cache
 from typing import Tuple
 
+from aoc import counters
+from aoc.graph import Graph, all_pairs_shortest_paths
 
-def shortest_distance(graph, inf=int(1e6)):
+
+def shortest_distance(graph):
     # Floyd–Warshall algorithm: https://en.wikipedia.org/wiki/Floyd–Warshall_algorithm
-    distance = {}
-    for src in graph:
-        for dst in graph:
-            if src == dst:
-                distance[(src, dst)] = 0
-            elif dst in graph[src]:
-                distance[(src, dst)] = 1
-            else:
-                distance[(src, dst)] = inf
-
-    for mid in graph:
-        for src in graph:
-            for dst in graph:
-                distance[(src, dst)] = min(
-                    distance[(src, dst)], distance[(src, mid)] + distance[(mid, dst)]
-                )
-
-    # print("All-pair shortest distances:")
-    # print("   ", end="")
-    # for dst in graph:
-    #     print(f" {dst:3s}", end="")
-    # print()
-    # for src in graph:
-    #     print(f"{src}", end="")
-    #     for dst in graph:
-    #         print(f" {distance[(src, dst)]:3d}", end="")
-    #     print()
-
-    return distance
+    network = Graph((src, dst) for src in graph for dst in graph[src])
+    distance = all_pairs_shortest_paths(network).tolist()
+    return {
+        (src, dst): distance[network.id(src)][network.id(dst)]
+        for src in graph
+        for dst in graph
+    }
 
 
 class ValveNetwork:
     def __init__(self, graph: dict[str, list[str]], rates: dict[str, int], start: str, timeout: int):
         self.graph = graph
         self.rates = rates
-        self.dists = shortest_distance(self.graph)
+        with counters.timer("shortest_distance"):
+            self.dists = shortest_distance(self.graph)
         self.start = start
         self.timeout = timeout
 
@@ -107,6 +89,7 @@ def part1(graph, rates):
 
     print("max_flow:", max_flow)
     print("best_seq:", best_seq)
+    counters.cache_stats("open1", ValveNetwork.open1)
 
     return max_flow
 
@@ -126,17 +109,18 @@ def part2(graph, rates):
 
     print("max_flow:", max_flow1, "+", max_flow2, "=", max_flow)
     print("best_seq:", best_seq1, best_seq2)
+    counters.cache_stats("open1", ValveNetwork.open1)
+    counters.cache_stats("open2", ValveNetwork.open2)
 
     return max_flow
 
 
 def main():
-    if len(sys.argv) == 1:
-        input_file = "input.txt"
-    else:
-        input_file = sys.argv[1]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    args = parser.parse_args()
 
-    lines = pathlib.Path(input_file).read_text().splitlines()
+    lines = pathlib.Path(args.f).read_text().splitlines()
 
     graph = {}
     rates = {}
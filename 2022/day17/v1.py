@@ -1,7 +1,9 @@
 """Day 17: Pyroclastic Flow"""
+import argparse
 import pathlib
-import sys
-import time
+
+from aoc.cycles import find_cycle
+from aoc.screen import Screen, capture
 
 # 0  XXXX
 #
@@ -37,6 +39,9 @@ ROCK = [
     [0b11, 0b11],
 ]
 
+SCREEN1 = Screen(fps=1)
+SCREEN2 = Screen(fps=10)
+
 
 def rocks():
     n = 5
@@ -120,156 +125,137 @@ def part1(jet_pattern, stop_cnt, render):
             del chamber[-1]
 
         if render:
-            # clear screen: https://en.wikipedia.org/wiki/ANSI_escape_code
-            print("\033[2J")
-
-            print("chamber:", x, y, msb, lsb)
-            for c, chamber_row in enumerate(reversed(chamber)):
-                if c < 40:
-                    row = "".join(".#"[int(b)] for b in f"{chamber_row:07b}")
-                    print(row)
-            time.sleep(1)
+            SCREEN1.draw(chamber_rows(chamber), header=f"chamber: {x} {y} {msb} {lsb}")
 
         if num_rocks == stop_cnt:
             break
+    if render:
+        SCREEN1.close()
 
     return len(chamber)
 
 
-def part2(jet_pattern, stop_target, render):
-    # For part 2 stop_target being large (1e12), direct simulation is impossible.
-    # We rely on periodicity of input to hopefully find a periodicity in output.
-    move_gen = moves(jet_pattern)
-    move_idx, move = next(move_gen)
-    chamber = []
-    stop_cnt = 0
-    bottom_h = 0
-    states = {}
-    heights = {}
-    for rock_i, rock_w, rock_h, rock in rocks():
-        # find the period and height change every period
-        state = tuple(chamber) + (rock_i, move_idx)
-        height = bottom_h + len(chamber)
-        if state in states:
-            stop_cnt0 = states[state]
-            period = stop_cnt - stop_cnt0
-            delta_height = height - heights[stop_cnt0]
-            # print(f"stop_cnt={stop_cnt:3d} height={height:4d} state={state}", end=" ")
-            # print(f"repeat of: {stop_cnt0:3d}", end=" ")
-            # print(f"{period=}, {delta_height=}")
-            div_cnt = (stop_target - stop_cnt0) // period
-            mod_cnt = (stop_target - stop_cnt0) % period
-            chamber_h = div_cnt * delta_height + heights[stop_cnt0 + mod_cnt]
-            return chamber_h
-        else:
-            # print(f"stop_cnt={stop_cnt:3d} height={height:4d} state={state}")
-            states[state] = stop_cnt
-            heights[stop_cnt] = height
-
-        if stop_cnt == stop_target:
-            break
+def chamber_rows(chamber, max_rows=40):
+    """The top rows of the chamber, top first"""
+    return ["".join(".#"[int(b)] for b in f"{row:07b}") for row in chamber[: -max_rows - 1 : -1]]
+
+
+class Tower:
+    """The chamber above its highest full row, and what comes next"""
+
+    def __init__(self):
+        self.chamber = []
+        self.bottom_h = 0  # height of the rows trimmed off below the chamber
+        self.rock_i = 0
+        self.jet_i = 0
+
+    def fingerprint(self):
+        return tuple(self.chamber), self.rock_i, self.jet_i
+
+    def height(self):
+        return self.bottom_h + len(self.chamber)
+
+
+def drop_rock(tower, jet_pattern, render=False):
+    chamber = tower.chamber
+    rock_i = tower.rock_i
+    rock_w, rock_h = ROCK_WH[rock_i]
+    rock = ROCK[rock_i]
+
+    # create rock
+    chamber.extend([0] * (3 + rock_h))
+    x = 2
+    y = len(chamber) - rock_h
+    msb = 6 - x
+    lsb = msb - rock_w + 1
+
+    # move rock till stopped: pushed by a jet, then falling one unit, and so on
+    stopped = False
+    while not stopped:
+        move = jet_pattern[tower.jet_i]
+        tower.jet_i = (tower.jet_i + 1) % len(jet_pattern)
+        if (
+            move == "<"
+            and msb < 6
+            and not any(rock[r] << (lsb + 1) & chamber[y + r] for r in range(len(rock)))
+        ):
+            x -= 1
+        elif (
+            move == ">"
+            and lsb > 0
+            and not any(rock[r] << (lsb - 1) & chamber[y + r] for r in range(len(rock)))
+        ):
+            x += 1
 
-        # create rock
-        chamber.extend([0] * (3 + rock_h))
-        x = 2
-        y = len(chamber) - rock_h
         msb = 6 - x
         lsb = msb - rock_w + 1
 
-        # print("new rock:", x, y, msb, lsb, rock)
-        # for r, rock_row in enumerate(reversed(rock)):
-        #     print(f"{rock_row << lsb:07b}")
-
-        # move rock till stopped
-        stopped = False
-        while not stopped:
-            # print("move:", x, y, msb, lsb, move)
-            if (
-                move == "<"
-                and msb < 6
-                and not any(
-                    rock[r] << (lsb + 1) & chamber[y + r] for r in range(len(rock))
-                )
-            ):
-                x -= 1
-            elif (
-                move == ">"
-                and lsb > 0
-                and not any(
-                    rock[r] << (lsb - 1) & chamber[y + r] for r in range(len(rock))
-                )
-            ):
-                x += 1
-            elif move == "V" and y > 0:
-                if any(rock[r] << lsb & chamber[y + r - 1] for r in range(len(rock))):
-                    stopped = True
-                else:
-                    y -= 1
-            elif move == "V" and y == 0:
-                stopped = True
-
-            msb = 6 - x
-            lsb = msb - rock_w + 1
-
-            # print("rock:", x, y, msb, lsb)
-            # for r, rock_row in enumerate(reversed(rock)):
-            #     print(f"{rock_row << lsb:07b}")
-
-            move_idx, move = next(move_gen)
+        if y > 0 and not any(rock[r] << lsb & chamber[y + r - 1] for r in range(len(rock))):
+            y -= 1
+        else:
+            stopped = True
+
+    # add stopped rock to chamber
+    for r, rock_row in enumerate(rock):
+        chamber[y + r] |= rock_row << lsb
+    tower.rock_i = (rock_i + 1) % len(ROCK)
+
+    # remove empty top rows and bottom unreachable rows from chamber
+    bottom = 0
+    top = len(chamber) - 1
+    found_top = found_bottom = False
+    for c in range(len(chamber) - 1, -1, -1):
+        if found_top and found_bottom:
+            break
+        found_top = chamber[c] != 0
+        if not found_top:
+            top = c
+        found_bottom = chamber[c] == 0x7F
+        if found_bottom:
+            bottom = c
 
-        # add stopped rock to chamber
-        stop_cnt += 1
-        msb = 6 - x
-        lsb = msb - rock_w + 1
-        for r, rock_row in enumerate(rock):
-            chamber[y + r] |= rock_row << lsb
+    tower.bottom_h += bottom
+    tower.chamber = chamber[bottom:top]
 
-        # remove empty top rows and bottom unreachable rows from chamber
-        bottom = 0
-        top = len(chamber) - 1
-        found_top = found_bottom = False
-        # print(bottom, top, chamber)
-        for c in range(len(chamber) - 1, -1, -1):
-            if found_top and found_bottom:
-                break
-            found_top = chamber[c] != 0
-            if not found_top:
-                top = c
-            found_bottom = chamber[c] == 0x7F
-            if found_bottom:
-                bottom = c
-            # print(c, chamber[c], top, bottom, mask)
-
-        bottom_h += bottom
-        chamber = chamber[bottom:top]
-        chamber = chamber[:top]
-        # print(bottom, top, chamber)
+    if render:
+        SCREEN2.draw(
+            chamber_rows(tower.chamber),
+            header=f"chamber: {tower.bottom_h} {len(tower.chamber)}",
+        )
 
-        if render:
-            # clear screen: https://en.wikipedia.org/wiki/ANSI_escape_code
-            print("\033[2J")
+    return tower
 
-            print("chamber:", bottom_h, len(chamber))
-            for c, chamber_row in enumerate(reversed(chamber)):
-                if c < 40:
-                    row = "".join(".#"[int(b)] for b in f"{chamber_row:07b}")
-                    print(row)
-            time.sleep(1 / 10.0)
 
-    return bottom_h + len(chamber)
+def part2(jet_pattern, stop_target, render):
+    # For part 2 stop_target being large (1e12), direct simulation is impossible.
+    # We rely on periodicity of input to hopefully find a periodicity in output:
+    # the tower repeats once the chamber above its highest full row, the next
+    # rock and the next jet all do, after which every period adds the same height.
+    cycle = find_cycle(
+        Tower,
+        lambda tower: drop_rock(tower, jet_pattern, render),
+        key=Tower.fingerprint,
+        metric=Tower.height,
+    )
+    if render:
+        SCREEN2.close()
+    # print(f"{cycle.start=}, {cycle.period=}")
+    return cycle.extrapolate(stop_target)
 
 
 def main():
-    if len(sys.argv) == 1:
-        input_file = "input.txt"
-    else:
-        input_file = sys.argv[1]
-
-    jet_pattern = pathlib.Path(input_file).read_text().strip()
-
-    print("part 1:", part1(jet_pattern, 2022, render=False))
-    print("part 1 (2):", part2(jet_pattern, 2022, render=False))
-    print("part 2:", part2(jet_pattern, int(1e12), render=False))
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument("-c", metavar="FILE", help="capture the display to FILE (see bin/play.py)")
+    args = parser.parse_args()
+    if args.c:
+        capture(args.c)
+
+    jet_pattern = pathlib.Path(args.f).read_text().strip()
+
+    print("part 1:", part1(jet_pattern, 2022, render=bool(args.c)))
+    print("part 1 (2):", part2(jet_pattern, 2022, render=bool(args.c)))
+    print("part 2:", part2(jet_pattern, int(1e12), render=bool(args.c)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+"""Synthetic inputs for Day 18: Boiling Boulders
+
+The droplet is a cube with `scale` times the volume of the input.txt one, and
+about the same fraction of it is lava.
+"""
+import random
+
+SIZE = 22  # input.txt fits in a SIZE x SIZE x SIZE cube
+FILL = 0.25
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    size = round(SIZE * scale ** (1 / 3))
+    cubes = rng.sample(range(size**3), int(FILL * size**3))
+    return "".join(f"{c // size**2},{c // size % size},{c % size}\n" for c in cubes)
@@ -4,6 +4,8 @@ import argparse
 import pathlib
 from typing import NamedTuple
 
+from aoc.bitgrid import BitGrid, bfs_layers
+
 
 class Point(NamedTuple):
     x: int
@@ -58,37 +60,29 @@ def surface(lava):
 def outer_surface(lava):
     # To find the outer surface area of lava, we bound the lava in a box 1 unit
     # larger on all sides. We then fill the box with water, starting from one
-    # corner and identify all faces where water and lava make contact.
+    # corner and count the faces where water and lava make contact.
     xs = [c.x for c in lava]
     ys = [c.y for c in lava]
     zs = [c.z for c in lava]
     lo = Cube(min(xs) - 1, min(ys) - 1, min(zs) - 1)
     hi = Cube(max(xs) + 1, max(ys) + 1, max(zs) + 1)
 
-    def in_box(c: Cube):
-        return lo.x <= c.x <= hi.x and lo.y <= c.y <= hi.y and lo.z <= c.z <= hi.z
-
-    boundary = {lo}
-    filled = set()
-    water_surface = set()
-    while boundary:
-        next_boundary = set()
-        for water_cube in boundary:
-            next_boundary.update(
-                neighbor
-                for neighbor in water_cube.neighbors()
-                if in_box(neighbor)
-                and neighbor not in filled
-                and neighbor not in boundary
-                and neighbor not in lava
-            )
-            water_surface.symmetric_difference_update(water_cube.faces())
-        filled.update(boundary)
-        boundary = next_boundary
-
-    lava_surface = surface(lava)
-    water_lava_interface = water_surface.intersection(lava_surface)
-    return water_lava_interface
+    box = BitGrid((hi.x - lo.x + 1, hi.y - lo.y + 1, hi.z - lo.z + 1))
+    lava_bits = 0
+    for c in lava:
+        lava_bits |= box.bit((c.x - lo.x, c.y - lo.y, c.z - lo.z))
+    open_ = box.all & ~lava_bits
+
+    water = 0
+    for front in bfs_layers(box.bit((0, 0, 0)), lambda f: box.spread(f, open_)):
+        water |= front
+
+    # Every lava cube next to a water cube has a face on the outer surface
+    return sum(
+        (box.shift(water, axis, step) & lava_bits).bit_count()
+        for axis in range(3)
+        for step in (-1, 1)
+    )
 
 
 def main():
@@ -106,7 +100,7 @@ def main():
     surface_area = len(surface(lava))
     print("part 1:", surface_area)
 
-    outer_surface_area = len(outer_surface(lava))
+    outer_surface_area = outer_surface(lava)
     print("part 2:", outer_surface_area)
 
 
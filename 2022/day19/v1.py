@@ -1,10 +1,10 @@
 """Day 19: Not Enough Minerals"""
 
 import argparse
-import pathlib
-import re
 from copy import copy
 
+from aoc import counters, parse
+
 
 class BluePrint:
     def __init__(self, id_number, costs):
@@ -17,11 +17,13 @@ class BluePrint:
 
     def max_geodes(self, timeout):
         max_geos = 0
+        explored = 0
         states = [
             (1, dict(ore=0, cly=0, obs=0, geo=0), dict(ore=1, cly=0, obs=0, geo=0))
         ]
         while states:
             time, amts, bots = state = states.pop()
+            explored += 1
 
             if time == timeout:
                 if amts["geo"] + bots["geo"] > max_geos:
@@ -51,6 +53,7 @@ class BluePrint:
                 next_state = self.build(bot, state, timeout)
                 states.append(next_state)
 
+        counters.count("max_geodes states", explored)
         return max_geos
 
     def build(self, next_bot, state, timeout):
@@ -79,11 +82,10 @@ def main():
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
     args = parser.parse_args()
 
-    lines = pathlib.Path(args.f).read_text().splitlines()
+    rows = parse.int_rows(parse.read(args.f), 7).tolist()
 
     blueprints = []
-    for line in lines:
-        numbers = [int(n) for n in re.findall(r"\d+", line)]
+    for numbers in rows:
         blueprints.append(
             BluePrint(
                 id_number=numbers[0],
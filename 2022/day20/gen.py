@@ -0,0 +1,12 @@
+"""Synthetic inputs for Day 20: Grove Positioning System"""
+
+import random
+
+NUMBERS = 5000  # size of input.txt
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10000) for _ in range(NUMBERS * scale)]
+    numbers[rng.randrange(len(numbers))] = 0
+    return "".join(f"{n}\n" for n in numbers)
@@ -3,14 +3,16 @@
 import argparse
 import pathlib
 import re
-import time
 from typing import NamedTuple
 
+from aoc.screen import BG_GREEN, RESET, Screen
 
 FACE = ">v<^"
 STEP = [(0, +1), (+1, 0), (0, -1), (-1, 0)]
 TURN = dict(R=1, L=-1)
 
+SCREEN = Screen(fps=20)
+
 # Hard-coding the cube-nets for now
 FACES1 = {
     "U": (0, 2),
@@ -146,6 +148,8 @@ def part1(grid, moves, display=False):
                     f"step: {i + 1} of {steps} pos: {pos}, facing: {FACE[face]}",
                 )
 
+    if display:
+        SCREEN.close()
     print(f"final pos: {pos}, facing: {FACE[face]}")
     r, c = pos
     return 1000 * (r + 1) + 4 * (c + 1) + face
@@ -184,30 +188,29 @@ def bounds(grid, axis=0):
 
 
 def render(grid, pos, marker, header=""):
-    CLEAR_SCREEN = "\033[2J"
-    BG_GREEN = "\033[42m"
-    RESET = "\033[0m"
     marker = BG_GREEN + marker + RESET
 
-    R, C = len(grid), len(grid[0])
-    DR = 80
-    if R > DR:
-        R0 = max(0, pos[0] - DR // 2)
-        R1 = R0 + DR
-        if R1 >= R:
-            R1 = R
-            R0 = R1 - DR
-    else:
-        R0, R1 = 0, R
+    def frame():
+        R = len(grid)
+        DR = 80
+        if R > DR:
+            R0 = max(0, pos[0] - DR // 2)
+            R1 = R0 + DR
+            if R1 >= R:
+                R1 = R
+                R0 = R1 - DR
+        else:
+            R0, R1 = 0, R
+
+        img = []
+        for r in range(R0, R1):
+            row = list(grid[r])
+            if r == pos[0]:
+                row[pos[1]] = marker
+            img.append(row)
+        return img
 
-    img = []
-    for r in range(R0, R1):
-        row = []
-        for c in range(C):
-            row.append(marker if (r, c) == pos else grid[r][c])
-        img.append("".join(row))
-    print(CLEAR_SCREEN + header + "\n" + "\n".join(img))
-    time.sleep(0.05)
+    SCREEN.draw(frame, header)
 
 
 class CubeNet:
@@ -279,30 +282,7 @@ class CubeNet:
                 self.render(f"step: {i + 1} of {steps} pos: {self.pos}")
 
     def render(self, header=""):
-        CLEAR_SCREEN = "\033[2J"
-        BG_GREEN = "\033[42m"
-        RESET = "\033[0m"
-        marker = BG_GREEN + self.pos.f + RESET
-
-        R, C = len(self.grid), len(self.grid[0])
-        DR = 80
-        if R > DR:
-            R0 = max(0, self.pos.r - DR // 2)
-            R1 = R0 + DR
-            if R1 >= R:
-                R1 = R
-                R0 = R1 - DR
-        else:
-            R0, R1 = 0, R
-
-        img = []
-        for r in range(R0, R1):
-            row = []
-            for c in range(C):
-                row.append(marker if (r, c) == (self.pos.r, self.pos.c) else self.grid[r][c])
-            img.append("".join(row))
-        print(CLEAR_SCREEN + header + "\n" + "\n".join(img))
-        time.sleep(0.05)
+        render(self.grid, (self.pos.r, self.pos.c), self.pos.f, header)
 
 
 def part2(grid, moves, display=False):
@@ -323,6 +303,8 @@ def part2(grid, moves, display=False):
         else:
             net.step(int(move), display)
 
+    if display:
+        SCREEN.close()
     print(f"final pos: {net.pos}")
     return 1000 * (net.pos.r + 1) + 4 * (net.pos.c + 1) + net.pos.facing()
 
@@ -5,6 +5,8 @@ import pathlib
 from copy import copy
 from typing import NamedTuple
 
+from aoc.screen import Screen, capture
+
 
 class Position(NamedTuple):
     r: int
@@ -17,6 +19,9 @@ class Position(NamedTuple):
         return Position(self.r + other[0], self.c + other[1])
 
 
+SCREEN = Screen(fps=30, skip=True)
+
+
 class Grove:
     edge_dirs = dict(
         N=["N", "NW", "NE"],
@@ -99,13 +104,19 @@ class Grove:
         return self.area() - len(self.elves)
 
     def render(self, header=""):
-        img = []
-        nw_corner, se_corner = self.region()
-        for r in range(nw_corner.r, se_corner.r + 1):
-            for c in range(nw_corner.c, se_corner.c + 1):
-                img.append("#" if (r, c) in self.elves else ".")
-            img.append("\n")
-        print(header + "\n" + "".join(img))
+        def frame():
+            img = []
+            nw_corner, se_corner = self.region()
+            for r in range(nw_corner.r, se_corner.r + 1):
+                img.append(
+                    "".join(
+                        "#" if (r, c) in self.elves else "."
+                        for c in range(nw_corner.c, se_corner.c + 1)
+                    )
+                )
+            return img
+
+        SCREEN.draw(frame, header)
 
 
 def part1(grove: Grove, num_rounds: int, display: bool):
@@ -116,6 +127,8 @@ def part1(grove: Grove, num_rounds: int, display: bool):
         moved = grove.round()
         if display:
             grove.render(header=f"round: {i}, {moved=}")
+    if display:
+        SCREEN.close()
 
     return grove.empty_ground()
 
@@ -132,6 +145,7 @@ def part2(grove: Grove, display: bool):
 
     if display:
         grove.render(header=f"round: {i}, {moved=}")
+        SCREEN.close()
 
     return i
 
@@ -140,7 +154,11 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
     parser.add_argument("-d", action="store_true", help="display")
+    parser.add_argument("-c", metavar="FILE", help="capture the display to FILE (see bin/play.py)")
     args = parser.parse_args()
+    if args.c:
+        capture(args.c)
+    display = args.d or bool(args.c)
 
     lines = pathlib.Path(args.f).read_text().strip().split("\n")
     R = len(lines)
@@ -154,8 +172,8 @@ def main():
     grove1 = Grove(copy(elves))
     grove2 = Grove(elves)
 
-    print("part 1:", part1(grove=grove1, num_rounds=10, display=args.d))
-    print("part 2:", part2(grove=grove2, display=args.d))
+    print("part 1:", part1(grove=grove1, num_rounds=10, display=display))
+    print("part 2:", part2(grove=grove2, display=display))
 
 
 if __name__ == "__main__":
@@ -1,83 +1,89 @@
 """Day 24: Blizzard Basin"""
 import argparse
 import pathlib
-import time
 from itertools import count
 
+import numpy as np
 
-def trek(valley, R, C, start, goal, display):
-    expedition = {start}
+from aoc.bitgrid import BitGrid
+from aoc.screen import FG_GREEN, RESET, Screen, capture
+
+BLIZZARDS = "^v<>"
+
+SCREEN = Screen(fps=30)
+
+
+class Valley:
+    """The walls and the blizzards of each direction, as BitGrid bits"""
+
+    def __init__(self, lines):
+        chars = np.array([list(line) for line in lines])
+        self.grid = BitGrid(chars.shape)
+        self.R, self.C = chars.shape
+        self.open = self.grid.from_array(chars != "#")
+        self.blizzards = {b: self.grid.from_array(chars == b) for b in BLIZZARDS}
+
+    def blizzard_step(self):
+        """Move every blizzard one step, wrapping around inside the walls"""
+        roll, R, C = self.grid.roll, self.R, self.C
+        b = self.blizzards
+        self.blizzards = {
+            "^": roll(b["^"], 0, -1, 1, R - 1),
+            "v": roll(b["v"], 0, +1, 1, R - 1),
+            "<": roll(b["<"], 1, -1, 1, C - 1),
+            ">": roll(b[">"], 1, +1, 1, C - 1),
+        }
+
+    def expedition_step(self, expedition):
+        """Wait or step to every open cell that has no blizzard"""
+        clear = self.open
+        for bits in self.blizzards.values():
+            clear &= ~bits
+        return (expedition | self.grid.neighbours(expedition)) & clear
+
+
+def trek(valley, start, goal, display):
+    expedition = valley.grid.bit(start)
+    goal = valley.grid.bit(goal)
     for t in count(0):
         if display:
-            render(valley, expedition, R, C, header=f"{t=}\n")
-            time.sleep(1/30)
+            SCREEN.draw(lambda: render(valley, expedition), header=f"{t=}")
 
-        if goal in expedition:
-            return t, valley
+        if expedition & goal:
+            if display:
+                SCREEN.close()
+            return t
 
-        valley = blizzard_step(valley, R, C)
-        expedition = expedition_step(valley, expedition, R, C)
+        valley.blizzard_step()
+        expedition = valley.expedition_step(expedition)
 
-    return None, None
+    return None
 
 
-def render(valley, expedition, R, C, header=""):
-    CLEAR_SCREEN = "\033[2J"
-    FG_GREEN = "\033[32m"
-    RESET = "\033[0m"
+def render(valley, expedition):
     E = FG_GREEN + "E" + RESET
 
+    walls = ~valley.grid.to_array(valley.open)
+    blizzards = {b: valley.grid.to_array(bits) for b, bits in valley.blizzards.items()}
+    expedition = valley.grid.to_array(expedition)
+
     img = []
-    for r in range(R):
-        for c in range(C):
-            v = valley[(r, c)]
-            assert (r, c) not in expedition or not v, ((r, c), v, expedition)
+    for r in range(valley.R):
+        row = []
+        for c in range(valley.C):
+            if walls[r, c]:
+                v = ["#"]
+            else:
+                v = [b for b in BLIZZARDS if blizzards[b][r, c]]
+            assert not expedition[r, c] or not v, ((r, c), v)
             if len(v) == 0:
-                img.append(E if (r, c) in expedition else ".")
+                row.append(E if expedition[r, c] else ".")
             elif len(v) == 1:
-                img.append(v[0])
-            else:
-                img.append(str(len(v)))
-        img.append("\n")
-    print(CLEAR_SCREEN + header + "".join(img))
-
-
-def blizzard_step(valley, R, C):
-    next_valley = {}
-    for r in range(R):
-        for c in range(C):
-            if 0 < r < R - 1 and 0 < c < C - 1:
-                next_valley[(r, c)] = []
+                row.append(v[0])
             else:
-                next_valley[(r, c)] = valley[(r, c)]
-
-    for r in range(1, R - 1):
-        for c in range(1, C - 1):
-            for b in valley[(r, c)]:
-                if b == "^":
-                    r_next = R - 2 if r == 1 else r - 1
-                    next_valley[(r_next, c)].append(b)
-                elif b == "v":
-                    r_next = 1 if r == R - 2 else r + 1
-                    next_valley[(r_next, c)].append(b)
-                elif b == "<":
-                    c_next = C - 2 if c == 1 else c - 1
-                    next_valley[(r, c_next)].append(b)
-                elif b == ">":
-                    c_next = 1 if c == C - 2 else c + 1
-                    next_valley[(r, c_next)].append(b)
-
-    return next_valley
-
-
-def expedition_step(valley, expedition, R, C):
-    next_expedition = set()
-    for r, c in expedition:
-        for dr, dc in ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)):
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < R and 0 <= nc < C and not valley[(nr, nc)]:
-                next_expedition.add((nr, nc))
-    return next_expedition
+                row.append(str(len(v)))
+        img.append(row)
+    return img
 
 
 def main():
@@ -86,23 +92,24 @@ def main():
         "-f", default="input.txt", help="input txt file (default: input.txt)"
     )
     parser.add_argument("-d", action="store_true", help="display")
+    parser.add_argument("-c", metavar="FILE", help="capture the display to FILE (see bin/play.py)")
     args = parser.parse_args()
+    if args.c:
+        capture(args.c)
+    display = args.d or bool(args.c)
 
     lines = pathlib.Path(args.f).read_text().splitlines()
 
-    R, C = len(lines), len(lines[0])
-    valley0 = {}
-    for r in range(R):
-        for c in range(C):
-            blizzard = lines[r][c]
-            valley0[(r, c)] = [] if blizzard == "." else [blizzard]
+    valley = Valley(lines)
 
+    R = len(lines)
     start = 0, lines[0].index(".")
     goal = R - 1, lines[R - 1].index(".")
 
-    t1, valley1 = trek(valley0, R, C, start=start, goal=goal, display=args.d)
-    t2, valley2 = trek(valley1, R, C, start=goal, goal=start, display=args.d)
-    t3, valley3 = trek(valley2, R, C, start=start, goal=goal, display=args.d)
+    # The trips carry on from where the blizzards were at the end of the last one
+    t1 = trek(valley, start=start, goal=goal, display=display)
+    t2 = trek(valley, start=goal, goal=start, display=display)
+    t3 = trek(valley, start=start, goal=goal, display=display)
     print("times:", t1, t2, t3)
     print("part 1:", t1)
     print("part 2:", t1 + t2 + t3)
@@ -0,0 +1,19 @@
+"""Synthetic inputs for Day 25: Full of Hot Air"""
+
+import random
+
+NUMBERS = 101  # size of input.txt
+DIGITS = "=-012"
+
+
+def snafu(n):
+    digits = []
+    while n:
+        n, d = divmod(n + 2, 5)
+        digits.append(DIGITS[d])
+    return "".join(reversed(digits))
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    return "".join(f"{snafu(rng.randint(1, 5**20))}\n" for _ in range(NUMBERS * scale))
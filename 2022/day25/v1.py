@@ -44,7 +44,7 @@ def main():
 
     snafus = [parse_snafu(line) for line in lines]
     total = sum(from_snafu(s) for s in snafus)
-    print("print 1:", format_snafu(to_snafu(total)))
+    print("part 1:", format_snafu(to_snafu(total)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+"""Synthetic inputs for Day 1: Trebuchet?!"""
+
+import random
+import string
+
+LINES = 1000  # size of input.txt
+WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def line(rng):
+    tokens = [rng.choice("123456789")]
+    for _ in range(rng.randint(2, 8)):
+        kind = rng.random()
+        if kind < 0.3:
+            tokens.append(rng.choice("123456789"))
+        elif kind < 0.6:
+            tokens.append(rng.choice(WORDS))
+        else:
+            tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+    rng.shuffle(tokens)
+    return "".join(tokens)
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    return "".join(f"{line(rng)}\n" for _ in range(LINES * scale))
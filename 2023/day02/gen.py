@@ -0,0 +1,19 @@
+"""Synthetic inputs for Day 2: Cube Conundrum"""
+
+import random
+
+GAMES = 100  # size of input.txt
+
+
+def draw(rng):
+    colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+    return ", ".join(f"{rng.randint(1, 20)} {color}" for color in colors)
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for game in range(1, GAMES * scale + 1):
+        draws = "; ".join(draw(rng) for _ in range(rng.randint(1, 6)))
+        lines.append(f"Game {game}: {draws}\n")
+    return "".join(lines)
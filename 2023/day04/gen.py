@@ -0,0 +1,24 @@
+"""Synthetic inputs for Day 4: Scratchcards"""
+
+import random
+
+CARDS = 202  # size of input.txt
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    cards = CARDS * scale
+    lines = []
+    for card in range(1, cards + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning = numbers[:10]
+        have = numbers[10:]
+        # Never win copies of cards past the end of the table
+        matches = min(rng.choice([0, 0, 0, 0, 1, 1, 2, 3, 5, 10]), cards - card)
+        have[:matches] = winning[:matches]
+        rng.shuffle(have)
+        lines.append(
+            f"Card {card:3d}: {' '.join(f'{n:2d}' for n in winning)}"
+            f" | {' '.join(f'{n:2d}' for n in have)}\n"
+        )
+    return "".join(lines)
@@ -6,6 +6,8 @@ import math
 import pathlib
 import re
 
+from aoc.cycles import find_cycle
+
 
 def part1(network, instructions):
     inst = itertools.cycle(instructions)
@@ -22,28 +24,17 @@ def part1(network, instructions):
 def part2(network, instructions):
     num_insts = len(instructions)
     start_nodes = [node for node in network if node.endswith("A")]
+
+    # A ghost's (node, t % num_insts) determines where it goes next
+    def step(state):
+        node, i = state
+        return network[node][instructions[i]], (i + 1) % num_insts
+
     periods = []
     for start_node in start_nodes:
-        inst = itertools.cycle(instructions)
-
-        states = {}
-        sequence = []
-        node = start_node
-        t = 0
-        while (node, t % num_insts) not in states:
-            # print(t, t % num_insts, node)
-            states[(node, t % num_insts)] = t
-            sequence.append(node[-1])
-            node = network[node][next(inst)]
-            t += 1
-
-        t_repeat = states[(node, t % num_insts)]
-
-        # offset = sequence.index("Z")
-        period = len(sequence) - t_repeat
-        # print(offset, period)
-
-        periods.append(period)
+        cycle = find_cycle(lambda: (start_node, 0), step)
+        # print(cycle.start, cycle.period)
+        periods.append(cycle.period)
 
     return math.lcm(*periods)
 
@@ -0,0 +1,20 @@
+"""Synthetic inputs for Day 9: Mirage Maintenance
+
+Every history is a random polynomial of degree at most six, sampled at
+consecutive points, so the difference sequences always reach zero.
+"""
+
+import random
+
+HISTORIES = 200  # size of input.txt
+VALUES = 21
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(HISTORIES * scale):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        values = [sum(a * x**i for i, a in enumerate(coefficients)) for x in range(VALUES)]
+        lines.append(" ".join(map(str, values)) + "\n")
+    return "".join(lines)
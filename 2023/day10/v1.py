@@ -6,6 +6,10 @@
 import argparse
 import pathlib
 
+import numpy as np
+
+from aoc.bitgrid import BitGrid, bfs_layers
+
 TILE_DNBRS = {
     "|": {(-1, 0), (1, 0)},
     "-": {(0, -1), (0, 1)},
@@ -63,23 +67,17 @@ def find_loop(graph, S):
 
 def find_interior(boundary, grid, R, C):
     assert grid[0][0] == ".", grid[0][0]
-    front = {(0, 0)}
-    filled = set(boundary)
-    step = -1
-    while front:
-        step += 1
-        # print(step, front)
-        next_front = set()
-        for node in front:
-            r, c = node
-            for dr, dc in ((0, -1), (0, 1), (-1, 0), (1, 0)):
-                nbr = nr, nc = r + dr, c + dc
-                if 0 <= nr < R and 0 <= nc < C and nbr not in filled:
-                    next_front.add(nbr)
-        filled.update(front)
-        front = next_front
-    whole = set((r, c) for r in range(R) for c in range(C))
-    return whole - filled
+    tiles = BitGrid((R, C))
+    loop = np.zeros((R, C), dtype=bool)
+    loop[tuple(zip(*boundary))] = True
+    non_loop = ~tiles.from_array(loop) & tiles.all
+
+    # Flood the outside from the corner through the tiles off the loop; the
+    # interior is the rest of them
+    outside = 0
+    for front in bfs_layers(tiles.bit((0, 0)), lambda f: tiles.spread(f, non_loop)):
+        outside |= front
+    return tiles, non_loop & ~outside
 
 
 def part1(grid, R, C):
@@ -108,10 +106,12 @@ def part2(grid, R, C):
     graph3x, _ = make_graph(grid3x, 3 * R, 3 * C)
     S3x = S[0] * 3 + 1, S[1] * 3 + 1
     boundary3x = find_loop(graph3x, S3x)
-    interior3x = find_interior(boundary3x, grid3x, 3 * R, 3 * C)
-    interior1x = {(r, c) for r, c in interior3x if r % 3 == 1 and c % 3 == 1}
-    # print(interior1x)
-    return len(interior1x)
+    tiles3x, interior3x = find_interior(boundary3x, grid3x, 3 * R, 3 * C)
+    centers = np.zeros((3 * R, 3 * C), dtype=bool)
+    centers[1::3, 1::3] = True
+    interior1x = interior3x & tiles3x.from_array(centers)
+    # print(tiles3x.cells(interior1x))
+    return interior1x.bit_count()
 
 
 # noinspection DuplicatedCode
@@ -0,0 +1,28 @@
+"""Synthetic inputs for Day 11: Cosmic Expansion
+
+The image is square, with `scale` times the area of input.txt, and some rows
+and columns are kept empty so that they expand.
+"""
+
+import math
+import random
+
+SIZE = 140  # input.txt is SIZE x SIZE
+DENSITY = 0.022
+EMPTY = 0.06
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    size = round(SIZE * math.sqrt(scale))
+    empty_cols = {c for c in range(size) if rng.random() < EMPTY}
+    lines = []
+    for _ in range(size):
+        if rng.random() < EMPTY:
+            lines.append("." * size)
+            continue
+        lines.append("".join(
+            "#" if c not in empty_cols and rng.random() < DENSITY else "."
+            for c in range(size)
+        ))
+    return "\n".join(lines) + "\n"
@@ -4,6 +4,8 @@ import argparse
 import pathlib
 from functools import cache
 
+from aoc import counters
+
 
 @cache
 def arrangements(groups: tuple[int], conditions: str) -> int:
@@ -37,6 +39,7 @@ def partx(records, copies=1):
         n = arrangements(groups, conditions)
         total_arrangements += n
         # print(conditions[:-1], groups, "->", n)
+    counters.cache_stats("arrangements", arrangements)
 
     return total_arrangements
 
@@ -1,7 +1,8 @@
 """Day 13: Point of Incidence"""
 
 import argparse
-import pathlib
+
+from aoc import parse
 
 
 TBL = str.maketrans({".": "0", "#": "1"})
@@ -44,7 +45,7 @@ def main():
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
     args = parser.parse_args()
 
-    chunks = pathlib.Path(args.f).read_text().split("\n\n")
+    chunks = parse.paragraphs(parse.read(args.f))
     patterns = [chunk.splitlines() for chunk in chunks]
 
     print("part 1:", partx(patterns, smudges=0))
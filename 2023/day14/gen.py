@@ -0,0 +1,18 @@
+"""Synthetic inputs for Day 14: Parabolic Reflector Dish
+
+The platform is square, with `scale` times the area of input.txt.
+"""
+
+import math
+import random
+
+SIZE = 100  # input.txt is SIZE x SIZE
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    size = round(SIZE * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices(".O#", weights=[70, 20, 10], k=size)) + "\n"
+        for _ in range(size)
+    )
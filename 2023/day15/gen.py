@@ -0,0 +1,22 @@
+"""Synthetic inputs for Day 15: Lens Library"""
+
+import random
+import string
+
+STEPS = 4000  # size of input.txt
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(STEPS // 8)
+    ]
+    steps = []
+    for _ in range(STEPS * scale):
+        label = rng.choice(labels)
+        if rng.random() < 0.6:
+            steps.append(f"{label}={rng.randint(1, 9)}")
+        else:
+            steps.append(f"{label}-")
+    return ",".join(steps) + "\n"
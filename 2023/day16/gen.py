@@ -0,0 +1,18 @@
+"""Synthetic inputs for Day 16: The Floor Will Be Lava
+
+The contraption is square, with `scale` times the area of input.txt.
+"""
+
+import math
+import random
+
+SIZE = 110  # input.txt is SIZE x SIZE
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    size = round(SIZE * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices(".|-/\\", weights=[90, 2.5, 2.5, 2.5, 2.5], k=size)) + "\n"
+        for _ in range(size)
+    )
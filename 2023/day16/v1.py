@@ -3,28 +3,17 @@
 import argparse
 import pathlib
 from collections import defaultdict
-from typing import NamedTuple
 
+from aoc.grid import Grid
 
-class Vec(NamedTuple):
-    r: int
-    c: int
-
-    def __add__(self, other):
-        r, c = other
-        return Vec(self.r + r, self.c + c)
-
-
-Tile = Vec
-Beam = Vec
-Node = tuple[Tile, Beam]
+Tile = int  # flat index into the contraption grid
+Beam = int  # direction, an index into BEAM_STEPS
+Node = int  # 4 * tile + beam
 
 
 # Beam directions
-E = Beam(0, 1)
-N = Beam(-1, 0)
-W = Beam(0, -1)
-S = Beam(1, 0)
+E, N, W, S = range(4)
+BEAM_STEPS = [(0, 1), (-1, 0), (0, -1), (1, 0)]
 
 BEAMS = {E: ">", N: "^", W: "<", S: "v"}
 
@@ -53,34 +42,41 @@ class Contraption:
     def __init__(self, grid: list[str]):
         self.R = len(grid)
         self.C = len(grid[0])
-        self.dodads = {}
-        for r in range(self.R):
-            for c in range(self.C):
-                self.dodads[Tile(r, c)] = DoDad(grid[r][c])
+        # Beams leave the contraption through the border, which has no dodads
+        self.grid = Grid.from_lines(grid, fill=" ")
+        self.dodads = [
+            DoDad(chr(name)) if name != ord(" ") else None for name in self.grid.cells
+        ]
+        self.steps = self.grid.offsets(BEAM_STEPS)
+
+    def tile(self, r: int, c: int) -> Tile:
+        return self.grid.index(r, c)
 
     def neighbors(self, node: Node) -> list[Node]:
-        tile, beam = node
+        tile, beam = divmod(node, 4)
         nbrs = []
         for nbr_beam in self.dodads[tile](beam):
-            nbr_tile = tile + nbr_beam
-            if 0 <= nbr_tile.r < self.R and 0 <= nbr_tile.c < self.C:
-                nbrs.append((nbr_tile, nbr_beam))
+            nbr_tile = tile + self.steps[nbr_beam]
+            if self.dodads[nbr_tile]:
+                nbrs.append(4 * nbr_tile + nbr_beam)
         return nbrs
 
     def dfs(self, start: Node):
         stack = [start]
-        visited = set()
+        visited = bytearray(4 * len(self.dodads))
         while stack:
             node = stack.pop()
-            if node in visited:
+            if visited[node]:
                 continue
             yield node
-            visited.add(node)
+            visited[node] = 1
             stack.extend(self.neighbors(node))
 
-    def energize(self, start: Node) -> int:
+    def energize(self, start: tuple[Tile, Beam]) -> int:
+        tile, beam = start
         energized = defaultdict(list)
-        for tile, beam in self.dfs(start):
+        for node in self.dfs(4 * tile + beam):
+            tile, beam = divmod(node, 4)
             energized[tile].append(beam)
 
         total = sum(bool(beams) for beams in energized.values())
@@ -97,7 +93,7 @@ class Contraption:
         for r in range(self.R):
             row = []
             for c in range(self.C):
-                tile = Tile(r, c)
+                tile = self.tile(r, c)
                 name = self.dodads[tile].name
                 if name == "." and energized[tile]:
                     num = len(energized[tile])
@@ -111,23 +107,25 @@ class Contraption:
         for r in range(self.R):
             row = []
             for c in range(self.C):
-                row.append("#" if energized[Tile(r, c)] else ".")
+                row.append("#" if energized[self.tile(r, c)] else ".")
             img.append("".join(row))
         print("\n".join(img))
 
 
 def part1(grid):
-    return Contraption(grid).energize(start=(Tile(0, 0), E))
+    contraption = Contraption(grid)
+    return contraption.energize(start=(contraption.tile(0, 0), E))
 
 
 def part2(grid):
     R, C = len(grid), len(grid[0])
     contraption = Contraption(grid)
+    tile = contraption.tile
 
-    configs = [(Tile(0, c), S) for c in range(C)]
-    configs += [(Tile(R - 1, c), N) for c in range(C)]
-    configs += [(Tile(r, 0), E) for r in range(R)]
-    configs += [(Tile(r, C - 1), W) for r in range(R)]
+    configs = [(tile(0, c), S) for c in range(C)]
+    configs += [(tile(R - 1, c), N) for c in range(C)]
+    configs += [(tile(r, 0), E) for r in range(R)]
+    configs += [(tile(r, C - 1), W) for r in range(R)]
 
     energized = [(contraption.energize(start), start) for start in configs]
     energized.sort()
@@ -0,0 +1,17 @@
+"""Synthetic inputs for Day 17: Clumsy Crucible
+
+The city is square, with `scale` times the blocks of input.txt.
+"""
+
+import math
+import random
+
+SIZE = 141  # input.txt is SIZE x SIZE
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    size = round(SIZE * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices("123456789", k=size)) + "\n" for _ in range(size)
+    )
@@ -1,29 +1,15 @@
 """Day 17: Clumsy Crucible"""
 
 import argparse
-import heapq
+import math
 import pathlib
 from operator import itemgetter
 from typing import NamedTuple
 
+import numpy as np
 
-def djikstra(graph, source):
-    dist = {source: 0}
-    prev = {source: None}
-
-    queue = [(0, source)]  # Min dist based priority queue: [(dist, node), ...]
-
-    while queue:
-        dist_su, u = heapq.heappop(queue)
-
-        for v, dist_uv in graph[u].items():
-            dist_sv = dist_su + dist_uv
-            if v not in dist or dist_sv < dist[v]:
-                dist[v] = dist_sv
-                prev[v] = u
-                heapq.heappush(queue, (dist_sv, v))
-
-    return dist, prev
+from aoc.graph import Graph, dijkstra
+from aoc.grid import ORTHOGONAL, Grid
 
 
 # Colormaps normalized to range(1, 10) and converted to 8-bit colors
@@ -41,120 +27,114 @@ def bg(text, color):
     return "\33[48;5;" + str(color) + "m" + text + "\33[0m"
 
 
-DIRS = {
-    (-1, 0): "^",
-    (0, -1): "<",
-    (1, 0): "v",
-    (0, 1): ">",
-}
-
-
-class Dir(NamedTuple):
-    r: int
-    c: int
-
-    def __repr__(self):
-        # noinspection PyTypeChecker
-        return DIRS.get(self, "x")
+# Directions are indices into ORTHOGONAL: up, left, down, right. Turning left
+# is the next direction, turning right the previous one.
+DIRS = "^<v>x"  # START shows as "x"
+START = -1  # direction of the starting node, which may go any way
 
 
 class Node(NamedTuple):
-    position: tuple[int, int]
-    direction: Dir
+    position: int  # flat index into the city grid
+    direction: int
     steps: int
 
     def __repr__(self):
-        return f"({self.position}, {self.direction}, {self.steps})"
+        return f"({self.position}, {DIRS[self.direction]}, {self.steps})"
 
 
 class City:
-    def __init__(self, map_: list[list[int]], min_steps: int, max_steps: int):
-        self.R = len(map_)
-        self.C = len(map_[0])
+    def __init__(self, grid: Grid, min_steps: int, max_steps: int):
+        self.grid = grid  # heat loss of each block, 0 outside the city
+        self.R = grid.R
+        self.C = grid.C
         self.min_steps = min_steps
         self.max_steps = max_steps
 
-        self.grid = {(r, c): map_[r][c] for r in range(self.R) for c in range(self.C)}
-
-        self.graph = {}
-        for pos in self.grid:
-            # Starting nodes (steps == 0)
-            u = Node(pos, Dir(0, 0), 0)
-            self.graph[u] = {v: self.grid[v.position] for v in self.neighbors(u)}
-            # print(u, "->", self.graph[u])
+        self.heat = grid.cells
+        self.offsets = grid.offsets(ORTHOGONAL)
 
-            # Continuing nodes
-            for direction in DIRS.keys():
-                for steps in range(1, max_steps + 1):
-                    u = Node(pos, Dir(*direction), steps)
-                    self.graph[u] = {
-                        v: self.grid[v.position] for v in self.neighbors(u)
-                    }
-                    # print(u, "->", self.graph[u])
+        # The edges of all nodes with the same direction and steps are added
+        # at once, for every position in the city
+        positions = np.array(grid.indices())
+        heat = grid.flat.astype(np.int64)
+        sources, targets, weights = [], [], []
 
-    def neighbors(self, node: Node) -> list[Node]:
-        (r, c), (dr, dc), steps = node
+        def connect(u_direction, u_steps, v_direction, v_steps):
+            v_positions = positions + self.offsets[v_direction]
+            inside = heat[v_positions] > 0
+            sources.append(self.label(positions[inside], u_direction, u_steps))
+            targets.append(self.label(v_positions[inside], v_direction, v_steps))
+            weights.append(heat[v_positions[inside]])
 
         # Starting nodes (steps == 0)
-        if steps == 0:
-            return [
-                Node((r + dr, c + dc), Dir(dr, dc), 1)
-                for dr, dc in DIRS.keys()
-                if (r + dr, c + dc) in self.grid
-            ]
+        for direction in range(len(ORTHOGONAL)):
+            connect(START, 0, direction, 1)
 
         # Continuing nodes
-        nbrs = []
-
-        if steps < self.max_steps:
-            nbrs.append(Node((r + dr, c + dc), Dir(dr, dc), steps + 1))  # Go straight
-
-        if steps >= self.min_steps:
-            nbrs.append(Node((r - dc, c + dr), Dir(-dc, dr), 1))  # Turn left
-            nbrs.append(Node((r + dc, c - dr), Dir(dc, -dr), 1))  # Turn right
-
-        return [nbr for nbr in nbrs if nbr.position in self.grid]
+        for direction in range(len(ORTHOGONAL)):
+            left, right = (direction + 1) % 4, (direction - 1) % 4
+            for steps in range(1, max_steps + 1):
+                if steps < max_steps:
+                    connect(direction, steps, direction, steps + 1)  # Go straight
+                if steps >= min_steps:
+                    connect(direction, steps, left, 1)  # Turn left
+                    connect(direction, steps, right, 1)  # Turn right
+
+        self.graph = Graph.from_arrays(
+            np.concatenate(sources), np.concatenate(targets), np.concatenate(weights)
+        )
+
+    def label(self, position, direction, steps):
+        """Graph label of a node (works on arrays too)"""
+        return (position * 5 + direction + 1) * (self.max_steps + 1) + steps
+
+    def node(self, label: int) -> Node:
+        rest, steps = divmod(label, self.max_steps + 1)
+        position, direction = divmod(rest, 5)
+        return Node(position, direction - 1, steps)
 
     def shortest_path(self, src, dst):
-        dist, prev = djikstra(self.graph, source=Node(src, Dir(0, 0), 0))
-
-        dst_nodes = [
-            (n, d)
-            for n, d in dist.items()
-            if n.position == dst and n.steps >= self.min_steps
-        ]
+        src, dst = self.grid.index(*src), self.grid.index(*dst)
+        source = self.graph.id(self.label(src, START, 0))
+        dist, prev = dijkstra(self.graph, source)
+
+        dst_nodes = []
+        for direction in range(len(ORTHOGONAL)):
+            for steps in range(self.min_steps, self.max_steps + 1):
+                label = self.label(dst, direction, steps)
+                if label in self.graph and dist[v := self.graph.id(label)] < math.inf:
+                    dst_nodes.append((v, dist[v]))
         dst_nodes.sort(key=itemgetter(1))
         # print(f"{dst_nodes=}")
 
         if not dst_nodes:
             return [], None
 
-        goal_node, min_dist = dst_nodes[0]
+        goal, min_dist = dst_nodes[0]
 
-        path = [goal_node]
-        # noinspection PyUnresolvedReferences
-        while prev_node := prev[path[0]]:
-            path.insert(0, prev_node)
+        path = [goal]
+        while (u := prev[path[0]]) is not None:
+            path.insert(0, u)
 
-        return path, min_dist
+        return [self.node(self.graph.label(u)) for u in path], min_dist
 
     def display(self, path: list[Node]):
-        p = {node.position: str(node.direction) for node in path}
+        p = {node.position: DIRS[node.direction] for node in path}
 
         img = []
         for r in range(self.R):
             row = []
             for c in range(self.C):
-                heat = self.grid[r, c]
-                color = CMAP[heat - 1]
-                text = p.get((r, c), "")
+                pos = self.grid.index(r, c)
+                color = CMAP[self.heat[pos] - 1]
+                text = p.get(pos, "")
                 row.append(bg(f"{text:2}", color))
             img.append("".join(row))
 
         print("\n".join(img))
 
 
-def partx(city_map, min_steps, max_steps, display=False):
+def partx(city_map: Grid, min_steps, max_steps, display=False):
     city = City(city_map, min_steps, max_steps)
 
     lava_pool = (0, 0)
@@ -176,7 +156,7 @@ def main():
     args = parser.parse_args()
 
     lines = pathlib.Path(args.f).read_text().splitlines()
-    city_map = [[int(n) for n in line] for line in lines]
+    city_map = Grid.from_digits(lines)
 
     print("part 1:", partx(city_map, min_steps=1, max_steps=3, display=args.d))
     print("part 2:", partx(city_map, min_steps=4, max_steps=10, display=args.d))
@@ -0,0 +1,51 @@
+"""Synthetic inputs for Day 18: Lavaduct Lagoon
+
+Both dig plans (the plain one and the one hidden in the colors) trace a band
+of columns: a staircase going right along the tops of the columns and another
+one coming back left along their bottoms. Every column straddles the middle
+height, so the loop is always simple and it turns at every instruction.
+"""
+
+import random
+
+COLUMNS = 191  # input.txt has 4 * COLUMNS + 2 instructions
+
+
+def column_band(rng, columns, max_width, max_height):
+    """Dig plan [(direction, meters), ...] around a random band of columns"""
+    mid = max_height // 2
+    tops, bottoms = [], []
+    for _ in range(columns):
+        top = rng.randint(mid + 1, max_height)
+        bottom = rng.randint(0, mid - 1)
+        if tops and top == tops[-1]:
+            top = mid + 1 if top == max_height else top + 1
+        if bottoms and bottom == bottoms[-1]:
+            bottom = mid - 1 if bottom == 0 else bottom - 1
+        tops.append(top)
+        bottoms.append(bottom)
+    widths = [rng.randint(1, max_width) for _ in range(columns)]
+
+    plan = [("U", tops[0] - bottoms[0]), ("R", widths[0])]
+    for i in range(1, columns):
+        plan.append(("U" if tops[i] > tops[i - 1] else "D", abs(tops[i] - tops[i - 1])))
+        plan.append(("R", widths[i]))
+    plan.append(("D", tops[-1] - bottoms[-1]))
+    plan.append(("L", widths[-1]))
+    for i in range(columns - 2, -1, -1):
+        step = bottoms[i] - bottoms[i + 1]
+        plan.append(("U" if step > 0 else "D", abs(step)))
+        plan.append(("L", widths[i]))
+    return plan
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    columns = COLUMNS * scale
+    plan1 = column_band(rng, columns, max_width=8, max_height=100)
+    plan2 = column_band(rng, columns, max_width=2**16, max_height=2**20 - 1)
+    lines = []
+    for (direction, meters), (direction2, meters2) in zip(plan1, plan2):
+        color = f"{meters2:05x}{'RDLU'.index(direction2)}"
+        lines.append(f"{direction} {meters} (#{color})")
+    return "\n".join(lines) + "\n"
@@ -7,9 +7,10 @@
 
 import argparse
 import pathlib
-import time
 from typing import NamedTuple
 
+from aoc.screen import Screen, capture
+
 
 class Position(NamedTuple):
     r: int
@@ -24,6 +25,8 @@ class Motion(NamedTuple):
 DIRECTIONS = "RDLU"
 MOTIONS = dict(R=Motion(0, 1), D=Motion(1, 0), L=Motion(0, -1), U=Motion(-1, 0))
 
+SCREEN = Screen(fps=10)
+
 
 def step(position: Position, direction: str, n: int = 1) -> Position:
     r, c = position
@@ -63,9 +66,10 @@ class Lagoon1:
         }
         filled = set(self.boundary.keys())
         front = {self.top_left}
+        img = self.fill_image() if display else None
         while front:
             if display:
-                self.animate_fill(filled, front)
+                self.animate_fill(img, front)
             next_front = {
                 next_position
                 for position in front
@@ -75,26 +79,27 @@ class Lagoon1:
             }
             filled.update(front)
             front = next_front
+        if display:
+            SCREEN.close()
         self.interior = whole - filled
 
-    def animate_fill(self, filled, front) -> None:
-        CLEAR_SCREEN = "\033[2J"
+    def fill_image(self) -> list[list[str]]:
         img = []
         for r in range(self.top_left.r, self.bottom_right.r + 1):
             row = []
             for c in range(self.top_left.c, self.bottom_right.c + 1):
-                if (r, c) in self.boundary:
-                    point = "#"
-                elif (r, c) in filled:
-                    point = "*"
-                elif (r, c) in front:
-                    point = "@"
-                else:
-                    point = "."
-                row.append(point)
-            img.append("".join(row))
-        print(CLEAR_SCREEN + "\n".join(img))
-        time.sleep(0.1)
+                row.append("#" if (r, c) in self.boundary else ".")
+            img.append(row)
+        return img
+
+    def animate_fill(self, img, front) -> None:
+        # Only the front changes: it is drawn as "@", then becomes filled, "*"
+        r0, c0 = self.top_left
+        for r, c in front:
+            img[r - r0][c - c0] = "@"
+        SCREEN.draw(["".join(row) for row in img])
+        for r, c in front:
+            img[r - r0][c - c0] = "*"
 
     def display(self) -> None:
         lagoon = self.boundary.keys() | self.interior
@@ -216,11 +221,14 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
     parser.add_argument("-d", action="store_true", help="display")
+    parser.add_argument("-c", metavar="FILE", help="capture the display to FILE (see bin/play.py)")
     args = parser.parse_args()
+    if args.c:
+        capture(args.c)
 
     lines = pathlib.Path(args.f).read_text().splitlines()
 
-    print("part 1:", part1(lines, display=args.d))
+    print("part 1:", part1(lines, display=args.d or bool(args.c)))
     print("part 2:", part2(lines))
 
 
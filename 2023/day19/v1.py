@@ -1,10 +1,12 @@
 """Day 19: Aplenty"""
 
 import argparse
-import pathlib
 from collections import deque, defaultdict
 from math import prod
 
+from aoc import parse
+from aoc.intervals import IntervalSet
+
 
 def apply_rules(part, rules):
     for condition, next_workflow in rules[:-1]:
@@ -29,40 +31,18 @@ def part1(system, parts):
     return sum(sum(part.values()) for part in accepted)
 
 
-class Interval:
-    def __init__(self, name: str, lo: int, hi: int) -> None:
-        assert lo <= hi, (lo, hi)
-        self.name = name
-        self.lo = lo
-        self.hi = hi
-
-    def __repr__(self):
-        return f"{self.name}[{self.lo}, {self.hi})"
-
-    def __lt__(self, other: int) -> tuple["Interval", "Interval"]:
-        if other < self.lo:
-            return Interval(self.name, 0, 0), self
-        if self.hi <= other:
-            return self, Interval(self.name, 0, 0)
-        return Interval(self.name, self.lo, other), Interval(self.name, other, self.hi)
-
-    def __gt__(self, other: int) -> tuple["Interval", "Interval"]:
-        if other < self.lo:
-            return self, Interval(self.name, 0, 0)
-        if self.hi <= other:
-            return Interval(self.name, 0, 0), self
-        return Interval(self.name, other + 1, self.hi), Interval(
-            self.name, self.lo, other + 1
-        )
+def split(part, condition):
+    """The parts (dicts of rating -> IntervalSet) that do and don't meet condition"""
+    name, op, value = condition[0], condition[1], int(condition[2:])
+    if op == "<":
+        below = IntervalSet([(1, value)])
+        return {**part, name: part[name] & below}, {**part, name: part[name] - below}
+    at_most = IntervalSet([(1, value + 1)])
+    return {**part, name: part[name] - at_most}, {**part, name: part[name] & at_most}
 
 
 def part2(system):
-    part = dict(
-        x=Interval("x", 1, 4001),
-        m=Interval("m", 1, 4001),
-        a=Interval("a", 1, 4001),
-        s=Interval("s", 1, 4001),
-    )
+    part = {name: IntervalSet([(1, 4001)]) for name in "xmas"}
 
     accepted = []
     rejected = []
@@ -83,14 +63,11 @@ def part2(system):
 
         rules = system[workflow]
         for condition, next_workflow in rules[:-1]:
-            intv_t, intv_f = eval(condition, {}, part)
-            part_t = {**part, intv_t.name: intv_t}
-            part_f = {**part, intv_f.name: intv_f}
+            part_t, part = split(part, condition)
             parts_workflows.append((part_t, next_workflow))
-            part = part_f
         parts_workflows.append((part, rules[-1][-1]))
 
-    return sum(prod(i.hi - i.lo for i in part.values()) for part in accepted)
+    return sum(prod(i.length for i in part.values()) for part in accepted)
 
 
 # noinspection DuplicatedCode
@@ -99,7 +76,7 @@ def main():
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
     args = parser.parse_args()
 
-    chunks = pathlib.Path(args.f).read_text().split("\n\n")
+    chunks = parse.paragraphs(parse.read(args.f))
 
     system = defaultdict(list)
     for line in chunks[0].splitlines():
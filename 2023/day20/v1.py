@@ -8,6 +8,8 @@ from functools import reduce
 from math import prod
 from operator import and_
 
+from aoc.cycles import find_cycle
+
 
 verbose: bool = False
 
@@ -28,6 +30,9 @@ class Module:
     def reset(self):
         pass
 
+    def fingerprint(self):
+        return None
+
     def receive(self, src: str, pulse: bool):
         for dst in self.dsts:
             self.cnwk.send(self.name, dst, pulse)
@@ -49,6 +54,9 @@ class Flop(Module):
     def reset(self):
         self.state = False
 
+    def fingerprint(self):
+        return self.state
+
     def receive(self, src: str, pulse: bool):
         if not pulse:
             self.state = not self.state
@@ -63,6 +71,9 @@ class Nand(Module):
     def reset(self):
         self.received = {}
 
+    def fingerprint(self):
+        return tuple(self.received.get(src, False) for src in self.srcs)
+
     def receive(self, src: str, pulse: bool):
         self.received[src] = pulse
         nand = not reduce(and_, (self.received.get(src, False) for src in self.srcs))
@@ -103,6 +114,26 @@ class CableNetwork:
         for module in sink_modules:
             self.add_module(module)
 
+    def fingerprint(self):
+        return tuple(module.fingerprint() for module in self.modules.values())
+
+    def subnetwork(self, output: str) -> "CableNetwork":
+        """A fresh copy of just the modules that can send pulses to output"""
+        names = {output}
+        todo = [output]
+        while todo:
+            for src in self.modules[todo.pop()].srcs:
+                if src not in names:
+                    names.add(src)
+                    todo.append(src)
+
+        subnetwork = CableNetwork()
+        for name, module in self.modules.items():
+            if name in names:
+                subnetwork.add_module(type(module)(name, module.dsts))
+        subnetwork.connect()  # dsts outside of it become sinks
+        return subnetwork
+
     def send(self, src: str, dst: str, pulse: bool):
         self.pulse_count[pulse] += 1
         self.pulses.append((src, dst, pulse))
@@ -144,31 +175,25 @@ def part2(cable_network: CableNetwork, output="rx") -> int:
     assert len(sink.srcs) == 1, sink
     nand = cable_network.modules[sink.srcs[0]]
 
-    # Look for high input pulses coming in to the NAND gate and compute periods.
-    prev_cycle = {src: 0 for src in nand.srcs}
-    periods = {src: [] for src in nand.srcs}
-
-    def trace(cycle, src, dst, pulse):
-        if not (dst == nand.name and pulse):
-            return
-        period = cycle - prev_cycle[src]
-        prev_cycle[src] = cycle
-        periods[src].append(period)
-        # print(cycle, src, period)
+    # Each input of the NAND gate is driven by one of the FSMs, which cycles
+    # through its states with period T (sending a high pulse at the end of it).
+    def push_button(fsm: CableNetwork) -> CableNetwork:
+        fsm.push_button()
+        return fsm
 
-    cable_network.trace = trace
+    periods = []
+    for src in nand.srcs:
+        fsm = cable_network.subnetwork(src)
 
-    for _ in range(10**4):
-        cable_network.push_button()
-        # Make sure last two periods are same
-        if any(len(ps) < 2 for ps in periods.values()):
-            continue
-        if all(ps[-1] == ps[-2] for ps in periods.values()):
-            break
+        def initial() -> CableNetwork:
+            fsm.reset()
+            return fsm
 
-    # print(periods)
+        cycle = find_cycle(initial, push_button, key=CableNetwork.fingerprint)
+        # print(src, cycle.start, cycle.period)
+        periods.append(cycle.period)
 
-    return math.lcm(*(ps[-1] for ps in periods.values()))
+    return math.lcm(*periods)
 
 
 # noinspection DuplicatedCode
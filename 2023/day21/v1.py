@@ -20,69 +20,45 @@
 import argparse
 import pathlib
 
+import numpy as np
 
-def bfs_layers(neighbors, s):
-    previous_layer = set()
-    # noinspection PySetFunctionToLiteral
-    current_layer = set([s])
-    while current_layer:
-        yield current_layer
-        next_layer = {
-            v for u in current_layer for v in neighbors(u) if v not in previous_layer
-        }
-        previous_layer, current_layer = current_layer, next_layer
+from aoc.bitgrid import BitGrid, layer_counts
 
 
-def part1(grid, steps=64):
-    R, C = len(grid), len(grid[0])
+def garden(grid, tiles=1):
+    """The BFS step over the garden plots of the grid repeated tiles x tiles times
+    (as BitGrid bits), and the bit of the start in the middle tile"""
+    chars = np.tile(np.array([list(row) for row in grid]), (tiles, tiles))
+    plots = BitGrid(chars.shape)
+    open_ = plots.from_array(chars != "#")
 
-    s = next((r, c) for r in range(R) for c in range(C) if grid[r][c] == "S")
+    r, c = np.argwhere(chars == "S")[tiles * tiles // 2].tolist()
+    return (lambda frontier: plots.spread(frontier, open_)), plots.bit((r, c))
 
-    def neighbors(v):
-        r, c = v
-        for dr, dc in [(-1, 0), (+1, 0), (0, -1), (0, +1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < R and 0 <= nc < C and grid[nr][nc] != "#":
-                yield nr, nc
 
-    N = {}
-    for d, layer in enumerate(bfs_layers(neighbors, s)):
-        N[d] = layer
-        if d == steps:
-            break
+def part1(grid, steps=64):
+    step, s = garden(grid)
 
-    new = [len(N[d]) if d in N else 0 for d in range(steps + 1)]
-    tot = [sum(new[d::-2]) for d in range(len(new))]
+    new = layer_counts(s, step, steps)
+    new += [0] * (steps + 1 - len(new))
 
-    # for d in N:
-    #     layer = N.get(d, set())
-    #     print(d, new[d], tot[d], layer)
+    tot = [sum(new[d::-2]) for d in range(len(new))]
 
     return tot[steps]
 
 
 def part2(grid, steps=26501365):
-    R, C = len(grid), len(grid[0])
-
-    s = next((r, c) for r in range(R) for c in range(C) if grid[r][c] == "S")
+    R = len(grid)
 
-    # Infinitely repreating grid
-    def neighbors(v):
-        r, c = v
-        for dr, dc in [(-1, 0), (+1, 0), (0, -1), (0, +1)]:
-            nr, nc = r + dr, c + dc
-            if grid[nr % R][nc % C] != "#":
-                yield nr, nc
+    # Infinitely repreating grid. The BFS only goes 3R - 1 steps from the start
+    # in the middle tile, so 7 x 7 tiles are as good as infinitely many.
+    step, s = garden(grid, tiles=7)
 
     # Given the open rows and columns in middle and on the edges of the grid, and
     # plenty of open diagonals in the outer "diamond", the layer pattern becomes
     # periodic (actually the delta_new) with period R (=C).
 
-    new = {}
-    for d, layer in enumerate(bfs_layers(neighbors, s)):
-        new[d] = len(layer)
-        if d == 3 * R - 1:
-            break
+    new = dict(enumerate(layer_counts(s, step, 3 * R - 1)))
 
     delta = [new[2 * R + d % R] - new[R + d % R] for d in range(R)]
 
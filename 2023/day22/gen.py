@@ -0,0 +1,27 @@
+"""Synthetic inputs for Day 22: Sand Slabs
+
+Every brick starts above the previous one, so the snapshot never has
+overlapping bricks.
+"""
+
+import random
+
+BRICKS = 1249  # size of input.txt
+AREA = 10
+
+
+def generate(scale, seed=0):
+    rng = random.Random(seed)
+    bricks = []
+    z = 1
+    for _ in range(BRICKS * scale):
+        x, y = rng.randrange(AREA), rng.randrange(AREA)
+        length = rng.randint(0, 4)
+        axis = rng.choice("xyz")
+        x1 = min(x + length, AREA - 1) if axis == "x" else x
+        y1 = min(y + length, AREA - 1) if axis == "y" else y
+        z1 = z + length if axis == "z" else z
+        bricks.append(f"{x},{y},{z}~{x1},{y1},{z1}\n")
+        z = z1 + rng.randint(1, 2)
+    rng.shuffle(bricks)
+    return "".join(bricks)
@@ -2,10 +2,10 @@
 
 import argparse
 import itertools
-import pathlib
-import re
 from collections import deque, defaultdict, Counter
 
+from aoc import parse
+
 
 class Brick:
     _count = itertools.count()
@@ -102,12 +102,9 @@ def main():
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
     args = parser.parse_args()
 
-    lines = pathlib.Path(args.f).read_text().splitlines()
+    rows = parse.int_rows(parse.read(args.f), 6).tolist()
 
-    bricks = []
-    for line in lines:
-        numbers = [int(n) for n in re.findall(r"\d+", line)]
-        bricks.append(Brick(*numbers))
+    bricks = [Brick(*numbers) for numbers in rows]
 
     stack = Stack(bricks)
 
@@ -7,33 +7,43 @@ import argparse
 import pathlib
 import sys
 
+from aoc.graph import Graph
+
 sys.setrecursionlimit(10000)
 
 DIRS = {">": (0, +1), "v": (+1, 0), "<": (0, -1), "^": (-1, 0)}
 
 
 def find_longest_path_length(graph, s, t):
-    paths = 0
+    """Length of the longest simple path from s to t in a dict graph {u: {v: d}}"""
+    graph = Graph((u, v, d) for u in graph for v, d in graph[u].items())
+    s, t = graph.id(s), graph.id(t)
+    edges = [list(graph.edges(u)) for u in range(len(graph))]
+    on_path = bytearray(len(graph))
     longest = 0
 
-    def dfs(u, path, length):
-        nonlocal paths
+    # If only one node p leads to t, a path that reaches p must go straight on to
+    # t (t can never be reached once p is on the path), so stop the search at p.
+    extra = 0
+    (p, *others) = graph.reversed().neighbors(t)
+    if not others:
+        t, extra = p, dict(edges[p])[t]
+
+    def dfs(u, length):
         nonlocal longest
 
         if u == t:
-            paths += 1
-            if length > longest:
-                longest = length
-                # print("path:", paths, length, longest)
+            if length + extra > longest:
+                longest = length + extra
             return
 
-        path.add(u)
-        for v, d in graph[u].items():
-            if v not in path:
-                dfs(v, path, length + d)
-        path.remove(u)
+        on_path[u] = 1
+        for v, d in edges[u]:
+            if not on_path[v]:
+                dfs(v, length + d)
+        on_path[u] = 0
 
-    dfs(s, set(), 0)
+    dfs(s, 0)
 
     return longest
 
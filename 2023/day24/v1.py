@@ -1,13 +1,10 @@
 """Day 24: Never Tell Me The Odds"""
 
 import argparse
-import pathlib
-import re
 from itertools import combinations
 from typing import NamedTuple
 
-import sympy
-from sympy import symbols, Matrix
+from aoc import parse
 
 
 class V3(NamedTuple):
@@ -67,6 +64,9 @@ def part1(hailstones, lo, hi):
 
 
 def part2(hailstones):
+    import sympy
+    from sympy import symbols, Matrix
+
     # Rock
     rps = symbols("rpx rpy rpz")
     rvs = symbols("rvx rvy rvz")
@@ -102,11 +102,10 @@ def main():
     else:
         lo, hi = 7, 27
 
-    lines = pathlib.Path(args.f).read_text().splitlines()
+    rows = parse.int_rows(parse.read(args.f), 6).tolist()
 
     hailstones = []
-    for line in lines:
-        px, py, pz, vx, vy, vz = [int(n) for n in re.findall(r"-?\d+", line)]
+    for px, py, pz, vx, vy, vz in rows:
         p = V3(px, py, pz)
         v = V3(vx, vy, vz)
         hailstones.append(H(p, v))
@@ -0,0 +1,12 @@
+"""Synthetic inputs for Day 1: Secret Entrance"""
+
+import random
+
+ROTATIONS = 4493  # size of input.txt
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "".join(
+        f"{rng.choice('LR')}{rng.randint(1, 999)}\n" for _ in range(ROTATIONS * scale)
+    )
@@ -0,0 +1,19 @@
+"""Synthetic inputs for Day 2: Gift Shop
+
+Both parts check every ID in every range, so the ranges keep the widths of
+input.txt and there are `scale` times as many of them.
+"""
+
+import random
+
+RANGES = 36  # size of input.txt
+MAX_WIDTH = 100000
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(RANGES * scale):
+        start = rng.randint(10, 10**10)
+        ranges.append(f"{start}-{start + rng.randint(0, MAX_WIDTH)}")
+    return ",".join(ranges) + "\n"
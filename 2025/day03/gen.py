@@ -0,0 +1,18 @@
+"""Synthetic inputs for Day 3: Lobby
+
+The number of banks stays fixed and the banks get longer, which is what
+separates the argmax-slicing of v1 from the monotonic stack of v2.
+"""
+
+import random
+
+BANKS = 200  # size of input.txt
+BATTERIES = 100
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    banks = [
+        "".join(rng.choices("123456789", k=BATTERIES * scale)) for _ in range(BANKS)
+    ]
+    return "\n".join(banks) + "\n"
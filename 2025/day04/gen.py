@@ -0,0 +1,17 @@
+"""Synthetic inputs for Day 4: Printing Department
+
+The grid is square, with `scale` times the area of input.txt.
+"""
+
+import math
+import random
+
+SIZE = 139  # input.txt is SIZE x SIZE
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = round(SIZE * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choices("@.", weights=[65, 35], k=size)) + "\n" for _ in range(size)
+    )
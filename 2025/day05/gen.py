@@ -0,0 +1,17 @@
+"""Synthetic inputs for Day 5: Cafeteria"""
+
+import random
+
+RANGES = 171  # size of input.txt
+IDS = 1000
+EXTENT = 10**15
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    ranges = []
+    for _ in range(RANGES * scale):
+        start = rng.randrange(EXTENT)
+        ranges.append(f"{start}-{start + rng.randrange(EXTENT // 1000)}")
+    ids = [str(rng.randrange(EXTENT)) for _ in range(IDS * scale)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids) + "\n"
@@ -0,0 +1,26 @@
+"""Synthetic inputs for Day 7: Laboratories
+
+Like input.txt, the splitters fill a triangle below the start on every other
+row, with a few of them missing. The manifold has `scale` times the area of
+input.txt.
+"""
+
+import math
+import random
+
+SIZE = 141  # input.txt is SIZE wide and SIZE + 1 deep
+MISSING = 0.15
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    size = round(SIZE * math.sqrt(scale)) // 2 * 2 + 1
+    mid = size // 2
+    rows = [["."] * size for _ in range(size + 1)]
+    rows[0][mid] = "S"
+    for r in range(2, size + 1, 2):
+        k = r // 2
+        for c in range(mid - k + 1, mid + k, 2):
+            if 0 < c < size - 1 and rng.random() > MISSING:
+                rows[r][c] = "^"
+    return "".join("".join(row) + "\n" for row in rows)
@@ -3,19 +3,9 @@
 Tags: #display #animation #colors
 """
 
-import time
+from aoc.screen import BG_RED, BG_YELLOW, FG_GREEN, FG_YELLOW, RESET, Screen
 
-import matplotlib.colors as colors
-import matplotlib.pyplot as plt
-
-CLEAR_SCREEN = "\033[2J"
-BG_RED = "\033[41m"
-BG_GREEN = "\033[42m"
-BG_YELLOW = "\033[43m"
-FG_RED = "\033[31m"
-FG_GREEN = "\033[32m"
-FG_YELLOW = "\033[33m"
-RESET = "\033[0m"
+SCREEN = Screen(fps=14)
 
 
 def display_manifold(manifold, splits):
@@ -33,12 +23,10 @@ def display_manifold(manifold, splits):
                 img_row.append(FG_YELLOW + "|" + RESET)
             else:
                 img_row.append(" ")
-        img.append("".join(img_row))
+        img.append(img_row)
 
-    print(CLEAR_SCREEN)
-    print("\n".join(img))
-    print("splits:", splits)
-    time.sleep(0.07)
+    # Above the manifold, which may not fit on the screen
+    SCREEN.draw(img, header=f"splits: {splits}")
 
 
 def part1(lines, display=False):
@@ -68,6 +56,8 @@ def part1(lines, display=False):
         beam = "|"
         if display:
             display_manifold(manifold, splits)
+    if display:
+        SCREEN.close()
 
     return splits
 
@@ -87,6 +77,9 @@ def part2(manifold, display=False):
                 timelines[r][c] += timelines[r - 1][c]
 
     if display:
+        import matplotlib.colors as colors
+        import matplotlib.pyplot as plt
+
         plt.imshow(timelines, norm=colors.LogNorm(), cmap="plasma")
         cbar = plt.colorbar()
         cbar.set_label("Number of timelines")
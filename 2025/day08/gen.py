@@ -0,0 +1,21 @@
+"""Synthetic inputs for Day 8: Playground
+
+Note that both versions build all n * (n - 1) / 2 pairs of junction boxes, so
+memory grows quadratically with the scale.
+"""
+
+import random
+
+JBOXES = 1000  # size of input.txt
+EXTENT = 100000
+CONNECTIONS = 1000
+
+# Generated inputs are not named input.txt, so pass the real number of connections
+ARGS = ("-n", str(CONNECTIONS))
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    jboxes = rng.sample(range(EXTENT**3), JBOXES * scale)
+    lines = [f"{j // EXTENT**2},{j // EXTENT % EXTENT},{j % EXTENT}" for j in jboxes]
+    return "\n".join(lines) + "\n"
@@ -2,6 +2,9 @@
 import math
 from typing import NamedTuple
 
+from aoc import parse
+from aoc.unionfind import UnionFind
+
 
 class JBox(NamedTuple):
     x: int
@@ -9,78 +12,53 @@ class JBox(NamedTuple):
     z: int
 
 
-type Circuit = frozenset[JBox]
-
-
 def squared_distance(j1: JBox, j2: JBox) -> int:
     x1, y1, z1 = j1
     x2, y2, z2 = j2
     return (x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2
 
 
-def part1(jboxes: list[JBox], pairs: list[tuple[JBox, JBox]], max_connections: int) -> int:
-    circuits: set[Circuit] = {frozenset([jbox]) for jbox in jboxes}
-    playground: dict[JBox, Circuit] = {jbox: ckt for ckt in circuits for jbox in ckt}
-
-    for i, (jbox1, jbox2) in enumerate(pairs, start=1):
-        if i > max_connections:
-            break
-        ckt1 = playground[jbox1]
-        ckt2 = playground[jbox2]
-
-        if ckt1 == ckt2:
-            continue
-
-        connected_ckt = ckt1 | ckt2
-        circuits.remove(ckt1)
-        circuits.remove(ckt2)
-        circuits.add(connected_ckt)
-        for jbox in connected_ckt:
-            playground[jbox] = connected_ckt
-
-    sorted_circuits = sorted(circuits, key=lambda ckt: len(ckt), reverse=True)
-    return math.prod(len(c) for c in sorted_circuits[:3])
-
-
-def part2(jboxes: list[JBox], pairs: list[tuple[JBox, JBox]]) -> int:
-    circuits = [{jbox} for jbox in jboxes]
+def part1(jboxes: list[JBox], pairs: list[tuple[int, int]], max_connections: int) -> int:
+    # Circuits are the components of the junction boxes (by index) joined so far
+    circuits = UnionFind(len(jboxes))
+    circuits.union_many(pairs[:max_connections])
 
-    for jbox1, jbox2 in pairs:
-        ckt1 = next(c for c in circuits if jbox1 in c)
-        ckt2 = next(c for c in circuits if jbox2 in c)
+    sizes = sorted(circuits.component_sizes(), reverse=True)
+    return math.prod(sizes[:3])
 
-        if ckt1 == ckt2:
-            continue
 
-        circuits.remove(ckt1)
-        ckt2 |= ckt1
+def part2(jboxes: list[JBox], pairs: list[tuple[int, int]]) -> int:
+    circuits = UnionFind(len(jboxes))
 
-        if len(circuits) == 1:
-            return jbox1[0] * jbox2[0]
+    i = circuits.union_many(pairs, components=1)
+    if i is None:
+        return -1
 
-    return -1
+    i1, i2 = pairs[i]
+    return jboxes[i1].x * jboxes[i2].x
 
 
 def main():
     # noinspection DuplicatedCode
     import argparse
-    import pathlib
 
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument(
+        "-n", type=int, help="connections for part 1 (default: 1000, or 10 for other inputs)"
+    )
     args = parser.parse_args()
 
     max_connections = 1000 if args.f == "input.txt" else 10
+    if args.n is not None:
+        max_connections = args.n
 
-    lines = pathlib.Path(args.f).read_text().splitlines()
+    rows = parse.int_rows(parse.read(args.f), 3).tolist()
 
-    jboxes: list[JBox] = []
-    for line in lines:
-        x, y, z = [int(n) for n in line.split(",")]
-        jboxes.append(JBox(x, y, z))
+    jboxes: list[JBox] = [JBox(x, y, z) for x, y, z in rows]
 
-    pairs = [(jbox1, jbox2) for i1, jbox1 in enumerate(jboxes) for jbox2 in jboxes[i1 + 1:]]
-    pairs.sort(key=lambda p: squared_distance(*p))
+    pairs = [(i1, i2) for i1 in range(len(jboxes)) for i2 in range(i1 + 1, len(jboxes))]
+    pairs.sort(key=lambda p: squared_distance(jboxes[p[0]], jboxes[p[1]]))
 
     print("part 1:", part1(jboxes, pairs, max_connections))
     print("part 2:", part2(jboxes, pairs))
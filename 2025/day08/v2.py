@@ -20,105 +20,72 @@ Tags: #disjoint-set #union-find
 Tags: #llm
 
 NB: While union find optimizes the core part of the algorithm, the total run
-    time is dominated by the edge sorting step!
+    time is dominated by the edge sorting step, so the edges are built and
+    sorted with NumPy.
 
 """
 
+import itertools
 import math
-from typing import NamedTuple
 
+import numpy as np
 
-class Node(NamedTuple):
-    x: int
-    y: int
-    z: int
+from aoc import parse
+from aoc.unionfind import UnionFind
 
+BLOCK = 4096  # edges converted to Python ints at a time in part 2
 
-class Edge(NamedTuple):
-    u: Node
-    v: Node
-    w: int
 
+def sorted_edges(nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """All (u, v) pairs of node ids, u < v, by increasing squared distance"""
+    u, v = np.triu_indices(len(nodes), k=1)
+    w = ((nodes[u] - nodes[v]) ** 2).sum(axis=1)
+    order = np.argsort(w, kind="stable")
+    return u[order], v[order]
 
-def make_edge(u: Node, v: Node) -> Edge:
-    dx = u.x - v.x
-    dy = u.y - v.y
-    dz = u.z - v.z
-    w = dx * dx + dy * dy + dz * dz
-    return Edge(u, v, w)
 
+def part1(nodes: np.ndarray, edges: tuple[np.ndarray, np.ndarray], max_connections: int) -> int:
+    uf = UnionFind(len(nodes))
 
-class UnionFind:
-    def __init__(self, nodes: list[Node]) -> None:
-        self.parent = {v: v for v in nodes}
-        self.size = {v: 1 for v in nodes}
-        self.num_components = len(nodes)
-
-    def find(self, u: Node) -> Node:
-        if self.parent[u] != u:
-            # Path compression: point directly to the root
-            self.parent[u] = self.find(self.parent[u])
-        return self.parent[u]
-
-    def union(self, u: Node, v: Node) -> bool:
-        """Returns True if a merge occurred."""
-        ru, rv = self.find(u), self.find(v)
-        if ru == rv:
-            return False
-
-        # Union by size: attach smaller tree under larger tree
-        if self.size[ru] < self.size[rv]:
-            ru, rv = rv, ru
-        self.parent[rv] = ru
-        self.size[ru] += self.size[rv]
-
-        self.num_components -= 1
-        return True
-
-    def component_sizes(self) -> list[int]:
-        return [self.size[v] for v in self.parent if v == self.parent[v]]
-
-
-def part1(nodes: list[Node], edges: list[Edge], max_connections: int) -> int:
-    uf = UnionFind(nodes)
-
-    for i, e in enumerate(edges):
-        if i >= max_connections:
-            break
-        uf.union(e.u, e.v)
+    u, v = edges
+    uf.union_many(zip(u[:max_connections].tolist(), v[:max_connections].tolist()))
 
     sizes = sorted(uf.component_sizes(), reverse=True)
     return math.prod(sizes[:3])
 
 
-def part2(nodes: list[Node], edges: list[Edge]) -> int:
-    uf = UnionFind(nodes)
+def part2(nodes: np.ndarray, edges: tuple[np.ndarray, np.ndarray]) -> int:
+    uf = UnionFind(len(nodes))
 
-    for e in edges:
-        if uf.union(e.u, e.v) and uf.num_components == 1:
-            return e.u.x * e.v.x
+    u, v = edges
+    # Converted a block at a time: the circuits join up long before the last edge
+    blocks = (
+        zip(u[i : i + BLOCK].tolist(), v[i : i + BLOCK].tolist()) for i in range(0, len(u), BLOCK)
+    )
+    i = uf.union_many(itertools.chain.from_iterable(blocks), components=1)
+    if i is None:
+        return -1
 
-    return -1
+    return int(nodes[u[i], 0] * nodes[v[i], 0])
 
 
 def main():
     # noinspection DuplicatedCode
     import argparse
-    import pathlib
 
     parser = argparse.ArgumentParser()
     parser.add_argument("-f", default="input.txt", help="input (default: input.txt)")
+    parser.add_argument(
+        "-n", type=int, help="connections for part 1 (default: 1000, or 10 for other inputs)"
+    )
     args = parser.parse_args()
 
     max_connections = 1000 if args.f == "input.txt" else 10
+    if args.n is not None:
+        max_connections = args.n
 
-    lines = pathlib.Path(args.f).read_text().splitlines()
-
-    nodes = [Node(*map(int, line.split(","))) for line in lines]
-    edges = [make_edge(u, v) for i, u in enumerate(nodes) for v in nodes[i + 1 :]]
-
-    # NB: this is the real bottleneck!
-    edges.sort(key=lambda e: e.w)
+    nodes = parse.int_rows(parse.read(args.f), 3)
+    edges = sorted_edges(nodes)
 
     print("part 1:", part1(nodes, edges, max_connections))
     print("part 2:", part2(nodes, edges))
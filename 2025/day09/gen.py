@@ -0,0 +1,27 @@
+"""Synthetic inputs for Day 9: Movie Theater
+
+The red tiles are the corners of a band of columns: a staircase going right
+along the tops of the columns and another coming back left along their
+bottoms. Every column straddles the middle height, so the polygon is simple.
+"""
+
+import random
+
+COLUMNS = 124  # input.txt has 4 * COLUMNS corners
+EXTENT = 100000
+
+
+def generate(scale: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    columns = COLUMNS * scale
+    xs = sorted(rng.sample(range(10 * columns), columns + 1))
+    mid = EXTENT // 2
+    tops = [rng.randint(mid + 1, EXTENT) for _ in range(columns)]
+    bottoms = [rng.randint(0, mid - 1) for _ in range(columns)]
+
+    corners = []
+    for i in range(columns):
+        corners += [(xs[i], tops[i]), (xs[i + 1], tops[i])]
+    for i in range(columns - 1, -1, -1):
+        corners += [(xs[i + 1], bottoms[i]), (xs[i], bottoms[i])]
+    return "".join(f"{x},{y}\n" for x, y in corners)
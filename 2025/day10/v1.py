@@ -29,7 +29,6 @@ from itertools import product
 from typing import NamedTuple
 
 import numpy as np
-from scipy import optimize
 
 
 class Machine(NamedTuple):
@@ -52,6 +51,8 @@ def ilp_solution(A: np.ndarray, b: np.ndarray) -> int:
     Minimize sum(x) such that A @ x = b, x >= 0
     Returns the minimum sum(x)
     """
+    from scipy import optimize
+
     m, n = A.shape
     c = np.ones(n)
     constraints = optimize.LinearConstraint(A, b, b)
@@ -0,0 +1,167 @@
+"""Benchmark solutions against a stored baseline
+
+Every solution is run `repeat` times, each time on a freshly imported module,
+and the wall time of each part is summarised as min/median/p95. One extra run
+under tracemalloc records the peak memory of each part, and the aoc.counters
+of the solution (counting is left out of the timed runs; its timers are slowed
+down by the tracing like everything else). The summaries can be saved to a
+baseline file (checked in) and later runs compared against it.
+
+The traced run happens in a separate process with a time limit, since tracing
+can make a solution many times slower and bigger; if it fails, the memory of
+that solution is left unknown.
+
+For days with a gen.py, scaling() times each part on synthetic inputs of
+growing size and fits the exponent k of t ~ scale**k, which tells an O(n)
+part from an O(n²) one well before the real input gets big enough to hurt.
+"""
+
+import json
+import math
+import statistics
+
+from aoc import runner, synthetic
+
+BASELINE_FILE = runner.ROOT / "benchmarks.json"
+
+# Parts faster than this are too noisy to gate on their wall time
+MIN_SECONDS = 1e-3
+
+# Scaling points faster than this are mostly overhead and left out of the fit
+FIT_MIN_SECONDS = 1e-4
+
+# How much longer than its slowest timed run the traced run may take: tracing
+# every allocation slows tight pure-Python loops down some 50 times
+TRACE_SLOWDOWN = 100
+
+
+def part_keys(parts):
+    """Unique key per part, e.g. "part 2" and "part 2 (2)" for a repeated label"""
+    keys = []
+    for part in parts:
+        key = part.label
+        n = 1
+        while key in keys:
+            n += 1
+            key = f"{part.label} ({n})"
+        keys.append(key)
+    return keys
+
+
+def percentile(values, p):
+    """Nearest-rank percentile"""
+    values = sorted(values)
+    return values[max(math.ceil(p / 100 * len(values)) - 1, 0)]
+
+
+def benchmark(solution, repeat=5, args=()):
+    """Return {part key: {"min", "median", "p95", "memory", "counters"}} for a solution"""
+    seconds = {}
+    slowest = 0.0
+    for _ in range(repeat):
+        result = runner.run(solution, args=args, fresh=True)
+        slowest = max(slowest, result.seconds)
+        for key, part in zip(part_keys(result.parts), result.parts):
+            seconds.setdefault(key, []).append(part.seconds)
+
+    try:
+        result = runner.run_isolated(
+            solution,
+            args=args,
+            fresh=True,  # not the module of the timed runs, with its caches filled
+            trace_memory=True,
+            counting=True,
+            timeout=max(60, TRACE_SLOWDOWN * slowest),
+        )
+        keys = part_keys(result.parts)
+        memory = {key: part.memory for key, part in zip(keys, result.parts)}
+        counts = {key: part.counters for key, part in zip(keys, result.parts) if part.counters}
+    except (Exception, SystemExit):
+        memory = counts = {}
+
+    return {
+        key: {
+            "min": round(min(values), 6),
+            "median": round(statistics.median(values), 6),
+            "p95": round(percentile(values, 95), 6),
+            "memory": memory.get(key),
+            "counters": counts.get(key),
+        }
+        for key, values in seconds.items()
+    }
+
+
+def regressions(name, stats, baseline, ratio):
+    """List the (part, metric, old, new) of a solution that grew past ratio"""
+    found = []
+    for key, new in stats.items():
+        old = baseline.get(name, {}).get(key)
+        if not old:
+            continue
+        if old.get("median", 0) >= MIN_SECONDS and new["median"] > ratio * old["median"]:
+            found.append((key, "median", old["median"], new["median"]))
+        if old.get("memory") and new["memory"] and new["memory"] > ratio * old["memory"]:
+            found.append((key, "memory", old["memory"], new["memory"]))
+    return found
+
+
+def missing(name, stats, baseline):
+    """The parts of a solution that have no baseline to check them against"""
+    return [key for key in stats if key not in baseline.get(name, {})]
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(seconds) against log(scale), or None"""
+    points = [(math.log(scale), math.log(t)) for scale, t in points if t >= FIT_MIN_SECONDS]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    return round(sxy / sxx, 2)
+
+
+def scaling(solution, scales=(1, 10, 100), seed=0, max_seconds=60):
+    """Time a solution on synthetic inputs and fit a complexity exponent per part
+
+    Returns ({scale: {part key: seconds}}, {part key: exponent}). Scales are
+    tried in increasing order, each with a max_seconds time limit, and the
+    study stops at the first failure or when even linear growth would take the
+    next scale past the limit.
+    """
+    seconds = {}
+    scales = sorted(scales)
+    for scale, next_scale in zip(scales, scales[1:] + [None]):
+        args = synthetic.input_args(solution, scale, seed=seed)
+        try:
+            result = runner.run_isolated(solution, args=args, timeout=max_seconds)
+        except (Exception, SystemExit):
+            break
+        seconds[scale] = {
+            key: part.seconds for key, part in zip(part_keys(result.parts), result.parts)
+        }
+        if next_scale and result.seconds * next_scale / scale > max_seconds:
+            break
+
+    keys = dict.fromkeys(key for parts in seconds.values() for key in parts)
+    exponents = {
+        key: fit_exponent([(scale, parts[key]) for scale, parts in seconds.items() if key in parts])
+        for key in keys
+    }
+    return seconds, exponents
+
+
+def load_baseline(file=BASELINE_FILE):
+    if not file.exists():
+        return {}
+    return json.loads(file.read_text())
+
+
+def save_baseline(results, file=BASELINE_FILE):
+    """Merge {solution name: {part key: stats}} into the baseline file"""
+    baseline = load_baseline(file)
+    for name, stats in results.items():
+        for key, values in stats.items():
+            baseline.setdefault(name, {}).setdefault(key, {}).update(values)
+    file.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
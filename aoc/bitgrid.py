@@ -0,0 +1,118 @@
+"""Sets of map cells as the bits of one big int
+
+A BitGrid numbers the cells of a map (of any number of dimensions) row-major,
+with one always-clear guard cell at the end of every row (and plane, ...), and
+represents a set of cells as the int with those bits set. Moving a whole set
+one cell along an axis is then a single shift by that axis' stride (the guard
+cells stop it from wrapping into the next row), and intersecting it with the
+open cells a single AND, so a BFS step costs time in proportion to the size of
+the map in machine words rather than the number of cells on the frontier:
+
+    grid = BitGrid(walls.shape)
+    open_ = grid.from_array(~walls)
+    for d, layer in enumerate(bfs_layers(grid.bit(start), lambda f: grid.spread(f, open_))):
+        ...
+
+int.bit_count() counts the cells of a set.
+"""
+
+import math
+
+import numpy as np
+
+
+class BitGrid:
+    def __init__(self, shape):
+        self.shape = tuple(shape)
+        # A guard cell on every axis but the first
+        self.padded = (self.shape[0], *(n + 1 for n in self.shape[1:]))
+        self.strides = [math.prod(self.padded[i + 1 :]) for i in range(len(self.shape))]
+        self.size = math.prod(self.padded)
+        self.all = self.from_array(np.ones(self.shape, dtype=bool))
+        self._planes = {}
+
+    def from_array(self, mask):
+        """Bits of the true cells of a boolean array of the map's shape"""
+        padded = np.zeros(self.padded, dtype=bool)
+        padded[tuple(slice(0, n) for n in self.shape)] = mask
+        packed = np.packbits(padded.reshape(-1), bitorder="little")
+        return int.from_bytes(packed.tobytes(), "little")
+
+    def to_array(self, bits):
+        """Boolean array of the map's shape with the cells in bits set"""
+        packed = np.frombuffer(bits.to_bytes((self.size + 7) // 8, "little"), dtype=np.uint8)
+        padded = np.unpackbits(packed, count=self.size, bitorder="little").astype(bool)
+        return padded.reshape(self.padded)[tuple(slice(0, n) for n in self.shape)]
+
+    def index(self, position):
+        return sum(p * s for p, s in zip(position, self.strides))
+
+    def bit(self, position):
+        """Bits of the single cell at position"""
+        return 1 << self.index(position)
+
+    def cells(self, bits):
+        """Positions of the cells in bits"""
+        return [tuple(p) for p in np.argwhere(self.to_array(bits)).tolist()]
+
+    def plane(self, axis, i):
+        """Bits of the cells at index i along axis"""
+        if (axis, i) not in self._planes:
+            mask = np.zeros(self.shape, dtype=bool)
+            mask[(slice(None),) * axis + (i,)] = True
+            self._planes[axis, i] = self.from_array(mask)
+        return self._planes[axis, i]
+
+    def shift(self, bits, axis, step):
+        """The cells moved one cell along axis (step +1 or -1), dropping those that leave"""
+        if step > 0:
+            return (bits << self.strides[axis]) & self.all
+        return bits >> self.strides[axis] & self.all
+
+    def roll(self, bits, axis, step, start=0, stop=None):
+        """The cells moved one cell along axis, wrapping around within [start, stop)
+
+        All the cells must lie within [start, stop) along axis.
+        """
+        stop = self.shape[axis] if stop is None else stop
+        stride = self.strides[axis]
+        span = stride * (stop - 1 - start)
+        if step > 0:
+            last = self.plane(axis, stop - 1)
+            return (bits & ~last) << stride | (bits & last) >> span
+        first = self.plane(axis, start)
+        return (bits & ~first) >> stride | (bits & first) << span
+
+    def neighbours(self, bits):
+        """The cells next to one in bits, along any axis"""
+        spread = 0
+        for stride in self.strides:
+            spread |= bits << stride | bits >> stride
+        return spread & self.all
+
+    def spread(self, bits, open_):
+        """The open cells next to one in bits"""
+        return self.neighbours(bits) & open_
+
+
+def bfs_layers(sources, step):
+    """Yield the bits of the cells first reached after 0, 1, 2, ... steps
+
+    step(frontier) gives the cells one step away from the frontier, e.g.
+    lambda f: grid.spread(f, open_).
+    """
+    visited = layer = sources
+    while layer:
+        yield layer
+        layer = step(layer) & ~visited
+        visited |= layer
+
+
+def layer_counts(sources, step, steps=None):
+    """Number of cells in each BFS layer, up to `steps` steps"""
+    counts = []
+    for d, layer in enumerate(bfs_layers(sources, step)):
+        counts.append(layer.bit_count())
+        if d == steps:
+            break
+    return counts
@@ -0,0 +1,116 @@
+"""On-disk cache of solution results
+
+A result is stored under a key made of the hash of the solution source (with
+the local modules it imports, from its day folder or the aoc package), the
+hash of its input file and its command-line args. Editing a solution, a module
+it uses or its input therefore misses the cache, while re-running untouched
+solutions returns their answers (and recorded part timings) instantly.
+
+The cache lives in .cache/results, one JSON file per result. Reading an entry
+touches it, and the least recently used entries are evicted once the cache
+grows past MAX_BYTES.
+"""
+
+import ast
+import hashlib
+import json
+import os
+
+from aoc import runner
+
+RESULTS_DIR = runner.ROOT / ".cache" / "results"
+MAX_BYTES = 16 * 1024 * 1024
+
+
+def local_imports(path):
+    """Paths of the modules imported by path that live in the repo"""
+    names = []
+    for node in ast.walk(ast.parse(path.read_bytes())):
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names += [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+
+    paths = []
+    for name in names:
+        parts = name.split(".")
+        if parts[0] == "aoc":
+            candidates = [runner.ROOT.joinpath(*parts).with_suffix(".py")]
+        else:
+            candidates = [path.parent.joinpath(*parts).with_suffix(".py")]
+        candidates.append(candidates[0].with_suffix("") / "__init__.py")
+        paths += [c for c in candidates if c.exists()]
+    return paths
+
+
+def source_hash(solution):
+    """Hash of a solution and, transitively, of the local modules it imports"""
+    digest = hashlib.sha256()
+    seen = set()
+    queue = [solution.path]
+    while queue:
+        path = queue.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        queue += local_imports(path)
+    for path in sorted(seen):
+        digest.update(str(path.relative_to(runner.ROOT)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def input_file(solution, args=()):
+    """The input a run reads: the -f argument, or input.txt"""
+    args = list(args)
+    if "-f" in args[:-1]:
+        return solution.folder / args[args.index("-f") + 1]
+    return solution.folder / "input.txt"
+
+
+def key(solution, args=()):
+    digest = hashlib.sha256()
+    digest.update(source_hash(solution).encode())
+    file = input_file(solution, args)
+    if file.exists():
+        digest.update(hashlib.sha256(file.read_bytes()).digest())
+    digest.update(json.dumps(list(args)).encode())
+    return digest.hexdigest()
+
+
+def get(solution, args=()):
+    """The cached result of running a solution with args, or None"""
+    file = RESULTS_DIR / f"{key(solution, args)}.json"
+    if not file.exists():
+        return None
+    entry = json.loads(file.read_text())
+    os.utime(file)
+    parts = [runner.Part(*part) for part in entry["parts"]]
+    return runner.Result(solution, parts, entry["seconds"], entry["output"], cached=True)
+
+
+def put(result, args=()):
+    """Store a result, evicting the least recently used entries if needed"""
+    entry = {
+        "solution": result.solution.name,
+        "parts": [list(part) for part in result.parts],
+        "seconds": result.seconds,
+        "output": result.output,
+    }
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    file = RESULTS_DIR / f"{key(result.solution, args)}.json"
+    tmp = file.with_suffix(".tmp")
+    tmp.write_text(json.dumps(entry))
+    tmp.replace(file)
+    evict()
+
+
+def evict(max_bytes=MAX_BYTES):
+    """Remove the least recently used entries until the cache fits max_bytes"""
+    entries = [(file.stat(), file) for file in RESULTS_DIR.glob("*.json")]
+    total = sum(stat.st_size for stat, _ in entries)
+    for stat, file in sorted(entries, key=lambda entry: entry[0].st_mtime):
+        if total <= max_bytes:
+            break
+        file.unlink(missing_ok=True)
+        total -= stat.st_size
@@ -0,0 +1,80 @@
+"""Compare the versions of a day on the same input
+
+All versions are run on the same input (the real input.txt, or a synthetic
+input at some scale), their answers are checked to be equal, and the best wall
+time and the peak memory of each part are collected for a side-by-side table.
+"""
+
+import itertools
+from typing import NamedTuple
+
+from aoc import bench, runner
+
+
+class Row(NamedTuple):
+    version: int
+    answer: str  # or why there is none, for a version that did not answer
+    seconds: float | None  # None if the version did not answer the part
+    memory: int | None
+
+
+def multi_version_days(solutions):
+    """Group solutions by day, keeping the days with more than one version"""
+    days = []
+    for _, versions in itertools.groupby(solutions, key=lambda s: (s.year, s.day)):
+        versions = list(versions)
+        if len(versions) > 1:
+            days.append(versions)
+    return days
+
+
+def best_of(solution, args=(), repeat=3):
+    """Run a version and return {part key: Row} with the best time of repeat runs"""
+    best = {}
+    answers = {}
+    for _ in range(repeat):
+        result = runner.run(solution, args=args, fresh=True)
+        for key, part in zip(bench.part_keys(result.parts), result.parts):
+            best[key] = min(best.get(key, part.seconds), part.seconds)
+            answers[key] = part.answer
+    try:
+        result = runner.run_isolated(solution, args=args, trace_memory=True)
+        memory = {k: p.memory for k, p in zip(bench.part_keys(result.parts), result.parts)}
+    except (Exception, SystemExit):
+        memory = {}
+
+    return {key: Row(solution.version, answers[key], best[key], memory.get(key)) for key in best}
+
+
+def compare(versions, args=(), repeat=3):
+    """Run each version and return {part key: [Row per version]}
+
+    A version that fails, or skips a part the others answer, still gets a row
+    for it, with the error (or "no answer") and no time.
+    """
+    runs = {}
+    for solution in versions:
+        try:
+            runs[solution] = best_of(solution, args=args, repeat=repeat)
+        except (Exception, SystemExit) as e:
+            runs[solution] = f"failed: {e!r}"
+
+    keys = dict.fromkeys(key for rows in runs.values() if isinstance(rows, dict) for key in rows)
+    table = {}
+    for key in keys or ["all parts"]:
+        for solution, rows in runs.items():
+            if isinstance(rows, str):
+                row = Row(solution.version, rows, None, None)
+            else:
+                row = rows.get(key, Row(solution.version, "no answer", None, None))
+            table.setdefault(key, []).append(row)
+    return table
+
+
+def mismatches(table):
+    """Part keys whose answers are not the same for every version, or missing from one"""
+    return [
+        key
+        for key, rows in table.items()
+        if len({row.answer for row in rows}) > 1 or any(row.seconds is None for row in rows)
+    ]
@@ -0,0 +1,77 @@
+"""Opt-in counters and timers for the hot loops of solutions
+
+Solutions count what their searches do (states explored, cache hits, heap
+pushes, ...) under a name, and time stretches of code:
+
+    from aoc import counters
+    ...
+    counters.count("max_geodes states", explored)
+    with counters.timer("shortest_distance"):
+        ...
+    counters.cache_stats("arrangements", arrangements)  # a functools.cache function
+
+Everything is off unless a runner calls enable() (bin/run.py --counters, and
+the traced run of bin/bench.py), and then count() and cache_stats() return at
+once and timer() is a shared no-op context manager. In a hot loop, tally into
+a local and count() once after the loop rather than calling count() for every
+step. The runner takes the values of each part with split() when it prints
+its "part N:" line.
+"""
+
+import contextlib
+import time
+from collections import Counter
+
+enabled = False
+
+_values = Counter()  # name -> count, or seconds for a timer
+_cache_seen = {}  # cached function -> (hits, misses) already counted
+_off = contextlib.nullcontext()
+
+
+def enable(on=True):
+    """Turn counting on (or off) and clear the values"""
+    global enabled
+    enabled = on
+    _values.clear()
+    _cache_seen.clear()
+
+
+def count(name, n=1):
+    if enabled:
+        _values[name] += n
+
+
+def cache_stats(name, function):
+    """Count the hits and misses of a functools.cache function since the last call
+
+    The first call counts all of them since the cache was created (or cleared).
+    """
+    if not enabled:
+        return
+    info = function.cache_info()
+    hits, misses = _cache_seen.get(function, (0, 0))
+    _values[f"{name} hits"] += info.hits - hits
+    _values[f"{name} misses"] += info.misses - misses
+    _cache_seen[function] = info.hits, info.misses
+
+
+@contextlib.contextmanager
+def _timer(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _values[name] += time.perf_counter() - start
+
+
+def timer(name):
+    """Context manager that adds the seconds spent in it to the timer name"""
+    return _timer(name) if enabled else _off
+
+
+def split():
+    """The values since the last split ({name: count or seconds}), and start again"""
+    values = dict(_values)
+    _values.clear()
+    return values
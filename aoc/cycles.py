@@ -0,0 +1,78 @@
+"""Cycle detection for long simulations
+
+A deterministic simulation with finitely many states must eventually repeat
+itself, after which step 10**12 is just some earlier step again. find_cycle()
+finds where the repeat starts and how long it is with Brent's algorithm, which
+compares a fingerprint of the current state against a single saved one, rather
+than keeping a dict of every state seen so far:
+
+    cycle = find_cycle(Tower, Tower.drop_rock, key=Tower.fingerprint, metric=Tower.height)
+    cycle.extrapolate(10**12)  # height after 10**12 steps
+
+key(state) is a compact, hashable fingerprint that determines everything that
+happens next (e.g. the top rows of a tower, but not its height), and
+metric(state) is any number that changes by the same amount in every period
+(like the height), or not at all (like anything computed from the state alone).
+
+Reference: https://en.wikipedia.org/wiki/Cycle_detection#Brent's_algorithm
+"""
+
+import itertools
+from collections import deque
+from typing import NamedTuple
+
+
+class Cycle(NamedTuple):
+    start: int  # first step of the cycle (mu)
+    period: int  # length of the cycle (lambda)
+    metrics: list  # metric at steps 0 .. start + period (empty without a metric)
+
+    def step(self, n: int) -> int:
+        """The first step with the same state as step n"""
+        if n < self.start:
+            return n
+        return self.start + (n - self.start) % self.period
+
+    def extrapolate(self, n: int):
+        """The metric at step n"""
+        if n < len(self.metrics):
+            return self.metrics[n]
+        cycles, offset = divmod(n - self.start, self.period)
+        m = self.metrics
+        return m[self.start + offset] + cycles * (m[-1] - m[self.start])
+
+
+def find_cycle(initial, step, key=lambda state: state, metric=None) -> Cycle:
+    """The cycle of the states initial(), step(initial()), step(step(initial())), ...
+
+    initial() is called twice and must return a fresh start state each time, so
+    step(state) may update state in place (and return it) as well as return a
+    new one.
+    """
+    # Brent: save the fingerprint at steps 2**k - 1 and look for it again in the
+    # next 2**k steps, which gives the period once 2**k is past both mu and lambda
+    state = initial()
+    saved = key(state)
+    state = step(state)
+    power = period = 1
+    while (current := key(state)) != saved:
+        if power == period:
+            saved = current
+            power *= 2
+            period = 0
+        state = step(state)
+        period += 1
+
+    # Replay from the start, comparing every fingerprint with the one a period
+    # earlier: the first match is one period past the start of the cycle
+    window = deque(maxlen=period)
+    metrics = []
+    state = initial()
+    for n in itertools.count():
+        current = key(state)
+        if metric is not None:
+            metrics.append(metric(state))
+        if len(window) == period and window[0] == current:
+            return Cycle(n - period, period, metrics)
+        window.append(current)
+        state = step(state)
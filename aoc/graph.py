@@ -0,0 +1,152 @@
+"""Graphs in compressed sparse row (CSR) form
+
+Node labels (grid positions, valve names, search states, ...) are interned to
+integer ids 0..n-1, and the out-edges of node u are indices[indptr[u]:indptr[u+1]]
+with their weights at the same positions. The arrays are NumPy arrays, so big
+graphs can be built vectorised (see from_arrays()), and the traversals below
+read them through memoryviews, which index like lists without holding a Python
+object per edge.
+
+Traversals work on ids: use graph.id(label) and graph.label(id) to convert.
+"""
+
+import heapq
+import math
+
+import numpy as np
+
+from aoc import counters
+
+INF = 1 << 60  # distance of unreachable nodes in all_pairs_shortest_paths()
+
+
+class Graph:
+    """Directed graph with integer edge weights"""
+
+    def __init__(self, edges=(), nodes=()):
+        """Graph from (u, v) or (u, v, weight) edges between hashable labels
+
+        Nodes without edges can be given in nodes. Weights default to 1.
+        """
+        ids = {}
+        for u in nodes:
+            ids.setdefault(u, len(ids))
+        sources, targets, weights = [], [], []
+        for u, v, *w in edges:
+            sources.append(ids.setdefault(u, len(ids)))
+            targets.append(ids.setdefault(v, len(ids)))
+            weights.append(w[0] if w else 1)
+        self._build(list(ids), sources, targets, weights)
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights=None, nodes=None):
+        """Graph from NumPy arrays of integer labels (e.g. flat grid indices)"""
+        sources = np.asarray(sources)
+        targets = np.asarray(targets)
+        parts = [sources, targets] if nodes is None else [sources, targets, np.asarray(nodes)]
+        labels, ids = np.unique(np.concatenate(parts), return_inverse=True)
+        graph = cls.__new__(cls)
+        graph._build(
+            labels,
+            ids[: len(sources)],
+            ids[len(sources) : len(sources) + len(targets)],
+            np.ones(len(sources), dtype=np.int64) if weights is None else weights,
+        )
+        return graph
+
+    def _build(self, labels, sources, targets, weights):
+        # A list of labels, or a sorted array of integer labels (from_arrays)
+        self.labels = labels
+        self.ids = None
+        if not isinstance(labels, np.ndarray):
+            self.ids = {label: i for i, label in enumerate(labels)}
+        sources = np.asarray(sources, dtype=np.int64)
+        order = np.argsort(sources, kind="stable")
+        self.indices = np.asarray(targets, dtype=np.int64)[order]
+        self.weights = np.asarray(weights, dtype=np.int64)[order]
+        counts = np.bincount(sources, minlength=len(labels))
+        self.indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+        self._indptr = memoryview(self.indptr)
+        self._indices = memoryview(self.indices)
+        self._weights = memoryview(self.weights)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        try:
+            self.id(label)
+        except KeyError:
+            return False
+        return True
+
+    def id(self, label):
+        if self.ids is not None:
+            return self.ids[label]
+        i = int(np.searchsorted(self.labels, label))
+        if i == len(self.labels) or self.labels[i] != label:
+            raise KeyError(label)
+        return i
+
+    def label(self, id_):
+        if self.ids is not None:
+            return self.labels[id_]
+        return int(self.labels[id_])
+
+    def neighbors(self, u):
+        """Ids of the out-neighbours of u"""
+        return self._indices[self._indptr[u] : self._indptr[u + 1]]
+
+    def edges(self, u):
+        """(v, weight) of the out-edges of u"""
+        start, stop = self._indptr[u], self._indptr[u + 1]
+        return zip(self._indices[start:stop], self._weights[start:stop])
+
+    def reversed(self):
+        """The graph with every edge turned around"""
+        sources = np.repeat(np.arange(len(self)), np.diff(self.indptr))
+        graph = Graph.__new__(Graph)
+        graph._build(self.labels, self.indices, sources, self.weights)
+        return graph
+
+
+def dijkstra(graph, source):
+    """Shortest distances (inf if unreachable) and predecessors (None) from source"""
+    dist = [math.inf] * len(graph)
+    prev = [None] * len(graph)
+    dist[source] = 0
+    indptr, indices, weights = graph._indptr, graph._indices, graph._weights
+
+    queue = [(0, source)]  # Min dist based priority queue: [(dist, node), ...]
+    pushes = 1
+    stale = 0
+    while queue:
+        dist_su, u = heapq.heappop(queue)
+        if dist_su > dist[u]:
+            stale += 1
+            continue  # stale entry
+        for i in range(indptr[u], indptr[u + 1]):
+            v = indices[i]
+            dist_sv = dist_su + weights[i]
+            if dist_sv < dist[v]:
+                dist[v] = dist_sv
+                prev[v] = u
+                heapq.heappush(queue, (dist_sv, v))
+                pushes += 1
+
+    counters.count("dijkstra pushes", pushes)
+    counters.count("dijkstra stale pops", stale)
+    return dist, prev
+
+
+def all_pairs_shortest_paths(graph):
+    """n x n array of shortest distances (INF if unreachable), by Floyd–Warshall"""
+    n = len(graph)
+    dist = np.full((n, n), INF, dtype=np.int64)
+    sources = np.repeat(np.arange(n), np.diff(graph.indptr))
+    np.minimum.at(dist, (sources, graph.indices), graph.weights)
+    np.fill_diagonal(dist, 0)
+    for k in range(n):
+        np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+    return dist
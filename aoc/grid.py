@@ -0,0 +1,99 @@
+"""2D maps as padded NumPy arrays
+
+A Grid keeps the map in one contiguous array with a border of `pad` fill cells
+around it, so that stepping off the map lands on a fill cell instead of
+needing a bounds check. Cells can be addressed by (r, c) in map coordinates or
+by their flat index into the array, where a neighbour is just a fixed offset
+away (see offsets()). Hot loops can use `cells`, a memoryview of the flat array
+that indexes like a list but shares the NumPy memory.
+
+Whole-map operations are vectorised over boolean masks of the padded shape,
+e.g. count_neighbours() or spread().
+"""
+
+import numpy as np
+
+from aoc import parse
+
+ORTHOGONAL = [(-1, 0), (0, -1), (1, 0), (0, 1)]  # up, left, down, right
+DIAGONAL = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+ALL = ORTHOGONAL + DIAGONAL
+
+
+class Grid:
+    def __init__(self, values, pad=1, fill=0):
+        values = np.asarray(values)
+        self.R, self.C = values.shape
+        self.pad = pad
+        self.array = np.full((self.R + 2 * pad, self.C + 2 * pad), fill, dtype=values.dtype)
+        self.array[pad : pad + self.R, pad : pad + self.C] = values
+        self.stride = self.C + 2 * pad  # flat index distance between rows
+        self.flat = self.array.reshape(-1)  # view
+        self.cells = memoryview(self.flat)
+
+    @classmethod
+    def from_lines(cls, lines, pad=1, fill="."):
+        """Grid of the characters (as uint8 bytes) of some equal-length lines"""
+        values = np.array([list(line.encode()) for line in lines], dtype=np.uint8)
+        return cls(values, pad=pad, fill=ord(fill))
+
+    @classmethod
+    def from_text(cls, data, pad=1, fill="."):
+        """Grid of the characters of a whole input (see aoc.parse.char_grid())"""
+        return cls(parse.char_grid(data), pad=pad, fill=ord(fill))
+
+    @classmethod
+    def from_digits(cls, lines, pad=1, fill=0):
+        """Grid of single-digit numbers"""
+        values = np.array([list(line.encode()) for line in lines], dtype=np.uint8) - ord("0")
+        return cls(values, pad=pad, fill=fill)
+
+    @property
+    def inner(self):
+        """View of the map without its border"""
+        p = self.pad
+        return self.array[p : p + self.R, p : p + self.C]
+
+    def index(self, r, c):
+        """Flat index of map position (r, c)"""
+        return (r + self.pad) * self.stride + c + self.pad
+
+    def position(self, index):
+        """Map position (r, c) of a flat index"""
+        r, c = divmod(index, self.stride)
+        return r - self.pad, c - self.pad
+
+    def offsets(self, directions=ORTHOGONAL):
+        """Flat index offsets of (dr, dc) steps"""
+        return [dr * self.stride + dc for dr, dc in directions]
+
+    def indices(self, mask=None):
+        """Flat indices of the map cells (where mask, of the padded shape, is set)"""
+        if mask is None:
+            mask = np.zeros(self.array.shape, dtype=bool)
+            mask[self.pad : self.pad + self.R, self.pad : self.pad + self.C] = True
+        return np.flatnonzero(mask).tolist()
+
+    def mask(self):
+        """An all-False mask of the padded shape"""
+        return np.zeros(self.array.shape, dtype=bool)
+
+    def shifted(self, mask, dr, dc):
+        """Values of mask at (r + dr, c + dc), for each map cell (r, c)"""
+        p = self.pad
+        return mask[p + dr : p + dr + self.R, p + dc : p + dc + self.C]
+
+    def count_neighbours(self, mask, directions=ALL):
+        """Number of directions in which each cell has a set neighbour
+
+        Returns an array of the padded shape (zero on the border).
+        """
+        counts = np.zeros(self.array.shape, dtype=np.uint8)
+        inner = counts[self.pad : self.pad + self.R, self.pad : self.pad + self.C]
+        for dr, dc in directions:
+            inner += self.shifted(mask, dr, dc)
+        return counts
+
+    def spread(self, mask, directions=ORTHOGONAL):
+        """Cells reachable from a set cell in one step of the given directions"""
+        return self.count_neighbours(mask, [(-dr, -dc) for dr, dc in directions]) > 0
@@ -0,0 +1,108 @@
+"""Sets of integers as sorted, disjoint half-open intervals
+
+An IntervalSet keeps its intervals [start, stop) as one sorted list of
+boundaries [start0, stop0, start1, stop1, ...], so x is in the set exactly when
+an odd number of boundaries are <= x, which bisect finds in O(log n). Overlapping
+and touching intervals are merged on construction.
+"""
+
+import bisect
+import operator
+
+
+class IntervalSet:
+    def __init__(self, intervals=()):
+        """Set of the (start, stop) intervals, in any order and possibly overlapping"""
+        bounds = []
+        for start, stop in sorted(intervals):
+            if start >= stop:
+                continue
+            if bounds and start <= bounds[-1]:
+                if stop > bounds[-1]:
+                    bounds[-1] = stop
+            else:
+                bounds += (start, stop)
+        self._bounds = bounds
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        intervals = cls.__new__(cls)
+        intervals._bounds = bounds
+        return intervals
+
+    def __repr__(self):
+        return "IntervalSet([" + ", ".join(f"[{a}, {b})" for a, b in self) + "])"
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self._bounds == other._bounds
+
+    def __iter__(self):
+        """The (start, stop) intervals, in order"""
+        return zip(self._bounds[::2], self._bounds[1::2])
+
+    def __len__(self):
+        """Number of intervals"""
+        return len(self._bounds) // 2
+
+    def __bool__(self):
+        return bool(self._bounds)
+
+    def __contains__(self, x):
+        return bisect.bisect_right(self._bounds, x) & 1 == 1
+
+    @property
+    def length(self):
+        """Number of integers in the set"""
+        b = self._bounds
+        return sum(b[1::2]) - sum(b[::2])
+
+    @property
+    def start(self):
+        """Smallest integer in the set"""
+        return self._bounds[0]
+
+    @property
+    def stop(self):
+        """One past the largest integer in the set"""
+        return self._bounds[-1]
+
+    def covers(self, start, stop):
+        """Whether all of [start, stop) is in the set"""
+        i = bisect.bisect_right(self._bounds, start)
+        return i & 1 == 1 and stop <= self._bounds[i]
+
+    def _combine(self, other, op):
+        # Each boundary of either set starts a stretch that is wholly in or out
+        # of both, so the result only changes at those points
+        bounds = []
+        inside = False
+        for x in sorted(set(self._bounds) | set(other._bounds)):
+            if op(x in self, x in other) != inside:
+                inside = not inside
+                bounds.append(x)
+        return IntervalSet._from_bounds(bounds)
+
+    def __or__(self, other):
+        return self._combine(other, operator.or_)
+
+    def __and__(self, other):
+        return self._combine(other, operator.and_)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a and not b)
+
+    def shifted(self, offset):
+        """The set moved by offset"""
+        return IntervalSet._from_bounds([x + offset for x in self._bounds])
+
+    def translate(self, shifts):
+        """The set with its part inside each (start, stop) moved by that offset
+
+        shifts is [((start, stop), offset), ...] with disjoint intervals; the
+        rest of the set stays where it is.
+        """
+        moved = []
+        for interval, offset in shifts:
+            moved.extend((self & IntervalSet([interval])).shifted(offset))
+        rest = self - IntervalSet(interval for interval, _ in shifts)
+        return IntervalSet([*rest, *moved])
@@ -0,0 +1,114 @@
+"""Per-part memory measurements
+
+Two numbers are taken for every part:
+
+- the peak resident set size of the process (VmHWM), reset at every part line
+  through /proc/self/clear_refs, so it is the high-water mark of that part
+  (including whatever the process held when the part started). Linux only;
+  elsewhere it is the peak of the whole process so far.
+- with tracing, the tracemalloc peak of the part and, optionally, its top
+  allocation sites. tracemalloc cannot snapshot the moment of the peak, so a
+  CPU-time timer takes a snapshot whenever traced memory has grown well past
+  the last one; the sites are those of the largest snapshot of the part.
+"""
+
+import pathlib
+import resource
+import signal
+import sys
+import threading
+import tracemalloc
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+TOP_SITES = 5
+INTERVAL = 10e-3  # CPU seconds between checks of the traced memory
+GROWTH = 2  # snapshot again once traced memory has grown this much (snapshots are slow)
+
+_STATUS = pathlib.Path("/proc/self/status")
+_CLEAR_REFS = pathlib.Path("/proc/self/clear_refs")
+
+
+def peak_rss():
+    """Peak resident set size of this process, in bytes"""
+    if _STATUS.exists():
+        for line in _STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def reset_peak_rss():
+    """Restart the peak RSS from the current RSS (Linux only)"""
+    try:
+        _CLEAR_REFS.write_text("5")
+    except OSError:
+        pass
+
+
+def site_name(frame):
+    path = pathlib.Path(frame.filename)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    else:
+        path = path.name
+    return f"{path}:{frame.lineno}"
+
+
+class PartTracer:
+    """Traces the allocations of a solution run, part by part"""
+
+    def __init__(self, sites=False):
+        self.with_sites = sites
+        self.best = 0  # traced size of the snapshot behind self.sites
+        self.sites = None
+        self.watching = False
+        self.busy = False  # a snapshot can outlast the timer interval
+
+    def start(self):
+        tracemalloc.start()
+        # Signals are only delivered to the main thread
+        self.watching = self.with_sites and threading.current_thread() is threading.main_thread()
+        if self.watching:
+            self.saved_handler = signal.signal(signal.SIGVTALRM, self.check)
+            signal.setitimer(signal.ITIMER_VIRTUAL, INTERVAL, INTERVAL)
+
+    def stop(self):
+        if self.watching:
+            signal.setitimer(signal.ITIMER_VIRTUAL, 0)
+            signal.signal(signal.SIGVTALRM, self.saved_handler)
+        tracemalloc.stop()
+
+    def check(self, signum=None, frame=None):
+        if self.busy:
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        if current > GROWTH * self.best:
+            self.snapshot(current)
+
+    def snapshot(self, current):
+        self.busy = True
+        try:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                ]
+            )
+            stats = snapshot.statistics("lineno")[:TOP_SITES]
+            self.sites = [(site_name(stat.traceback[0]), stat.size) for stat in stats]
+            self.best = current
+        finally:
+            self.busy = False
+
+    def split(self):
+        """End the current part, returning its (traced peak, top sites or None)"""
+        current, peak = tracemalloc.get_traced_memory()
+        if self.with_sites and current > self.best:
+            self.snapshot(current)
+        sites = self.sites
+        tracemalloc.reset_peak()
+        self.best = 0
+        self.sites = None
+        return peak, sites
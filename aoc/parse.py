@@ -0,0 +1,213 @@
+"""Bulk input parsing
+
+The input is read once as bytes (memory-mapped when it is large) and parsed in
+whole-input NumPy passes instead of line by line with re.findall() and int():
+
+    data = parse.read(args.f)
+    rows = parse.int_rows(data, 4)  # e.g. "Sensor at x=2, y=18: ... x=-2, y=15"
+
+The helpers take bytes, anything else that exports a buffer (e.g. the mmap
+returned by read()), or str. ints() parses inputs bigger than CHUNK_SIZE a
+block at a time, which bounds its temporary arrays, and int_chunks() does the
+same for a binary file (or stdin) without ever holding all of it, as does
+group_sums() for the sums of blank-line separated groups of numbers.
+"""
+
+import mmap
+import pathlib
+
+import numpy as np
+
+MMAP_THRESHOLD = 1 << 20  # files at least this big are memory-mapped by read()
+MAX_DIGITS = 18  # longest run of digits that always fits in an int64
+CHUNK_SIZE = 1 << 22  # bytes parsed at a time by ints() and int_chunks()
+
+_POW10 = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+
+_NUMBER_CHARS = b"-0123456789"
+
+# Tables for bytes.translate() that blank out every byte that is not part of a
+# number, unsigned and signed
+_UNSIGNED = bytes(c if c in b"0123456789" else ord(" ") for c in range(256))
+_SIGNED = bytes(c if c in _NUMBER_CHARS else ord(" ") for c in range(256))
+
+
+def read(path, mmap_threshold=MMAP_THRESHOLD):
+    """Contents of a file as bytes, or as a read-only mmap if it is large"""
+    path = pathlib.Path(path)
+    if path.stat().st_size < max(mmap_threshold, 1):
+        return path.read_bytes()
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _chars(data):
+    if isinstance(data, str):
+        data = data.encode()
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def _blocks(reads):
+    """The bytes from reads, re-cut into blocks that end between two numbers"""
+    rest = b""
+    for block in reads:
+        data = rest + block
+        head = data.rstrip(_NUMBER_CHARS)
+        rest = data[len(head) :]
+        if head:
+            yield head
+    if rest:
+        yield rest
+
+
+def ints(data, signed=True):
+    """All the integers in data, in order, as an int64 array
+
+    Like re.findall(r"-?\\d+") (or r"\\d+" if not signed): a "-" right before
+    the digits makes the number negative, so ranges like "2-4" need signed=False.
+    """
+    chars = _chars(data)
+    if len(chars) > CHUNK_SIZE:
+        view = memoryview(chars)
+        reads = (bytes(view[i : i + CHUNK_SIZE]) for i in range(0, len(chars), CHUNK_SIZE))
+        return np.concatenate([_ints(block, signed) for block in _blocks(reads)])
+    return _ints(data, signed)
+
+
+def _ints(data, signed):
+    if isinstance(data, str):
+        data = data.encode()
+    # With everything else blanked out, NumPy's text parser reads the numbers in
+    # a single pass, without an int64 temporary per character
+    text = bytes(data).translate(_SIGNED if signed else _UNSIGNED)
+    if signed:
+        text = _signs(text)
+    if text is not None:
+        if text.isspace() or not text:  # (fromstring makes a 0 of blank input)
+            return np.zeros(0, dtype=np.int64)
+        values = np.fromstring(text, dtype=np.int64, sep=" ")
+        if len(values) and np.abs(values).max() >= 10**MAX_DIGITS:
+            raise ValueError(f"integer with more than {MAX_DIGITS} digits")
+        return values
+
+    chars = _chars(data)
+    is_digit = (chars >= ord("0")) & (chars <= ord("9"))
+    edges = np.diff(is_digit.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64)
+    lengths = ends - starts
+    if lengths.max() > MAX_DIGITS:
+        raise ValueError(f"integer with more than {MAX_DIGITS} digits")
+
+    # Each digit times 10 ** (number of digits after it in its number), summed per number
+    positions = np.flatnonzero(is_digit)
+    places = np.repeat(ends, lengths) - positions - 1
+    terms = (chars[positions] - ord("0")).astype(np.int64) * _POW10[places]
+    values = np.add.reduceat(terms, np.cumsum(lengths) - lengths)
+
+    if signed:
+        negative = np.zeros(len(starts), dtype=bool)
+        after = starts > 0
+        negative[after] = chars[starts[after] - 1] == ord("-")
+        values[negative] *= -1
+    return values
+
+
+def _signs(text):
+    """text with every "-" that is not the sign of the digits after it blanked
+    out, or None if a sign comes right after other digits (as in "2-4")
+    """
+    if b"-" not in text:
+        return text
+    while b"--" in text:
+        text = text.replace(b"--", b" -")
+    text = text.replace(b"- ", b"  ")
+    if text.endswith(b"-"):
+        text = text[:-1]
+    if any(bytes([digit]) + b"-" in text for digit in b"0123456789"):
+        return None
+    return text
+
+
+def int_chunks(file, chunk_size=CHUNK_SIZE, signed=True):
+    """Yield the integers of a binary file object as int64 arrays, block by block
+
+    Each block is cut after its last separator, so no number is split between
+    two arrays. Memory use is bounded by chunk_size, whatever the file size.
+    """
+    reads = iter(lambda: file.read(chunk_size), b"")
+    for block in _blocks(reads):
+        yield _ints(block, signed)
+
+
+def group_sums(file, chunk_size=CHUNK_SIZE, signed=True):
+    """Yield the sums of the blank-line separated groups of a binary file object
+    (of one integer per line, like a list of items per elf) as int64 arrays,
+    block by block
+
+    Each block is cut at its last blank line, so no group is split between two
+    arrays, and memory use is bounded by chunk_size and the longest group.
+    """
+    reads = iter(lambda: file.read(chunk_size), b"")
+    for block in _paragraph_blocks(reads):
+        yield _group_sums(block, signed)
+
+
+def _paragraph_blocks(reads):
+    """The bytes from reads, re-cut into blocks that end at a blank line"""
+    rest = b""
+    for block in reads:
+        data = rest + block
+        cut = data.rfind(b"\n\n")
+        if cut < 0:
+            rest = data
+            continue
+        yield data[:cut]
+        rest = data[cut + 2 :]
+    if rest.strip():
+        yield rest
+
+
+def _group_sums(block, signed):
+    values = _ints(block, signed)
+    chars = _chars(block.strip(b"\n"))
+    # The lines between newlines, and the group of each non-blank one: the
+    # number of blank lines before it
+    newlines = np.flatnonzero(chars == ord("\n"))
+    blank = np.diff(newlines, prepend=-1, append=len(chars)) == 1
+    groups = np.cumsum(blank)[~blank]
+    if len(groups) != len(values):
+        raise ValueError(f"{len(values)} integers on {len(groups)} lines, not one per line")
+    if not len(values):
+        return values
+    return np.add.reduceat(values, np.flatnonzero(np.diff(groups, prepend=-1)))
+
+
+def int_rows(data, width, signed=True):
+    """The integers in data as rows of `width` numbers (e.g. one row per line)"""
+    values = ints(data, signed=signed)
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers do not make rows of {width}")
+    return values.reshape(-1, width)
+
+
+def char_grid(data):
+    """Equal-length lines as a 2D uint8 array of their characters"""
+    chars = _chars(data)
+    if len(chars) and chars[-1] == ord("\n"):
+        chars = chars[:-1]
+    newlines = np.flatnonzero(chars == ord("\n"))
+    C = newlines[0] if len(newlines) else len(chars)
+    R = len(newlines) + 1
+    if len(chars) != R * (C + 1) - 1 or np.any(newlines % (C + 1) != C):
+        raise ValueError("lines of unequal length")
+    return np.append(chars, np.uint8(ord("\n"))).reshape(R, C + 1)[:, :C]
+
+
+def paragraphs(data):
+    """The blank-line separated blocks of data, as str without trailing newlines"""
+    if not isinstance(data, str):
+        data = bytes(data).decode()
+    return [block.strip("\n") for block in data.strip("\n").split("\n\n")]
@@ -0,0 +1,108 @@
+"""Profile the parts of a solution without changing its code
+
+While a solution runs, cProfile collects deterministic per-function stats and a
+SIGPROF timer samples the Python stack every millisecond of CPU time. At every
+"part N: ..." line the runner hands both over to the profiler, which writes:
+
+    part-1.pstats, part-2.pstats, ...   cProfile stats of each part
+                                        (python -m pstats part-1.pstats)
+    stacks.folded                       collapsed stacks of all parts, rooted
+                                        at the part label, for flamegraph.pl,
+                                        speedscope, etc.
+
+As with the part timings, the work done before the first part line (parsing)
+is charged to the first part.
+"""
+
+import cProfile
+import collections
+import re
+import signal
+import threading
+
+from aoc import runner
+
+PROFILES_DIR = runner.ROOT / ".cache" / "profiles"
+
+INTERVAL = 1e-3  # CPU seconds between stack samples
+
+
+def profile_dir(solution, root=PROFILES_DIR):
+    """Output folder for the profile of a solution, e.g. root/2023/day17/v1"""
+    return root / solution.name
+
+
+def frame_name(code):
+    path = code.co_filename
+    if path.startswith(str(runner.ROOT)):
+        path = path[len(str(runner.ROOT)) + 1:]
+    else:
+        path = path.rsplit("/", 1)[-1]
+    return f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+
+
+class PartProfiler:
+    """Collects a cProfile and stack samples per part of one solution run"""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.entry = None  # code object of main(), the root of the sampled stacks
+        self.profile = None
+        self.samples = collections.Counter()
+        self.stacks = collections.Counter()
+        self.names = []
+        self.sampling = False
+
+    def start(self, entry):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        for stale in self.folder.glob("*.pstats"):
+            stale.unlink()
+        self.entry = entry
+        self.profile = cProfile.Profile()
+        # Signals are only delivered to the main thread
+        self.sampling = threading.current_thread() is threading.main_thread()
+        if self.sampling:
+            self.saved_handler = signal.signal(signal.SIGPROF, self.sample)
+            signal.setitimer(signal.ITIMER_PROF, INTERVAL, INTERVAL)
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+        if self.sampling:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self.saved_handler)
+        if self.samples:
+            self.dump("rest")  # after the last part line
+        lines = (f"{stack} {count}\n" for stack, count in self.stacks.items())
+        (self.folder / "stacks.folded").write_text("".join(lines))
+
+    def sample(self, signum, frame):
+        stack = []
+        while frame is not None and frame.f_code is not self.entry:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        if frame is None:
+            return  # outside main(), e.g. in the runner itself
+        stack.append(frame.f_code)
+        self.samples[tuple(reversed(stack))] += 1
+
+    def split(self, label):
+        """End the current part and start profiling the next one"""
+        self.profile.disable()
+        self.dump(label)
+        self.profile = cProfile.Profile()
+        self.samples.clear()
+        self.profile.enable()
+
+    def dump(self, label):
+        """Write the pstats of the current part and fold its samples"""
+        base = name = re.sub(r"\W+", "-", label).strip("-")
+        n = 1
+        while name in self.names:
+            n += 1
+            name = f"{base}-{n}"
+        self.names.append(name)
+
+        self.profile.dump_stats(self.folder / f"{name}.pstats")
+        for stack, count in self.samples.items():
+            self.stacks[";".join([name, *map(frame_name, stack)])] += count
@@ -0,0 +1,378 @@
+"""Run solutions in-process and time each part
+
+A solution is any YEAR/dayNN/vN.py script with a main() function. The script
+is imported once, and main() is then called in the warm interpreter with the
+day folder as the working directory, so import and interpreter start-up costs
+are not charged to the puzzle. Every solution reports its answers with lines
+like "part 1: <answer>"; the time between consecutive part lines is the
+wall time of that part (the time before the first part line includes the
+parsing done by main()).
+
+Since import costs are hidden from the part timings, import_times() measures
+them separately, in a fresh interpreter under -X importtime.
+
+Solutions can also be run in parallel across a process pool. The wall time of
+every run is recorded so that later parallel runs can start the slowest
+solutions first.
+"""
+
+import concurrent.futures
+import contextlib
+import importlib.util
+import io
+import json
+import multiprocessing
+import pathlib
+import re
+import subprocess
+import sys
+import time
+from typing import NamedTuple
+
+from aoc import counters, memory
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+TIMINGS_FILE = ROOT / ".cache" / "timings.json"
+
+PART_LINE = re.compile(r"^(part \d+\b[^:]*):\s?(.*)$")
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+class Solution(NamedTuple):
+    year: int
+    day: int
+    version: int
+    path: pathlib.Path
+
+    @property
+    def name(self):
+        return f"{self.year}/day{self.day:02d}/v{self.version}"
+
+    @property
+    def folder(self):
+        return self.path.parent
+
+
+class Part(NamedTuple):
+    label: str
+    answer: str
+    seconds: float
+    memory: int | None = None  # tracemalloc peak (bytes), when traced
+    rss: int | None = None  # peak resident set size (bytes)
+    sites: list | None = None  # top (file:line, bytes) allocation sites, when traced
+    counters: dict | None = None  # {name: count or seconds} (see aoc.counters), when counting
+
+
+class Result(NamedTuple):
+    solution: Solution
+    parts: list[Part]
+    seconds: float
+    output: str
+    cached: bool = False  # served from aoc.cache, timings are from the original run
+
+
+def discover(root=ROOT, years=None, days=None):
+    """Find all YEAR/dayNN/vN.py solutions under root"""
+    solutions = []
+    for path in root.glob("[0-9][0-9][0-9][0-9]/day[0-9][0-9]/v[0-9]*.py"):
+        year = int(path.parent.parent.name)
+        day = int(path.parent.name[3:])
+        version = int(path.stem[1:])
+        if years and year not in years:
+            continue
+        if days and day not in days:
+            continue
+        solutions.append(Solution(year, day, version, path))
+    return sorted(solutions)
+
+
+_modules = {}
+
+
+def load(solution, fresh=False):
+    """Import a solution module (once per interpreter, unless fresh)"""
+    if fresh or solution.path not in _modules:
+        name = f"aoc_{solution.year}_day{solution.day:02d}_v{solution.version}"
+        spec = importlib.util.spec_from_file_location(name, solution.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _modules[solution.path] = module
+    return _modules[solution.path]
+
+
+# Imports the solution the way "python vN.py" would, marking where its own
+# imports start in the -X importtime output, and prints the time it took
+_IMPORT_SCRIPT = """
+import importlib.util, sys, time
+path = sys.argv[1]
+sys.path.insert(0, ".")
+spec = importlib.util.spec_from_file_location("solution", path)
+module = importlib.util.module_from_spec(spec)
+print("import time: solution", file=sys.stderr, flush=True)
+start_time = time.perf_counter()
+spec.loader.exec_module(module)
+print(time.perf_counter() - start_time)
+"""
+
+
+def import_times(solution):
+    """Measure the start-up cost of a solution in a fresh interpreter
+
+    Returns (seconds to import the solution, [(module, seconds)]), listing the
+    top-level modules it imports, slowest first. Modules already imported at
+    interpreter start-up are not included.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_SCRIPT, solution.path.name],
+        cwd=solution.folder, capture_output=True, text=True, check=True,
+    )
+    _, _, imports = proc.stderr.partition("import time: solution\n")
+    modules = []
+    for line in imports.splitlines():
+        if (m := IMPORT_TIME_LINE.match(line)) and not m[3]:
+            modules.append((m[4], int(m[2]) / 1e6))
+    modules.sort(key=lambda module: -module[1])
+    return float(proc.stdout), modules
+
+
+class PartClock(io.TextIOBase):
+    """Stdout stand-in that timestamps the "part N: ..." lines as they are printed"""
+
+    def __init__(self, profiler=None, tracer=None, counting=False):
+        self.profiler = profiler
+        self.tracer = tracer
+        self.counting = counting
+        self.buf = io.StringIO()
+        self.line = ""
+        self.parts = []
+        self.multiline = False
+        self.mark = time.perf_counter()
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        self.buf.write(s)
+        self.line += s
+        *lines, self.line = self.line.split("\n")
+        for line in lines:
+            self.end_line(line)
+        return len(s)
+
+    def end_line(self, line):
+        if m := PART_LINE.match(line):
+            now = time.perf_counter()
+            rss = memory.peak_rss()
+            memory.reset_peak_rss()
+            traced = sites = None
+            if self.tracer:
+                traced, sites = self.tracer.split()
+            if self.profiler:
+                self.profiler.split(m[1])
+            counts = counters.split() if self.counting else None
+            self.parts.append(Part(m[1], m[2], now - self.mark, traced, rss, sites, counts))
+            self.mark = time.perf_counter()
+            self.multiline = not m[2]
+        elif self.multiline:
+            # Multi-line answer (e.g. "part 2:" followed by a rendered image)
+            part = self.parts[-1]
+            answer = f"{part.answer}\n{line}" if part.answer else line
+            self.parts[-1] = part._replace(answer=answer)
+
+    def getvalue(self):
+        return self.buf.getvalue()
+
+
+def run(
+    solution, args=(), fresh=False, trace_memory=False, memory_sites=False, profiler=None,
+    counting=False,
+):
+    """Call a solution's main() in-process and return its per-part timings
+
+    With fresh, the module is re-imported so that module-level caches from an
+    earlier run are not reused. The peak RSS of each part is always recorded;
+    with trace_memory, the tracemalloc peak is too, and with memory_sites also
+    the top allocation sites (tracing slows the solution down, so the timings
+    of such a run are not representative; see aoc.memory). A profiler (see aoc.profiler) is
+    handed each part as it ends. With counting, the aoc.counters of each part
+    are recorded.
+    """
+    module = load(solution, fresh=fresh)
+    tracer = None
+    if trace_memory or memory_sites:
+        tracer = memory.PartTracer(sites=memory_sites)
+    clock = PartClock(profiler, tracer, counting)
+    with (
+        contextlib.chdir(solution.folder),
+        _argv([solution.path.name, *args]),
+        contextlib.redirect_stdout(clock),
+        _counting(counting),
+        _tracing(tracer),
+        _profiling(profiler, module.main.__code__),
+    ):
+        memory.reset_peak_rss()
+        start_time = clock.mark = time.perf_counter()
+        module.main()
+        stop_time = time.perf_counter()
+        if clock.line:
+            clock.end_line(clock.line)
+    return Result(solution, clock.parts, stop_time - start_time, clock.getvalue())
+
+
+def run_isolated(solution, args=(), timeout=None, **kwargs):
+    """Like run(), but in a fresh process that is killed after timeout seconds
+
+    A solution that runs out of memory or time then only fails this call.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_run_child, args=(sender, solution, args), kwargs=kwargs
+    )
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            process.kill()
+            raise TimeoutError(f"{solution.name} did not finish in {timeout} s")
+        try:
+            outcome = receiver.recv()
+        except EOFError:
+            process.join()
+            raise ChildProcessError(f"{solution.name} died (exit code {process.exitcode})")
+    finally:
+        process.join()
+        receiver.close()
+    if isinstance(outcome, BaseException):
+        raise outcome
+    return outcome
+
+
+def _run_child(sender, solution, args, **kwargs):
+    try:
+        outcome = run(solution, args=args, **kwargs)
+    except (Exception, SystemExit) as e:
+        outcome = e
+    sender.send(outcome)
+
+
+def run_parallel(
+    solutions, jobs=None, timings=None, make_profiler=None, memory_sites=False, counting=False
+):
+    """Run solutions across a process pool, yielding (solution, result or error)
+
+    Solutions are submitted longest-expected-first based on the recorded
+    timings (solutions without a recorded time go first), and yielded as they
+    finish. Each solution gets a fresh worker process, so module-level state
+    cannot leak between solutions. With make_profiler, each solution is
+    profiled by make_profiler(solution); memory_sites and counting are passed
+    on to run().
+    """
+    timings = load_timings() if timings is None else timings
+    queue = sorted(solutions, key=lambda s: -timings.get(s.name, float("inf")))
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, max_tasks_per_child=1
+    ) as executor:
+        futures = {
+            executor.submit(
+                run,
+                solution,
+                memory_sites=memory_sites,
+                profiler=make_profiler and make_profiler(solution),
+                counting=counting,
+            ): solution
+            for solution in queue
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except (Exception, SystemExit) as e:
+                yield futures[future], e
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:7.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:7.1f} ms"
+    return f"{seconds:7.2f} s "
+
+
+def format_count(value):
+    """A counter, or a timer's seconds"""
+    if isinstance(value, float):
+        return format_seconds(value).strip()
+    return f"{value:,}"
+
+
+def format_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+def load_timings():
+    """Load the recorded wall time of each solution: {name: seconds}"""
+    if not TIMINGS_FILE.exists():
+        return {}
+    return json.loads(TIMINGS_FILE.read_text())
+
+
+def save_timings(results):
+    """Record the wall time of each result, keeping the other recorded timings"""
+    timings = load_timings()
+    timings.update({r.solution.name: round(r.seconds, 6) for r in results})
+    TIMINGS_FILE.parent.mkdir(exist_ok=True)
+    TIMINGS_FILE.write_text(json.dumps(dict(sorted(timings.items())), indent=2) + "\n")
+
+
+@contextlib.contextmanager
+def _argv(argv):
+    saved = sys.argv
+    sys.argv = list(argv)
+    try:
+        yield
+    finally:
+        sys.argv = saved
+
+
+@contextlib.contextmanager
+def _profiling(profiler, entry):
+    if profiler is None:
+        yield
+        return
+    profiler.start(entry)
+    try:
+        yield
+    finally:
+        profiler.stop()
+
+
+@contextlib.contextmanager
+def _counting(on):
+    if not on:
+        yield
+        return
+    counters.enable()
+    try:
+        yield
+    finally:
+        counters.enable(False)
+
+
+@contextlib.contextmanager
+def _tracing(tracer):
+    if tracer is None:
+        yield
+        return
+    tracer.start()
+    try:
+        yield
+    finally:
+        tracer.stop()
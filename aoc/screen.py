@@ -0,0 +1,335 @@
+"""Incremental terminal animation
+
+A Screen keeps the frame it last drew and, for the next one, only writes the
+cells that changed, each run of them after a cursor-addressing escape, instead
+of clearing and reprinting the whole screen. A frame is a list of rows, each a
+str (one cell per character) or a list of cells, where a cell is one visible
+character possibly wrapped in colour escapes (e.g. BG_GREEN + "E" + RESET).
+
+The frame rate is capped at `fps`, independently of how fast the simulation
+produces frames. By default draw() waits until the next frame is due, for a
+steady animation. With skip=True it never waits: frames that come in before
+the next one is due are dropped (the last of them is drawn at the end), so a
+fast simulation runs at full speed and the screen shows what it can keep up
+with. Frames can be passed as a function that builds them, so that dropped
+frames are never built.
+
+    SCREEN = Screen(fps=20)
+    ...
+    SCREEN.draw(rows, header=f"step {t}")
+
+After capture(path), every Screen instead appends each frame, at full speed
+and none dropped, to a capture file, as the cells that changed since the frame
+before. bin/play.py replays a capture at any frame rate, from any frame.
+"""
+
+import atexit
+import pathlib
+import shutil
+import sys
+import time
+
+CSI = "\033["
+RESET = CSI + "0m"
+CLEAR_SCREEN = CSI + "2J"
+CLEAR_LINE_END = CSI + "K"
+CLEAR_SCREEN_END = CSI + "J"
+HIDE_CURSOR = CSI + "?25l"
+SHOW_CURSOR = CSI + "?25h"
+
+BG_RED = CSI + "41m"
+BG_GREEN = CSI + "42m"
+BG_YELLOW = CSI + "43m"
+FG_RED = CSI + "31m"
+FG_GREEN = CSI + "32m"
+FG_YELLOW = CSI + "33m"
+
+
+def move_to(r, c):
+    """Escape that moves the cursor to row r, column c (0-based)"""
+    return f"{CSI}{r + 1};{c + 1}H"
+
+
+def changed_runs(old, row):
+    """The (start, stop) column ranges where row differs from old"""
+    runs = []
+    c = 0
+    while c < len(row):
+        if c < len(old) and row[c] == old[c]:
+            c += 1
+            continue
+        start = c
+        while c < len(row) and not (c < len(old) and row[c] == old[c]):
+            c += 1
+        runs.append((start, c))
+    return runs
+
+
+def frame_rows(frame, header=""):
+    """The rows of the header lines and frame (or frame())"""
+    if callable(frame):
+        frame = frame()
+    # str rows stay str, so unchanged rows compare equal without a loop
+    rows = header.splitlines()
+    rows += [row if isinstance(row, str) else list(row) for row in frame]
+    return rows
+
+
+class Screen:
+    def __init__(self, fps=30, skip=False, out=None):
+        self.interval = 1 / fps if fps else 0
+        self.skip = skip
+        self.out = out
+        self.last = None  # rows of cells as drawn, None before the first frame
+        self.next_time = 0.0
+        self.pending = None  # the last frame dropped since the last one drawn
+        self.drawn = self.dropped = 0
+
+    def draw(self, frame, header=""):
+        """Draw frame (or frame(), see above) below the header lines
+
+        Returns whether the frame was drawn.
+        """
+        if _recorder is not None:
+            _recorder.write(frame_rows(frame, header))
+            self.drawn += 1
+            return True
+
+        now = time.monotonic()
+        if now < self.next_time:
+            if self.skip:
+                self.pending = (frame, header)
+                self.dropped += 1
+                return False
+            time.sleep(self.next_time - now)
+            now = self.next_time
+        self.next_time = now + self.interval
+        self.pending = None
+
+        self.write(frame_rows(frame, header))
+        self.drawn += 1
+        if self.skip:
+            # Give the simulation a whole frame interval after a slow frame too
+            self.next_time = time.monotonic() + self.interval
+        return True
+
+    def write(self, rows):
+        out = self.out or sys.stdout
+        height = shutil.get_terminal_size().lines - 1
+        rows = rows[:height]
+
+        if self.last is None:
+            atexit.register(self.close)
+            parts = [HIDE_CURSOR, CLEAR_SCREEN]
+            last = []
+        else:
+            parts = []
+            last = self.last
+
+        for r, row in enumerate(rows):
+            old = last[r] if r < len(last) else []
+            if row == old:
+                continue
+            # Write the runs of changed cells, each after one cursor move
+            for start, stop in changed_runs(old, row):
+                parts.append(move_to(r, start))
+                parts.extend(row[start:stop])
+            if len(old) > len(row):
+                parts.append(move_to(r, len(row)) + CLEAR_LINE_END)
+        if len(last) > len(rows):
+            parts.append(move_to(len(rows), 0) + CLEAR_SCREEN_END)
+
+        out.write("".join(parts))
+        out.flush()
+        self.last = rows
+
+    def close(self):
+        """Draw the last dropped frame, if any, and leave the cursor below the frame"""
+        if _recorder is not None:
+            _recorder.flush()
+        if self.last is None:
+            return
+        if self.pending is not None:
+            frame, header = self.pending
+            self.next_time = 0.0
+            self.draw(frame, header)
+        out = self.out or sys.stdout
+        out.write(RESET + move_to(len(self.last), 0) + SHOW_CURSOR)
+        out.flush()
+        self.last = None
+        atexit.unregister(self.close)
+
+
+# Capture files
+#
+# A capture is MAGIC followed by one record per frame. Integers are unsigned
+# LEB128 varints. A record is the number of rows in the frame, the number of
+# rows that changed, and for each of those its index, its length and its
+# changed runs: the number of runs, then for each its start column, its
+# length and its cells. A cell is its index in the table of the distinct
+# cells seen so far; the next index (the table's length) adds a new cell,
+# whose length and UTF-8 bytes follow.
+
+MAGIC = b"AOC-SCREEN-CAPTURE 1\n"
+
+_recorder = None
+
+
+def capture(path):
+    """Record the frames of every Screen to the file at path, instead of drawing them"""
+    global _recorder
+    _recorder = Recorder(path)
+    atexit.register(_recorder.close)
+
+
+def write_varint(out, n):
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(data, i):
+    """The varint at data[i], and the index after it"""
+    n = shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, i
+        shift += 7
+
+
+class Recorder:
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.cells = {}  # cell -> index in the table
+        self.last = []
+        self.frames = 0
+
+    def write(self, rows):
+        record = bytearray()
+        changed = []
+        for r, row in enumerate(rows):
+            old = self.last[r] if r < len(self.last) else []
+            if row != old:
+                changed.append((r, row, changed_runs(old, row)))
+        write_varint(record, len(rows))
+        write_varint(record, len(changed))
+        for r, row, runs in changed:
+            write_varint(record, r)
+            write_varint(record, len(row))
+            write_varint(record, len(runs))
+            for start, stop in runs:
+                write_varint(record, start)
+                write_varint(record, stop - start)
+                for cell in row[start:stop]:
+                    index = self.cells.get(cell)
+                    if index is None:
+                        index = self.cells[cell] = len(self.cells)
+                        write_varint(record, index)
+                        data = cell.encode()
+                        write_varint(record, len(data))
+                        record += data
+                    else:
+                        write_varint(record, index)
+        self.file.write(record)
+        self.last = rows
+        self.frames += 1
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class Recording:
+    """The frames of a capture file, by number
+
+    Frames are rebuilt from the nearest of the keyframes kept every `keyframe`
+    frames, so seeking anywhere costs at most that many frames' changes.
+    """
+
+    def __init__(self, path, keyframe=256):
+        data = pathlib.Path(path).read_bytes()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path}: not a screen capture")
+
+        self.cells = []
+        self.changes = []  # (number of rows, [(row, length, [(start, [cell, ...]), ...]), ...])
+        i = len(MAGIC)
+        while i < len(data):
+            height, i = read_varint(data, i)
+            num_changed, i = read_varint(data, i)
+            changed = []
+            for _ in range(num_changed):
+                r, i = read_varint(data, i)
+                length, i = read_varint(data, i)
+                num_runs, i = read_varint(data, i)
+                runs = []
+                for _ in range(num_runs):
+                    start, i = read_varint(data, i)
+                    n, i = read_varint(data, i)
+                    run = []
+                    for _ in range(n):
+                        index, i = read_varint(data, i)
+                        if index == len(self.cells):
+                            size, i = read_varint(data, i)
+                            self.cells.append(data[i : i + size].decode())
+                            i += size
+                        run.append(index)
+                    runs.append((start, run))
+                changed.append((r, length, runs))
+            self.changes.append((height, changed))
+
+        # Keyframes, as rows of cell indices (_apply copies the rows it changes)
+        self.keyframe = keyframe
+        self.keyframes = []
+        rows = []
+        for n in range(len(self.changes)):
+            rows = self._apply(rows, n)
+            if n % keyframe == 0:
+                self.keyframes.append(rows)
+
+    def __len__(self):
+        return len(self.changes)
+
+    def _apply(self, rows, n):
+        height, changed = self.changes[n]
+        rows = rows[:height] + [[] for _ in range(height - len(rows))]
+        for r, length, runs in changed:
+            row = rows[r] = rows[r][:length]
+            for start, run in runs:
+                row[start : start + len(run)] = run
+        return rows
+
+    def _cells(self, rows):
+        return [[self.cells[index] for index in row] for row in rows]
+
+    def _seek(self, n):
+        if not 0 <= n < len(self):
+            raise IndexError(f"frame {n} of {len(self)}")
+        k = n // self.keyframe
+        rows = self.keyframes[k]
+        for m in range(k * self.keyframe + 1, n + 1):
+            rows = self._apply(rows, m)
+        return rows
+
+    def frame(self, n):
+        """The rows of cells of frame n (0-based)"""
+        return self._cells(self._seek(n))
+
+    def frames(self, start=0, stop=None, step=1):
+        """Yield (n, rows of cells) for frames start, start + step, ... before stop"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        rows = self._seek(start)
+        yield start, self._cells(rows)
+        for n in range(start + 1, stop):
+            rows = self._apply(rows, n)
+            if (n - start) % step == 0:
+                yield n, self._cells(rows)
@@ -0,0 +1,64 @@
+"""Synthetic inputs at a chosen scale
+
+A day folder can provide a gen.py with a generate(scale, seed=0) function that
+returns the text of a valid puzzle input roughly `scale` times the size of the
+real input.txt, and optionally an ARGS tuple of extra command-line args the solution needs
+for such inputs (e.g. a row number that differs from the real puzzle). Generated inputs are cached under .cache/inputs, keyed by the
+scale, the seed and the generator source.
+
+For inputs too big to build as one string (gigabytes), gen.py can instead
+provide write(file, scale, seed=0), which writes the input to a binary file a
+block at a time; it is used in preference to generate().
+"""
+
+import hashlib
+import importlib.util
+
+from aoc import runner
+
+INPUTS_DIR = runner.ROOT / ".cache" / "inputs"
+
+
+def has_generator(solution):
+    return (solution.folder / "gen.py").exists()
+
+
+def load_generator(solution):
+    path = solution.folder / "gen.py"
+    name = f"aoc_{solution.year}_day{solution.day:02d}_gen"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def scaled_input(solution, scale, seed=0):
+    """Path of the generated input for a solution's day at the given scale"""
+    path = solution.folder / "gen.py"
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+    file = (
+        INPUTS_DIR
+        / str(solution.year)
+        / f"day{solution.day:02d}"
+        / f"x{scale}-s{seed}-{digest}.txt"
+    )
+    if not file.exists():
+        generator = load_generator(solution)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = file.with_suffix(".tmp")
+        if hasattr(generator, "write"):
+            with open(tmp, "wb") as f:
+                generator.write(f, scale, seed=seed)
+        else:
+            tmp.write_text(generator.generate(scale, seed=seed))
+        tmp.replace(file)
+    return file
+
+
+def input_args(solution, scale=None, seed=0):
+    """Command-line args selecting input.txt (scale None) or a synthetic input"""
+    if scale is None:
+        return ()
+    file = scaled_input(solution, scale, seed=seed)
+    extra = getattr(load_generator(solution), "ARGS", ())
+    return ("-f", str(file), *extra)
@@ -0,0 +1,67 @@
+"""Disjoint-set union (union-find) over the integer ids 0..n-1
+
+The parent and size of every id live in flat arrays rather than dicts keyed by
+node objects, find() halves the path as it walks up (no recursion), and union()
+hangs the smaller tree under the larger one. Label nodes with ids first, e.g.
+by their index in the input.
+
+Reference: https://en.wikipedia.org/wiki/Disjoint-set_data_structure
+"""
+
+from array import array
+
+
+class UnionFind:
+    def __init__(self, n: int) -> None:
+        self.parent = array("q", range(n))
+        self.size = array("q", [1]) * n
+        self.num_components = n
+
+    def find(self, u: int) -> int:
+        parent = self.parent
+        while parent[u] != u:
+            # Path halving: point every other node on the path at its grandparent
+            parent[u] = u = parent[parent[u]]
+        return u
+
+    def union(self, u: int, v: int) -> bool:
+        """Returns True if a merge occurred."""
+        ru, rv = self.find(u), self.find(v)
+        if ru == rv:
+            return False
+
+        # Union by size: attach smaller tree under larger tree
+        if self.size[ru] < self.size[rv]:
+            ru, rv = rv, ru
+        self.parent[rv] = ru
+        self.size[ru] += self.size[rv]
+
+        self.num_components -= 1
+        return True
+
+    def union_many(self, edges, components: int | None = None) -> int | None:
+        """Union the (u, v) edges in order, stopping once only `components` are left
+
+        Returns the index of the edge that got it down to `components` (None if
+        the edges ran out first, or no target was given).
+        """
+        parent, size = self.parent, self.size
+        for i, (u, v) in enumerate(edges):
+            # find(), inlined
+            while parent[u] != u:
+                parent[u] = u = parent[parent[u]]
+            while parent[v] != v:
+                parent[v] = v = parent[parent[v]]
+            if u == v:
+                continue
+            if size[u] < size[v]:
+                u, v = v, u
+            parent[v] = u
+            size[u] += size[v]
+            self.num_components -= 1
+            if self.num_components == components:
+                return i
+        return None
+
+    def component_sizes(self) -> list[int]:
+        return [self.size[u] for u in range(len(self.parent)) if self.parent[u] == u]
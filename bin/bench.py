@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+"""Benchmark solutions and check them against the stored baseline"""
+import argparse
+import pathlib
+import sys
+
+from aoc import bench, runner, synthetic
+
+
+def scaling(solutions, args):
+    solutions = [s for s in solutions if synthetic.has_generator(s)]
+    print(f"{'':<14} {'':<12}" + "".join(f" {f'x{scale}':>10}" for scale in args.scale) + "   fit")
+    for solution in solutions:
+        seconds, exponents = bench.scaling(
+            solution, args.scale, seed=args.seed, max_seconds=args.max_seconds
+        )
+        name = solution.name
+        for key, exponent in exponents.items():
+            times = "".join(
+                f" {runner.format_seconds(seconds[scale][key]) if key in seconds.get(scale, {}) else '-':>10}"
+                for scale in args.scale
+            )
+            fit = "n/a" if exponent is None else f"O(n^{exponent:.2f})"
+            print(f"{name:<14} {key:<12}{times}   {fit}")
+            name = ""
+        if not exponents:
+            print(f"{name:<14} failed or took over {args.max_seconds:g}s at x{min(args.scale)}")
+
+        if args.save:
+            stats = {key: {"exponent": exponent} for key, exponent in exponents.items()}
+            bench.save_baseline({solution.name: stats}, args.baseline)
+    print(f"{len(solutions)} solutions with generators")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark Advent of Code solutions against a stored baseline"
+    )
+    parser.add_argument("-y", "--year", type=int, nargs="*", help="years to run")
+    parser.add_argument("-d", "--day", type=int, nargs="*", help="days to run")
+    parser.add_argument("-n", type=int, default=5, help="runs per solution (default: 5)")
+    parser.add_argument(
+        "-r", "--ratio", type=float, default=1.5,
+        help="fail when a part's median time or peak memory grows past "
+             "RATIO times the baseline (default: 1.5)",
+    )
+    parser.add_argument(
+        "-b", "--baseline", type=pathlib.Path, default=bench.BASELINE_FILE,
+        help="baseline file (default: benchmarks.json)",
+    )
+    parser.add_argument("--save", action="store_true", help="save results as the new baseline")
+    parser.add_argument(
+        "--scaling", action="store_true",
+        help="instead time the days with a gen.py on synthetic inputs and fit "
+             "a complexity exponent per part",
+    )
+    parser.add_argument(
+        "-s", "--scale", type=int, nargs="*", default=[1, 10, 100],
+        help="synthetic input scales for --scaling (default: 1 10 100)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="synthetic input seed (default: 0)")
+    parser.add_argument(
+        "--max-seconds", type=float, default=60,
+        help="time limit per run for --scaling (default: 60)",
+    )
+
+    args = parser.parse_args()
+
+    solutions = runner.discover(years=args.year, days=args.day)
+    if not solutions:
+        parser.error("no solutions found")
+
+    if args.scaling:
+        scaling(solutions, args)
+        return
+
+    baseline = bench.load_baseline(args.baseline)
+
+    failed = []
+    for solution in solutions:
+        name = solution.name
+        try:
+            stats = bench.benchmark(solution, repeat=args.n)
+        except (Exception, SystemExit) as e:
+            print(f"{name:<14} failed: {e!r}")
+            failed.append((name, None, None))
+            continue
+        for key, s in stats.items():
+            print(
+                f"{name:<14} {key:<12}"
+                f" min {runner.format_seconds(s['min'])}"
+                f"  median {runner.format_seconds(s['median'])}"
+                f"  p95 {runner.format_seconds(s['p95'])}"
+                f"  peak {runner.format_bytes(s['memory']):>10}"
+            )
+            for counter, value in (s["counters"] or {}).items():
+                print(f"{'':<27} {runner.format_count(value):>10}  {counter}")
+            name = ""
+        for key, metric, old, new in bench.regressions(solution.name, stats, baseline, args.ratio):
+            print(f"{'':<14} {key:<12} REGRESSION {metric}: {old} -> {new} ({new / old:.2f}x)")
+            failed.append((solution.name, key, metric))
+        for key in bench.missing(solution.name, stats, baseline):
+            print(f"{'':<14} {key:<12} NO BASELINE (record one with --save)")
+            failed.append((solution.name, key, None))
+
+        if args.save:
+            bench.save_baseline({solution.name: stats}, args.baseline)
+
+    print(
+        f"{len(solutions)} solutions, {len(failed)} failures, regressions"
+        " or parts without a baseline"
+    )
+    sys.exit(1 if failed and not args.save else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Check that all versions of a day agree and compare their speed and memory"""
+import argparse
+import sys
+
+from aoc import compare, runner, synthetic
+
+
+def report(table):
+    print(f"  {'part':<12} {'version':<8} {'answer':<20} {'time':>10} {'speedup':>8} {'peak':>10}")
+    for key, rows in table.items():
+        reference = rows[0].seconds
+        for row in rows:
+            if row.seconds is None:
+                print(f"  {key:<12} v{row.version:<7} {row.answer}")
+            else:
+                speedup = f"{reference / row.seconds:7.2f}x" if reference is not None else "-"
+                print(
+                    f"  {key:<12} v{row.version:<7} {row.answer.split(chr(10))[0]:<20}"
+                    f" {runner.format_seconds(row.seconds)}"
+                    f" {speedup:>8}"
+                    f" {runner.format_bytes(row.memory):>10}"
+                )
+            key = ""
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the versions of Advent of Code solutions for a day"
+    )
+    parser.add_argument("-y", "--year", type=int, nargs="*", help="years to compare")
+    parser.add_argument("-d", "--day", type=int, nargs="*", help="days to compare")
+    parser.add_argument(
+        "-s", "--scale", type=int, nargs="*", default=[],
+        help="also compare on synthetic inputs at these scales (e.g. -s 10 100)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="synthetic input seed (default: 0)")
+    parser.add_argument("-n", type=int, default=3, help="runs per version (default: 3)")
+
+    args = parser.parse_args()
+
+    days = compare.multi_version_days(runner.discover(years=args.year, days=args.day))
+    if not days:
+        parser.error("no days with more than one version found")
+
+    failed = 0
+    for versions in days:
+        first = versions[0]
+        name = f"{first.year}/day{first.day:02d}"
+        scales = [None]
+        if args.scale and synthetic.has_generator(first):
+            scales += args.scale
+        elif args.scale:
+            print(f"{name}: no gen.py, skipping synthetic inputs")
+
+        for scale in scales:
+            print(f"{name} {'input.txt' if scale is None else f'x{scale} (seed {args.seed})'}")
+            input_args = synthetic.input_args(first, scale, seed=args.seed)
+            table = compare.compare(versions, args=input_args, repeat=args.n)
+            report(table)
+            for key in compare.mismatches(table):
+                print(f"  {key}: versions disagree or did not all answer")
+                failed += 1
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,135 @@
 #!/usr/bin/env python
 
-"""Download the puzzle input for given year and day"""
+"""Download the puzzle inputs for a year and one or more days"""
 import argparse
+import concurrent.futures
+import os
+import pathlib
+import sys
+import threading
+import time
 
 import requests
 
-INPUT_URL = "https://adventofcode.com/{year}/day/{day}/input"
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+BASE_URL = "https://adventofcode.com"
+INPUT_URL = "{base}/{year}/day/{day}/input"
+USER_AGENT = "github.com/r-rathi/advent-of-code bin/getinput.py"
 
 
-def download(url, file, cookie):
-    response = requests.get(url, headers={"Cookie": cookie})
+class RateLimiter:
+    """Spaces out the starts of requests by at least `delay` seconds"""
 
-    if response.status_code == 200:
-        with open(file, "w") as f:
-            f.write(response.text)
-    else:
-        print(f"Failed to download file: {response.status_code}")
+    def __init__(self, delay):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.delay
+        time.sleep(start - now)
+
+
+def parse_days(spec):
+    """Days in a spec like "1-25" or "1,3,5-7" """
+    days = set()
+    for item in spec.split(","):
+        first, _, last = item.partition("-")
+        days.update(range(int(first), int(last or first) + 1))
+    if not days or min(days) < 1 or max(days) > 25:
+        raise argparse.ArgumentTypeError(f"days must be within 1-25: {spec}")
+    return sorted(days)
+
+
+def download(session, url, file, limiter=None, force=False):
+    """Download url to file (atomically) and return what happened"""
+    if file.exists() and file.stat().st_size and not force:
+        return "exists"
+    if limiter:
+        limiter.wait()
+
+    response = session.get(url, timeout=30)
+    if response.status_code != 200:
+        return f"failed: {response.status_code}"
+
+    if file.exists() and file.read_text() == response.text:
+        return "unchanged"
+    file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = file.with_suffix(".tmp")
+    tmp.write_text(response.text)
+    tmp.replace(file)
+    return "downloaded"
 
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Download the input for an Advent of Code puzzle"
+        description="Download the inputs for Advent of Code puzzles"
+    )
+    parser.add_argument(
+        "-c", "--session-cookie", default=os.environ.get("AOC_COOKIE"),
+        help="session cookie (default: $AOC_COOKIE)",
     )
-    parser.add_argument("-c", "--session-cookie", required=True)
     parser.add_argument("-y", "--year", type=int, required=True)
-    parser.add_argument("-d", "--day", type=int, required=True)
-    parser.add_argument("-f", "--file", required=True)
+    day = parser.add_mutually_exclusive_group(required=True)
+    day.add_argument("-d", "--day", type=int)
+    day.add_argument("--days", type=parse_days, help='days to download, e.g. "1-25"')
+    parser.add_argument(
+        "-f", "--file",
+        help="output file for a single --day (default: YEAR/dayNN/input.txt)",
+    )
+    parser.add_argument("--force", action="store_true", help="download existing inputs again")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=4, help="concurrent downloads (default: 4)"
+    )
+    parser.add_argument(
+        "--delay", type=float, default=1.0,
+        help="minimum seconds between requests (default: 1.0)",
+    )
+    parser.add_argument("--base-url", default=BASE_URL, help=f"server (default: {BASE_URL})")
 
     args = parser.parse_args()
+    if not args.session_cookie:
+        parser.error("no session cookie: pass -c or set AOC_COOKIE")
+    if args.file and args.days:
+        parser.error("-f only works with a single --day")
+
+    days = args.days or [args.day]
+    files = {
+        day: pathlib.Path(args.file) if args.file
+        else ROOT / str(args.year) / f"day{day:02d}" / "input.txt"
+        for day in days
+    }
+
+    session = requests.Session()
+    session.headers.update({"Cookie": "session=" + args.session_cookie, "User-Agent": USER_AGENT})
+    limiter = RateLimiter(args.delay)
 
-    url = INPUT_URL.format(year=args.year, day=args.day)
-    cookie = "session=" + args.session_cookie
+    failed = 0
+    with session, concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(
+                download,
+                session,
+                INPUT_URL.format(base=args.base_url.rstrip("/"), year=args.year, day=day),
+                files[day],
+                limiter,
+                args.force,
+            ): day
+            for day in days
+        }
+        for future in concurrent.futures.as_completed(futures):
+            day = futures[future]
+            try:
+                status = future.result()
+            except requests.RequestException as e:
+                status = f"failed: {e}"
+            failed += status.startswith("failed")
+            print(f"{args.year} day {day:2d}: {status} ({files[day]})")
 
-    download(url=url, file=args.file, cookie=cookie)
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == "__main__":
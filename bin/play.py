@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+"""Replay a screen capture (see aoc.screen.capture)"""
+import argparse
+
+from aoc.screen import Recording, Screen
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a screen capture of a -c run")
+    parser.add_argument("file", help="capture file")
+    parser.add_argument("--fps", type=float, default=30, help="frames per second (default: 30)")
+    parser.add_argument("-s", "--start", type=int, default=0, help="first frame (default: 0)")
+    parser.add_argument("-e", "--end", type=int, help="last frame (default: the last)")
+    parser.add_argument("--step", type=int, default=1, help="show every STEP-th frame")
+    parser.add_argument("--info", action="store_true", help="only print the number of frames")
+    args = parser.parse_args()
+
+    recording = Recording(args.file)
+    if args.info:
+        print(f"{len(recording)} frames, {len(recording.cells)} distinct cells")
+        return
+
+    stop = None if args.end is None else args.end + 1
+    screen = Screen(fps=args.fps)
+    try:
+        for n, rows in recording.frames(args.start, stop, args.step):
+            screen.draw(rows, header=f"frame {n} of {len(recording)}")
+    except KeyboardInterrupt:
+        pass
+    screen.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""Run solutions in a warm interpreter and report per-part wall time"""
+import argparse
+import itertools
+import pathlib
+import sys
+import time
+
+from aoc import cache, profiler, runner
+
+
+def report(result, verbose=False, memory=False, counts=False):
+    name = result.solution.name
+    if verbose:
+        print(result.output, end="")
+    cached = " (cached)" if result.cached else ""
+    for part in result.parts:
+        first, *rest = part.answer.split("\n")
+        print(f"{name:<14} {part.label:<12} {first:<20} {runner.format_seconds(part.seconds)}{cached}")
+        for line in rest:
+            print(f"{'':<27} {line}")
+        if memory:
+            print(f"{'':<27} peak rss {runner.format_bytes(part.rss)}, traced {runner.format_bytes(part.memory)}")
+            for site, size in part.sites or []:
+                print(f"{'':<27}   {runner.format_bytes(size):>10}  {site}")
+        if counts:
+            for name, value in (part.counters or {}).items():
+                print(f"{'':<27} {runner.format_count(value):>10}  {name}")
+        name = ""
+
+
+def report_imports(solutions):
+    """Print the start-up (import) cost of each solution, heaviest modules first"""
+    total = 0.0
+    for solution in solutions:
+        seconds, modules = runner.import_times(solution)
+        total += seconds
+        heaviest = ", ".join(
+            f"{module} {runner.format_seconds(t).strip()}" for module, t in modules[:3]
+        )
+        print(f"{solution.name:<14} imports {runner.format_seconds(seconds)}  {heaviest}")
+    print(f"{len(solutions)} solutions, {runner.format_seconds(total).strip()} total import time")
+
+
+def run_one(solution, make_profiler=None, memory_sites=False, counting=False):
+    try:
+        return runner.run(
+            solution,
+            memory_sites=memory_sites,
+            profiler=make_profiler and make_profiler(solution),
+            counting=counting,
+        )
+    except (Exception, SystemExit) as e:
+        return e
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run Advent of Code solutions in-process and time each part"
+    )
+    parser.add_argument("-y", "--year", type=int, nargs="*", help="years to run")
+    parser.add_argument("-d", "--day", type=int, nargs="*", help="days to run")
+    parser.add_argument(
+        "-j", "--jobs", type=int, nargs="?", const=0,
+        help="run in parallel on JOBS processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--profile", type=pathlib.Path, nargs="?", const=profiler.PROFILES_DIR,
+        help="save per-part pstats and collapsed stacks under PROFILE/YEAR/dayNN/vN "
+             "(default: .cache/profiles)",
+    )
+    parser.add_argument(
+        "--import-time", action="store_true",
+        help="instead of running, report the import time of each solution (-X importtime)",
+    )
+    parser.add_argument(
+        "-m", "--memory", action="store_true",
+        help="trace memory and show the peak RSS, tracemalloc peak and top "
+             "allocation sites of each part (much slower)",
+    )
+    parser.add_argument(
+        "-c", "--counters", action="store_true",
+        help="show the counters and timers (aoc.counters) of every part",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="re-run solutions even if their source and input are unchanged",
+    )
+    parser.add_argument("-v", action="store_true", help="verbose (show solution output)")
+
+    args = parser.parse_args()
+
+    solutions = runner.discover(years=args.year, days=args.day)
+    if not solutions:
+        parser.error("no solutions found")
+
+    if args.import_time:
+        report_imports(solutions)
+        return
+
+    profile = None
+    if args.profile:
+        profile = lambda s: profiler.PartProfiler(profiler.profile_dir(s, args.profile))
+
+    start_time = time.perf_counter()
+
+    # Profiling, tracing and counting need a real run
+    hits = []
+    if not (args.no_cache or args.profile or args.memory or args.counters):
+        hits = [result for solution in solutions if (result := cache.get(solution))]
+    cached = {result.solution for result in hits}
+    misses = [solution for solution in solutions if solution not in cached]
+
+    if args.jobs is None:
+        outcomes = (
+            (solution, run_one(solution, profile, args.memory, args.counters))
+            for solution in misses
+        )
+    else:
+        outcomes = runner.run_parallel(
+            misses, jobs=args.jobs or None, make_profiler=profile, memory_sites=args.memory,
+            counting=args.counters,
+        )
+    outcomes = itertools.chain(((result.solution, result) for result in hits), outcomes)
+
+    failed = 0
+    results = []
+    for solution, outcome in outcomes:
+        if isinstance(outcome, runner.Result):
+            report(outcome, verbose=args.v, memory=args.memory, counts=args.counters)
+            results.append(outcome)
+            if not outcome.cached:
+                cache.put(outcome)
+        else:
+            print(f"{solution.name:<14} failed: {outcome!r}")
+            failed += 1
+
+    wall = time.perf_counter() - start_time
+
+    runner.save_timings(results)
+    total = sum(result.seconds for result in results)
+    print(f"{len(solutions)} solutions, {failed} failed, {len(hits)} cached,"
+          f" {runner.format_seconds(total).strip()} total"
+          f" ({runner.format_seconds(wall).strip()} wall)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()